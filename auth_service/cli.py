@@ -0,0 +1,240 @@
+import argparse
+import asyncio
+import contextlib
+import csv
+import io
+import json
+import sys
+import time
+
+from datetime import datetime
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+
+from auth_service.core.config import DB_CONFIG
+from auth_service.handlers.social_handler import UPSERT_INSERTS, invalidate_users, user_cache
+from auth_service.models.auth_model import User
+
+# 사용자 일괄 가져오기 / 내보내기 CLI
+## python -m auth_service.cli import-users users.jsonl
+## python -m auth_service.cli export-users users.csv --format csv
+## 파일을 배치 단위로 스트리밍하여 테이블 크기와 관계없이 메모리 사용량 일정
+
+# 가져오기 / 내보내기 컬럼
+IMPORT_COLUMNS = ("email", "name", "social_provider", "social_id")
+EXPORT_COLUMNS = ("id", "email", "name", "social_provider", "social_id", "created_at")
+
+# 필수 컬럼
+REQUIRED_COLUMNS = ("email", "social_provider", "social_id")
+
+FORMATS = ("jsonl", "csv")
+
+# 파일 확장자로 형식 추정 (.csv 이외는 jsonl)
+def detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+# 처리량 출력 (stderr)
+class Progress:
+    def __init__(self, action: str, out: Optional[IO[str]] = None, clock=time.perf_counter):
+        self.action = action
+        self.out = out
+        self.clock = clock
+        self.started = clock()
+        self.rows = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.clock() - self.started
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def add(self, rows: int) -> None:
+        self.rows += rows
+        print(f"{self.action}: {self.rows} rows ({self.rows_per_second:.0f} rows/s)", file=self.out or sys.stderr)
+
+    def done(self) -> None:
+        elapsed = self.clock() - self.started
+        print(f"{self.action} 완료: {self.rows} rows, {elapsed:.2f}s ({self.rows_per_second:.0f} rows/s)", file=self.out or sys.stderr)
+
+## 가져오기
+
+# 파일에서 사용자 행을 하나씩 읽음 (필수 컬럼 누락 시 ValueError)
+def read_users(file: IO[str], fmt: str) -> Iterator[Dict[str, Any]]:
+    rows = csv.DictReader(file) if fmt == "csv" else (json.loads(line) for line in file if line.strip())
+    for line_number, row in enumerate(rows, start=1):
+        missing = [column for column in REQUIRED_COLUMNS if row.get(column) in (None, "")]
+        if missing:
+            raise ValueError(f"{line_number}번째 행에 필수 값이 없습니다: {', '.join(missing)}")
+        yield {
+            "email": row["email"],
+            "name": row.get("name") or None,
+            "social_provider": row["social_provider"],
+            "social_id": str(row["social_id"]),
+        }
+
+# batch_size개씩 묶음
+def batched(rows: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+# 같은 배치 안의 같은 소셜 계정은 마지막 행만 사용 (한 구문에서 같은 행을 두 번 갱신할 수 없음)
+def _dedupe(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return list({(row["social_provider"], row["social_id"]): row for row in batch}.values())
+
+# 배치 upsert (executemany) - 이미 있는 소셜 계정은 이메일 / 이름 갱신
+def _upsert_batch(conn: Connection, batch: List[Dict[str, Any]]) -> None:
+    insert = UPSERT_INSERTS.get(conn.dialect.name)
+    if insert is None:
+        conn.execute(User.__table__.insert(), batch)
+        return
+
+    stmt = insert(User)
+    conn.execute(stmt.on_conflict_do_update(
+        index_elements=[User.social_provider, User.social_id],
+        set_={"email": stmt.excluded.email, "name": stmt.excluded.name}
+    ), batch)
+
+# Postgres(psycopg2) 배치 COPY - 임시 테이블에 COPY 후 한 번의 INSERT ... SELECT로 upsert
+def _copy_batch(conn: Connection, batch: List[Dict[str, Any]]) -> None:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([row[column] for column in IMPORT_COLUMNS] for row in batch)
+    buffer.seek(0)
+
+    columns = ", ".join(IMPORT_COLUMNS)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS users_import "
+            "(email varchar, name varchar, social_provider varchar, social_id varchar) ON COMMIT DELETE ROWS"
+        )
+        cursor.copy_expert(f"COPY users_import ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        cursor.execute(
+            f"INSERT INTO users ({columns}) SELECT {columns} FROM users_import "
+            "ON CONFLICT (social_provider, social_id) DO UPDATE SET email = EXCLUDED.email, name = EXCLUDED.name"
+        )
+    finally:
+        cursor.close()
+
+# COPY 사용 가능 여부 (Postgres + psycopg2)
+def _supports_copy(conn: Connection) -> bool:
+    return conn.dialect.name == "postgresql" and conn.dialect.driver == "psycopg2"
+
+# 사용자 가져오기 - 배치마다 commit
+## invalidate: commit한 배치의 (social_provider, social_id) 목록을 받아 사용자 캐시에서 제거
+def import_users(conn: Connection, rows: Iterable[Dict[str, Any]], batch_size: int,
+                 progress: Optional[Progress] = None, use_copy: Optional[bool] = None,
+                 invalidate: Optional[Callable[[List[Tuple[str, str]]], None]] = None) -> int:
+    if use_copy is None:
+        use_copy = _supports_copy(conn)
+    write_batch = _copy_batch if use_copy else _upsert_batch
+
+    total = 0
+    for batch in batched(rows, batch_size):
+        batch = _dedupe(batch)
+        with conn.begin():
+            write_batch(conn, batch)
+        if invalidate is not None:
+            invalidate([(row["social_provider"], row["social_id"]) for row in batch])
+        total += len(batch)
+        if progress is not None:
+            progress.add(len(batch))
+    return total
+
+## 내보내기
+
+def _export_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+# 사용자 내보내기 - 서버 측 커서로 batch_size개씩 가져와서 바로 기록
+def export_users(conn: Connection, file: IO[str], fmt: str, batch_size: int,
+                 progress: Optional[Progress] = None) -> int:
+    columns = [getattr(User, column) for column in EXPORT_COLUMNS]
+    result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+        select(*columns).order_by(User.id)
+    )
+
+    writer = None
+    if fmt == "csv":
+        writer = csv.writer(file)
+        writer.writerow(EXPORT_COLUMNS)
+
+    total = 0
+    for partition in result.partitions():
+        if writer is not None:
+            writer.writerows([_export_value(value) for value in row] for row in partition)
+        else:
+            file.writelines(
+                json.dumps(dict(zip(EXPORT_COLUMNS, map(_export_value, row))), ensure_ascii=False) + "\n"
+                for row in partition
+            )
+        total += len(partition)
+        if progress is not None:
+            progress.add(len(partition))
+    return total
+
+## 진입점
+
+# 파일 열기 (- 이면 표준 입출력, 닫지 않음)
+def _open(path: str, mode: str):
+    if path == "-":
+        return contextlib.nullcontext(sys.stdin if mode == "r" else sys.stdout)
+    return open(path, mode, newline="", encoding="utf-8")
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="auth-service", description="Auth service 관리 명령")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (("import-users", "JSONL / CSV 파일에서 사용자 가져오기"),
+                            ("export-users", "사용자를 JSONL / CSV 파일로 내보내기")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("path", help="파일 경로 (- 이면 표준 입출력)")
+        command.add_argument("--format", choices=FORMATS, help="파일 형식 (기본: 확장자로 추정, .csv 이외는 jsonl)")
+        command.add_argument("--batch-size", type=int, default=1000, help="배치 크기 (기본: 1000)")
+        command.add_argument("--url", default=None, help="DB URL (기본: DATABASE_URL, 동기 드라이버)")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    fmt = detect_format(args.path, args.format)
+    engine = create_engine(args.url or DB_CONFIG["postgresql"]["sqlalchemy_url"])
+
+    try:
+        with engine.connect() as conn:
+            if args.command == "import-users":
+                progress = Progress("import")
+                # 갱신된 계정이 로그인 시 이전 이메일 / 이름으로 발급되지 않도록 공유(redis) 사용자 캐시에서 제거
+                ## memory 캐시는 서버 워커 안에 있어 CLI에서 제거할 수 없으므로 USER_CACHE_TTL_SECONDS 안에 반영됨
+                with _open(args.path, "r") as file, asyncio.Runner() as runner:
+                    invalidate = None
+                    if user_cache is not None and user_cache.backend != "memory":
+                        invalidate = lambda keys: runner.run(invalidate_users(keys))
+                    import_users(conn, read_users(file, fmt), args.batch_size, progress, invalidate=invalidate)
+            else:
+                progress = Progress("export")
+                with _open(args.path, "w") as file:
+                    export_users(conn, file, fmt, args.batch_size, progress)
+        progress.done()
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    except IntegrityError as e:
+        # 다른 소셜 계정이 이미 사용 중인 이메일 (이메일당 사용자 하나) - 실패한 배치는 반영되지 않음
+        print(f"error: 이미 다른 소셜 계정이 사용 중인 이메일이 있어 중단했습니다. ({progress.rows} rows 반영됨)\n{e.orig}",
+              file=sys.stderr)
+        return 1
+    finally:
+        engine.dispose()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +0,0 @@
-from .config import *
-from .database import *
\ No newline at end of file
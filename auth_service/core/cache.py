@@ -0,0 +1,74 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# 크기 제한(LRU)과 항목별 만료 시간(TTL)을 가진 인메모리 캐시
+## 만료된 항목은 조회 시점에 지연 삭제하고, 가득 차면 가장 오래 사용되지 않은 항목부터 제거
+class TTLCache:
+    def __init__(self, max_size: int, ttl_seconds: float, clock: Callable[[], float] = time.time):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 캐시 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # 캐시 조회 - 없거나 만료된 경우 default 반환
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    # 캐시 저장 - expires_at(epoch 초)이 주어지면 TTL과 비교해 더 이른 시점에 만료
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        ttl_expires_at = self.clock() + self.ttl_seconds
+        if expires_at is None or expires_at > ttl_expires_at:
+            expires_at = ttl_expires_at
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    # 캐시 항목 삭제
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # 캐시 통계 조회
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
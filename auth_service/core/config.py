@@ -1,39 +1,312 @@
 import os
 
-from datetime import datetime, timedelta
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple
 
-# Test 환경 확인
-IS_TEST_ENV = os.getenv("TEST_ENV", "0")
+# 설정
+## 환경변수는 시작 시 한 번만 읽어 타입을 검증한 뒤 변경할 수 없는(frozen) 설정 객체로 만듦
+## 잘못된 값(숫자가 아닌 포트 등)은 import 시점에 ValidationError로 실패
+## 필드의 alias가 환경변수 이름이며, 기존 dict 설정처럼 config["key"] / config.get("key") / {**config}로도 조회 가능
+
+# 설정 섹션 공통
+class ConfigSection(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    # 환경변수에서 생성 (alias가 있는 필드만 읽음)
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "ConfigSection":
+        return cls.model_validate({
+            field.alias: env[field.alias]
+            for field in cls.model_fields.values() if field.alias and field.alias in env
+        })
+
+    def keys(self) -> List[str]:
+        return [*type(self).model_fields, *type(self).model_computed_fields]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.keys()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.keys() else default
 
 # DB 설정
-DB_CONFIG = {
-    "postgresql": {
-        "driver": "postgresql",
-        "sqlalchemy_url": os.getenv("DATABASE_URL") if not IS_TEST_ENV else os.getenv("TEST_DATABASE_URL", "sqlite:///./test.db"),
-        "user": os.getenv("POSTGRES_USER"),
-        "password": os.getenv("POSTGRES_PASSWORD"),
-        "host": os.getenv("POSTGRES_HOST"),
-        "port": os.getenv("POSTGRES_PORT"),
-        "database": os.getenv("POSTGRES_DB"),
-    },
-}
+class PostgresSettings(ConfigSection):
+    driver: str = "postgresql"
+    # 테스트 환경(TEST_ENV=1)이면 TEST_DATABASE_URL 사용
+    test_env: bool = Field(False, alias="TEST_ENV")
+    database_url: str = Field("sqlite:///./auth.db", alias="DATABASE_URL")
+    test_database_url: str = Field("sqlite:///./test.db", alias="TEST_DATABASE_URL")
+    user: Optional[str] = Field(None, alias="POSTGRES_USER")
+    password: Optional[str] = Field(None, alias="POSTGRES_PASSWORD")
+    host: Optional[str] = Field(None, alias="POSTGRES_HOST")
+    port: Optional[int] = Field(None, alias="POSTGRES_PORT")
+    database: Optional[str] = Field(None, alias="POSTGRES_DB")
+    # 비동기 엔진(AsyncEngine/AsyncSession) 사용 여부 - "0"이면 동기 Session 사용
+    async_mode: bool = Field(True, alias="DB_ASYNC_MODE")
+    # 비동기 드라이버 URL (미설정 시 sqlalchemy_url에서 자동 변환)
+    async_sqlalchemy_url: Optional[str] = Field(None, alias="ASYNC_DATABASE_URL")
+    # 커넥션 풀 설정 (동기/비동기 엔진 각각 적용)
+    pool_size: int = Field(10, alias="DB_POOL_SIZE", ge=1)
+    max_overflow: int = Field(20, alias="DB_MAX_OVERFLOW", ge=0)
+    # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간 (초)
+    pool_timeout: float = Field(10, alias="DB_POOL_TIMEOUT", gt=0)
+    # 커넥션 재생성 주기 (초, -1이면 재생성하지 않음)
+    pool_recycle: int = Field(1800, alias="DB_POOL_RECYCLE")
+    # checkout 시 커넥션 유효성 확인 (끊어진 커넥션 재연결)
+    pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
+    # 외부 커넥션 풀러(PgBouncer 등) 사용 시 "1" - 앱 내부 풀을 사용하지 않음 (NullPool)
+    external_pooler: bool = Field(False, alias="DB_EXTERNAL_POOLER")
+
+    @computed_field
+    @property
+    def sqlalchemy_url(self) -> str:
+        return self.test_database_url if self.test_env else self.database_url
+
+class DatabaseSettings(ConfigSection):
+    postgresql: PostgresSettings
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "DatabaseSettings":
+        return cls(postgresql=PostgresSettings.from_env(env))
 
 # JWT 토큰 설정
-JWT_CONFIG = {
-    "secret_key": os.getenv("SECRET_KEY"),
-    "algorithm": "HS256",
-    "access_token_expire_minutes": os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 15),
-    "refresh_token_expire_days": os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7),
-    "access_token_type": os.getenv("ACCESS_TOKEN_TYPE", "bearer"),
-    "refresh_token_type": os.getenv("REFRESH_TOKEN_TYPE", "bearer"),
+class JWTSettings(ConfigSection):
+    secret_key: Optional[str] = Field(None, alias="SECRET_KEY")
+    # HS256/384/512 (SECRET_KEY) 또는 RS256/384/512, ES256/384/512, EdDSA (개인키)
+    algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
+    private_key: Optional[str] = Field(None, alias="JWT_PRIVATE_KEY")
+    private_key_path: Optional[str] = Field(None, alias="JWT_PRIVATE_KEY_PATH")
+    key_id: Optional[str] = Field(None, alias="JWT_KEY_ID")
+    # 키 교체용 키 링 파일(JSON) 경로 - 설정 시 위의 단일 키 설정 대신 사용
+    keyring_path: Optional[str] = Field(None, alias="JWT_KEYRING_PATH")
+    # JWT 인코딩/디코딩 백엔드: jose, pyjwt, authlib, fast-hmac (HS* 전용, 그 외 알고리즘은 jose 사용)
+    backend: str = Field("fast-hmac", alias="JWT_BACKEND")
+    # 발급 토큰에 포함할 iss / aud 클레임 (미설정 시 생략)
+    issuer: Optional[str] = Field(None, alias="JWT_ISSUER")
+    audience: Optional[str] = Field(None, alias="JWT_AUDIENCE")
+    # JWKS 응답 Cache-Control max-age (초)
+    jwks_max_age: int = Field(300, alias="JWKS_MAX_AGE", ge=0)
+    access_token_expire_minutes: int = Field(15, alias="ACCESS_TOKEN_EXPIRE_MINUTES", gt=0)
+    refresh_token_expire_days: int = Field(7, alias="REFRESH_TOKEN_EXPIRE_DAYS", gt=0)
+    # 토큰 종류 (token_type 클레임) - access token을 refresh token으로 사용할 수 없도록 서로 달라야 함
+    access_token_type: str = Field("bearer", alias="ACCESS_TOKEN_TYPE")
+    refresh_token_type: str = Field("refresh", alias="REFRESH_TOKEN_TYPE")
+    # 토큰 검증(introspection) 요청 1회당 최대 토큰 수
+    introspect_max_tokens: int = Field(100, alias="INTROSPECT_MAX_TOKENS", gt=0)
+
+    @model_validator(mode="after")
+    def check_token_types(self) -> "JWTSettings":
+        if self.access_token_type == self.refresh_token_type:
+            raise ValueError("ACCESS_TOKEN_TYPE과 REFRESH_TOKEN_TYPE은 서로 달라야 합니다.")
+        return self
+
+# 검증된 access token 캐시 설정
+class TokenCacheSettings(ConfigSection):
+    enabled: bool = Field(True, alias="TOKEN_CACHE_ENABLED")
+    max_size: int = Field(10000, alias="TOKEN_CACHE_MAX_SIZE", gt=0)
+    ttl_seconds: int = Field(900, alias="TOKEN_CACHE_TTL_SECONDS", gt=0)
+
+# 소셜 계정 사용자 캐시 설정 (로그인 시 사용자 조회/갱신 DB 왕복 생략)
+class UserCacheSettings(ConfigSection):
+    # memory(워커 단위) / redis(워커 간 공유, redis 패키지 필요) / none(사용 안 함)
+    backend: Literal["memory", "redis", "none"] = Field("memory", alias="USER_CACHE_BACKEND")
+    max_size: int = Field(10000, alias="USER_CACHE_MAX_SIZE", gt=0)
+    # 다른 워커에서 갱신된 정보가 반영되기까지의 최대 시간 (memory 백엔드)
+    ttl_seconds: int = Field(300, alias="USER_CACHE_TTL_SECONDS", gt=0)
+    redis_url: str = Field("redis://localhost:6379/0", alias="USER_CACHE_REDIS_URL")
+
+# 요청 제한(rate limit) 규칙 - token bucket
+## burst: 한 번에 허용하는 최대 요청 수, per_minute: 분당 회복되는 요청 수
+class RateLimitRule(ConfigSection):
+    burst: int = Field(gt=0)
+    per_minute: float = Field(gt=0)
+
+# 규칙별 기본값 (burst, per_minute) - RATE_LIMIT_<규칙>_BURST / RATE_LIMIT_<규칙>_PER_MINUTE 로 변경
+RATE_LIMIT_RULE_DEFAULTS: Dict[str, Tuple[int, float]] = {
+    # 소셜 로그인 - 클라이언트 IP별
+    "login_ip": (10, 10),
+    # 토큰 갱신 - 클라이언트 IP별 (NAT 뒤의 여러 사용자를 고려해 여유 있게)
+    "refresh_ip": (120, 120),
+    # 토큰 갱신 - 로그인 세션(refresh token family)별
+    "refresh_subject": (5, 6),
 }
 
+# 요청 제한 설정
+class RateLimitSettings(ConfigSection):
+    # memory(워커 단위) / redis(워커 간 공유, redis 패키지 필요) / none(사용 안 함)
+    backend: Literal["memory", "redis", "none"] = Field("memory", alias="RATE_LIMIT_BACKEND")
+    # memory 백엔드가 유지하는 최대 키 수 (초과 시 가장 오래 사용되지 않은 키부터 제거)
+    max_keys: int = Field(100000, alias="RATE_LIMIT_MAX_KEYS", gt=0)
+    redis_url: str = Field("redis://localhost:6379/0", alias="RATE_LIMIT_REDIS_URL")
+    rules: Dict[str, RateLimitRule] = {}
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "RateLimitSettings":
+        rules = {
+            name: RateLimitRule(
+                burst=env.get(f"RATE_LIMIT_{name.upper()}_BURST", burst),
+                per_minute=env.get(f"RATE_LIMIT_{name.upper()}_PER_MINUTE", per_minute),
+            )
+            for name, (burst, per_minute) in RATE_LIMIT_RULE_DEFAULTS.items()
+        }
+        return super().from_env(env).model_copy(update={"rules": rules})
+
+# 토큰 폐기/교체 이력 저장소 설정
+class TokenStoreSettings(ConfigSection):
+    # memory(워커 단위) 또는 database(token_revocations 테이블, 워커 간 공유)
+    backend: Literal["memory", "database"] = Field("memory", alias="TOKEN_STORE_BACKEND")
+    # 만료 항목 정리 주기 (초)
+    compaction_interval_seconds: int = Field(300, alias="TOKEN_STORE_COMPACTION_INTERVAL_SECONDS", gt=0)
+    # 폐기된 access token jti Bloom filter 설정
+    filter_capacity: int = Field(100000, alias="REVOCATION_FILTER_CAPACITY", gt=0)
+    filter_error_rate: float = Field(0.001, alias="REVOCATION_FILTER_ERROR_RATE", gt=0, lt=1)
+    # 예상 거짓 양성 비율이 이 값을 넘으면 filter 재생성
+    filter_max_false_positive_rate: float = Field(0.01, alias="REVOCATION_FILTER_MAX_FALSE_POSITIVE_RATE", gt=0, lt=1)
+    # 다른 워커의 폐기 항목 동기화 주기 (초, database 저장소 사용 시)
+    filter_sync_interval_seconds: int = Field(30, alias="REVOCATION_FILTER_SYNC_INTERVAL_SECONDS", gt=0)
+
 # Google OAuth 설정
-OAUTH_GOOGLE_CONFIG = {
-    "client_id": os.getenv("GOOGLE_CLIENT_ID", ""),
-    "client_secret": os.getenv("GOOGLE_CLIENT_SECRET", ""),
-    "redirect_uri": os.getenv("GOOGLE_REDIRECT_URI", ""),
-    "scope": "openid email profile"
-}
+class GoogleOAuthSettings(ConfigSection):
+    client_id: str = Field("", alias="GOOGLE_CLIENT_ID")
+    client_secret: str = Field("", alias="GOOGLE_CLIENT_SECRET")
+    redirect_uri: str = Field("", alias="GOOGLE_REDIRECT_URI")
+    scope: str = "openid email profile"
+    # 인가 코드 교환 / 사용자 정보 조회 엔드포인트
+    token_url: str = Field("https://oauth2.googleapis.com/token", alias="GOOGLE_TOKEN_URL")
+    userinfo_url: str = Field("https://www.googleapis.com/oauth2/v2/userinfo", alias="GOOGLE_USERINFO_URL")
+    # id_token 검증 설정 - 공개키(JWKS) URL / 로컬 JWKS 파일 경로(설정 시 네트워크 조회 안 함) / 허용 발급자
+    jwks_url: str = Field("https://www.googleapis.com/oauth2/v3/certs", alias="GOOGLE_JWKS_URL")
+    jwks_path: Optional[str] = Field(None, alias="GOOGLE_JWKS_PATH")
+    issuers: Tuple[str, ...] = ("https://accounts.google.com", "accounts.google.com")
+
+# Kakao OAuth 설정
+class KakaoOAuthSettings(ConfigSection):
+    client_id: str = Field("", alias="KAKAO_CLIENT_ID")
+    client_secret: str = Field("", alias="KAKAO_CLIENT_SECRET")
+    redirect_uri: str = Field("", alias="KAKAO_REDIRECT_URI")
+    token_url: str = Field("https://kauth.kakao.com/oauth/token", alias="KAKAO_TOKEN_URL")
+    userinfo_url: str = Field("https://kapi.kakao.com/v2/user/me", alias="KAKAO_USERINFO_URL")
+
+# Naver OAuth 설정
+class NaverOAuthSettings(ConfigSection):
+    client_id: str = Field("", alias="NAVER_CLIENT_ID")
+    client_secret: str = Field("", alias="NAVER_CLIENT_SECRET")
+    redirect_uri: str = Field("", alias="NAVER_REDIRECT_URI")
+    token_url: str = Field("https://nid.naver.com/oauth2.0/token", alias="NAVER_TOKEN_URL")
+    userinfo_url: str = Field("https://openapi.naver.com/v1/nid/me", alias="NAVER_USERINFO_URL")
+
+# GitHub OAuth 설정
+class GitHubOAuthSettings(ConfigSection):
+    client_id: str = Field("", alias="GITHUB_CLIENT_ID")
+    client_secret: str = Field("", alias="GITHUB_CLIENT_SECRET")
+    redirect_uri: str = Field("", alias="GITHUB_REDIRECT_URI")
+    token_url: str = Field("https://github.com/login/oauth/access_token", alias="GITHUB_TOKEN_URL")
+    userinfo_url: str = Field("https://api.github.com/user", alias="GITHUB_USERINFO_URL")
+    # 공개 이메일이 없는 계정의 이메일 목록 조회 (user:email scope 필요)
+    emails_url: str = Field("https://api.github.com/user/emails", alias="GITHUB_EMAILS_URL")
+
+# 범용 OpenID Connect provider 설정 (Keycloak, Okta 등)
+## 엔드포인트는 issuer의 discovery 문서(.well-known/openid-configuration)에서 조회하며, *_url을 설정하면 그 값을 우선 사용
+class OIDCOAuthSettings(ConfigSection):
+    client_id: str = Field("", alias="OIDC_CLIENT_ID")
+    client_secret: str = Field("", alias="OIDC_CLIENT_SECRET")
+    redirect_uri: str = Field("", alias="OIDC_REDIRECT_URI")
+    issuer: str = Field("", alias="OIDC_ISSUER")
+    server_metadata_url: Optional[str] = Field(None, alias="OIDC_SERVER_METADATA_URL")
+    token_url: Optional[str] = Field(None, alias="OIDC_TOKEN_URL")
+    userinfo_url: Optional[str] = Field(None, alias="OIDC_USERINFO_URL")
+    jwks_url: Optional[str] = Field(None, alias="OIDC_JWKS_URL")
+    jwks_path: Optional[str] = Field(None, alias="OIDC_JWKS_PATH")
+
+# OAuth provider 메타데이터(discovery 문서 / JWKS) 캐시 설정
+class OAuthMetadataSettings(ConfigSection):
+    # 앱 시작 시 client_id가 설정된 provider의 메타데이터를 미리 조회 - 최대 대기 시간 (초, 초과 시 요청 시 조회)
+    prefetch_timeout: float = Field(5, alias="OAUTH_METADATA_PREFETCH_TIMEOUT", gt=0)
+    # 메타데이터 디스크 스냅샷 경로 - 설정 시 시작할 때 먼저 적재하여 provider가 느려도 캐시된 상태로 시작
+    snapshot_path: Optional[str] = Field(None, alias="OAUTH_METADATA_SNAPSHOT_PATH")
+    # discovery 문서 재조회 / 스냅샷 저장 주기 (초, JWKS는 Cache-Control max-age에 따라 별도 재조회)
+    refresh_interval_seconds: int = Field(3600, alias="OAUTH_METADATA_REFRESH_INTERVAL_SECONDS", gt=0)
+
+# 외부 API(OAuth provider) 호출용 공유 HTTP 클라이언트 설정 (워커당 1개)
+class HTTPClientSettings(ConfigSection):
+    # HTTP/2 사용 여부 (h2 패키지 필요, 미설치 시 HTTP/1.1)
+    http2: bool = Field(True, alias="HTTP_CLIENT_HTTP2")
+    max_connections: int = Field(100, alias="HTTP_CLIENT_MAX_CONNECTIONS", gt=0)
+    max_keepalive_connections: int = Field(20, alias="HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", ge=0)
+    # 유휴 keep-alive 커넥션 유지 시간 (초)
+    keepalive_expiry: float = Field(30, alias="HTTP_CLIENT_KEEPALIVE_EXPIRY", ge=0)
+    # 호출별 타임아웃 (초) - 연결 / 응답 읽기 / 요청 쓰기 / 풀에서 커넥션 대기
+    connect_timeout: float = Field(3, alias="HTTP_CLIENT_CONNECT_TIMEOUT", gt=0)
+    read_timeout: float = Field(5, alias="HTTP_CLIENT_READ_TIMEOUT", gt=0)
+    write_timeout: float = Field(5, alias="HTTP_CLIENT_WRITE_TIMEOUT", gt=0)
+    pool_timeout: float = Field(2, alias="HTTP_CLIENT_POOL_TIMEOUT", gt=0)
+
+# 서버(워커 프로세스) 설정 - python -m auth_service.server
+class ServerSettings(ConfigSection):
+    host: str = Field("0.0.0.0", alias="SERVER_HOST")
+    port: int = Field(8000, alias="SERVER_PORT", gt=0, lt=65536)
+    # 워커 프로세스 수 (0이면 사용 가능한 CPU 수)
+    workers: int = Field(0, alias="SERVER_WORKERS", ge=0)
+    # 수락 대기 중인 연결 큐 크기
+    backlog: int = Field(2048, alias="SERVER_BACKLOG", gt=0)
+    # 유휴 keep-alive 연결 유지 시간 (초) - 로드밸런서의 유휴 타임아웃보다 길게 설정
+    keepalive_timeout: int = Field(75, alias="SERVER_KEEPALIVE_TIMEOUT", gt=0)
+    # 워커당 동시 처리 연결 / 요청 수 상한 (0이면 제한 없음, 초과 시 503)
+    limit_concurrency: int = Field(0, alias="SERVER_LIMIT_CONCURRENCY", ge=0)
+    # 워커가 이 수만큼 요청을 처리하면 재시작 (0이면 재시작하지 않음, 여러 워커가 동시에 재시작하지 않도록 jitter 추가)
+    max_requests: int = Field(0, alias="SERVER_MAX_REQUESTS", ge=0)
+    max_requests_jitter: int = Field(0, alias="SERVER_MAX_REQUESTS_JITTER", ge=0)
+    # 종료 시 처리 중인 요청을 기다리는 시간 (초)
+    graceful_timeout: int = Field(30, alias="SERVER_GRACEFUL_TIMEOUT", ge=0)
+    # 요청별 접근 로그 출력 여부
+    access_log: bool = Field(False, alias="SERVER_ACCESS_LOG")
+    # X-Forwarded-For / X-Forwarded-Proto를 신뢰할 프록시 주소 (쉼표 구분, *이면 모두) - 요청 제한의 클라이언트 IP 판별에 사용
+    forwarded_allow_ips: str = Field("127.0.0.1", alias="SERVER_FORWARDED_ALLOW_IPS")
+
+# 전체 설정
+class Settings(ConfigSection):
+    database: DatabaseSettings
+    jwt: JWTSettings
+    token_cache: TokenCacheSettings
+    user_cache: UserCacheSettings
+    rate_limit: RateLimitSettings
+    token_store: TokenStoreSettings
+    oauth_google: GoogleOAuthSettings
+    oauth_kakao: KakaoOAuthSettings
+    oauth_naver: NaverOAuthSettings
+    oauth_github: GitHubOAuthSettings
+    oauth_oidc: OIDCOAuthSettings
+    oauth_metadata: OAuthMetadataSettings
+    http_client: HTTPClientSettings
+    server: ServerSettings
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "Settings":
+        return cls(**{name: field.annotation.from_env(env) for name, field in cls.model_fields.items()})
+
+# 환경변수에서 설정 생성 (검증 실패 시 pydantic.ValidationError)
+def load_settings(env: Mapping[str, str] = os.environ) -> Settings:
+    return Settings.from_env(env)
 
+settings = load_settings()
 
+# 섹션별 설정 - 필요한 모듈에서 섹션 단위로 import
+DB_CONFIG = settings.database
+JWT_CONFIG = settings.jwt
+TOKEN_CACHE_CONFIG = settings.token_cache
+USER_CACHE_CONFIG = settings.user_cache
+RATE_LIMIT_CONFIG = settings.rate_limit
+TOKEN_STORE_CONFIG = settings.token_store
+OAUTH_GOOGLE_CONFIG = settings.oauth_google
+OAUTH_KAKAO_CONFIG = settings.oauth_kakao
+OAUTH_NAVER_CONFIG = settings.oauth_naver
+OAUTH_GITHUB_CONFIG = settings.oauth_github
+OAUTH_OIDC_CONFIG = settings.oauth_oidc
+OAUTH_METADATA_CONFIG = settings.oauth_metadata
+HTTP_CLIENT_CONFIG = settings.http_client
+SERVER_CONFIG = settings.server
@@ -1,27 +1,146 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import time
+
+from typing import Any, AsyncIterator, Dict, Mapping, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
 from ..core.config import DB_CONFIG
+from ..core.metrics import REGISTRY
+
+# ORM 모델의 베이스 클래스 (모델 / 마이그레이션과 같은 metadata 사용)
+from ..models.auth_model import Base
+
+# 커넥션 풀 메트릭 (pool 라벨: sync / async)
+POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "db_pool_checkout_wait_seconds", "커넥션 checkout 대기 시간 (초)", ("pool",)
+)
+POOL_CHECKOUT_TIMEOUTS = REGISTRY.counter(
+    "db_pool_checkout_timeouts_total", "pool_timeout 초과로 실패한 checkout 수", ("pool",)
+)
+POOL_IN_USE = REGISTRY.gauge("db_pool_connections_in_use", "사용 중인(checkout된) 커넥션 수", ("pool",))
+POOL_OPEN = REGISTRY.gauge("db_pool_connections_open", "열려 있는 DB 커넥션 수", ("pool",))
+POOL_CAPACITY = REGISTRY.gauge("db_pool_capacity", "풀 최대 커넥션 수 (pool_size + max_overflow)", ("pool",))
+
+# checkout 대기 시간 측정 - 풀 라벨은 pool_logging_name 사용 (engine.dispose() 후 재생성된 풀에도 유지)
+class _CheckoutTimingMixin:
+    def connect(self):
+        label = getattr(self, "logging_name", None) or "default"
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=label)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, pool=label)
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+class InstrumentedNullPool(_CheckoutTimingMixin, NullPool):
+    pass
+
+# DB URL과 풀 설정으로 create_engine / create_async_engine 인자 생성
+## external_pooler가 켜져 있으면 커넥션을 PgBouncer 등 외부 풀러에 맡기고 앱 내부 풀은 사용하지 않음 (NullPool)
+def engine_options(url: str, config: Mapping[str, Any], label: str, is_async: bool = False) -> Dict[str, Any]:
+    parsed = make_url(url)
+    options: Dict[str, Any] = {}
+
+    if parsed.get_backend_name() == "sqlite":
+        if not is_async:
+            options["connect_args"] = {"check_same_thread": False}
+        # 인메모리 DB는 커넥션마다 DB가 달라지므로 기본 풀 유지
+        if parsed.database in (None, "", ":memory:"):
+            return options
+
+    options["pool_logging_name"] = label
+    if config["external_pooler"]:
+        options["poolclass"] = InstrumentedNullPool
+        # PgBouncer transaction 모드에서는 서버 측 prepared statement를 재사용할 수 없음
+        if parsed.drivername == "postgresql+asyncpg":
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+
+    options.update({
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": config["pool_size"],
+        "max_overflow": config["max_overflow"],
+        "pool_timeout": config["pool_timeout"],
+        "pool_recycle": config["pool_recycle"],
+        "pool_pre_ping": config["pool_pre_ping"],
+    })
+    return options
+
+# 풀 이벤트로 사용 중 / 열린 커넥션 수 gauge 갱신
+def instrument_engine(engine: Engine, label: str, config: Mapping[str, Any]) -> None:
+    if isinstance(engine.pool, QueuePool):
+        POOL_CAPACITY.set(config["pool_size"] + max(config["max_overflow"], 0), pool=label)
+
+    event.listen(engine, "checkout", lambda *args: POOL_IN_USE.inc(pool=label))
+    event.listen(engine, "checkin", lambda *args: POOL_IN_USE.dec(pool=label))
+    event.listen(engine, "connect", lambda *args: POOL_OPEN.inc(pool=label))
+    event.listen(engine, "close", lambda *args: POOL_OPEN.dec(pool=label))
+    event.listen(engine, "close_detached", lambda *args: POOL_OPEN.dec(pool=label))
 
 # Define the database URL
 ## 환경변수 TEST_ENV가 1일 경우 테스트 DB를 사용하도록 설정
 
 # Create the SQLAlchemy engine
-if 'sqlite' in DB_CONFIG['postgresql']['sqlalchemy_url']:
-    engine = create_engine(DB_CONFIG['postgresql']['sqlalchemy_url'], connect_args={"check_same_thread": False})
-else:
-    engine = create_engine(DB_CONFIG['postgresql']['sqlalchemy_url'])
+engine = create_engine(
+    DB_CONFIG['postgresql']['sqlalchemy_url'],
+    **engine_options(DB_CONFIG['postgresql']['sqlalchemy_url'], DB_CONFIG['postgresql'], "sync")
+)
+instrument_engine(engine, "sync", DB_CONFIG['postgresql'])
 
 # Create the SQLAlchemy session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# ORM 모델의 베이스 클래스
-Base = declarative_base()
+# 동기 드라이버 이름 -> 비동기 드라이버 이름
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+# 동기 DB URL을 비동기 드라이버 URL로 변환
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if parsed.drivername in ASYNC_DRIVERS.values() or backend not in ASYNC_DRIVERS:
+        return url
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+# 비동기 엔진 및 세션 생성
+## DB_ASYNC_MODE가 켜져 있으면 get_db가 AsyncSession을 반환하여 이벤트 루프를 막지 않음
+ASYNC_MODE = DB_CONFIG['postgresql']['async_mode']
+async_engine = None
+AsyncSessionLocal = None
+if ASYNC_MODE:
+    async_url = DB_CONFIG['postgresql']['async_sqlalchemy_url'] or to_async_url(DB_CONFIG['postgresql']['sqlalchemy_url'])
+    async_engine = create_async_engine(
+        async_url,
+        **engine_options(async_url, DB_CONFIG['postgresql'], "async", is_async=True)
+    )
+    instrument_engine(async_engine.sync_engine, "async", DB_CONFIG['postgresql'])
+    # commit 후 속성 재조회(추가 SELECT)를 하지 않도록 expire_on_commit 비활성화
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 # DB 세션을 반환하는 함수
-def get_db():
+async def get_db() -> AsyncIterator[Union[AsyncSession, Session]]:
+    if ASYNC_MODE:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
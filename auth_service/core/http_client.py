@@ -0,0 +1,35 @@
+import logging
+
+import httpx
+
+from typing import Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+# 설정으로부터 호출별 타임아웃 생성
+def http_timeout(config: Mapping[str, Any]) -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=config["connect_timeout"],
+        read=config["read_timeout"],
+        write=config["write_timeout"],
+        pool=config["pool_timeout"],
+    )
+
+# 외부 API 호출용 공유 HTTP 클라이언트 생성 (앱 lifespan에서 워커당 1개 생성 후 재사용)
+## keep-alive 커넥션을 재사용하므로 로그인마다 TCP/TLS handshake를 하지 않음
+## HTTP/2는 h2 패키지가 있을 때만 사용 (없으면 HTTP/1.1 keep-alive)
+def create_http_client(config: Mapping[str, Any]) -> httpx.AsyncClient:
+    http2 = config["http2"]
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 외부 API를 호출합니다. (pip install 'httpx[http2]')")
+            http2 = False
+
+    limits = httpx.Limits(
+        max_connections=config["max_connections"],
+        max_keepalive_connections=config["max_keepalive_connections"],
+        keepalive_expiry=config["keepalive_expiry"],
+    )
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=http_timeout(config))
@@ -0,0 +1,308 @@
+import base64
+import calendar
+import hashlib
+import hmac
+import json
+import time
+
+from datetime import datetime
+from jose import JWTError, jwk as jose_jwk, jwt as jose_jwt
+from typing import Any, Callable, Dict, List, Optional
+
+from auth_service.core.keys import EC_ALGORITHMS, OKP_ALGORITHMS, RSA_ALGORITHMS, SYMMETRIC_ALGORITHMS, SigningKey
+
+# 토큰 디코딩/검증 실패 (서명 불일치, 만료, 형식 오류 등)
+class TokenError(Exception):
+    pass
+
+# 시간 클레임 - datetime이면 epoch 초로 변환
+TIME_CLAIMS = ("exp", "iat", "nbf")
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+def _normalize_claims(claims: Dict[str, Any]) -> Dict[str, Any]:
+    for name in TIME_CLAIMS:
+        value = claims.get(name)
+        if isinstance(value, datetime):
+            claims = {**claims, name: calendar.timegm(value.utctimetuple())}
+    return claims
+
+# 발급자(iss) / 대상(aud) 클레임 검증 - 설정하지 않은 값은 검증하지 않음
+## 라이브러리마다 aud 처리 방식(설정 없이 aud가 있으면 실패 등)이 달라 모든 백엔드에서 같은 함수로 검증
+def validate_issuer_audience(claims: Dict[str, Any], issuer: Optional[str], audience: Optional[str]) -> Dict[str, Any]:
+    if issuer is not None and claims.get("iss") != issuer:
+        raise TokenError("Invalid issuer")
+    if audience is not None:
+        aud = claims.get("aud")
+        if not (aud == audience or (isinstance(aud, list) and audience in aud)):
+            raise TokenError("Invalid audience")
+    return claims
+
+# 서명 검증 없이 토큰 헤더 조회 (kid로 검증 키를 찾기 위해 사용)
+def get_unverified_header(token: str) -> Dict[str, Any]:
+    try:
+        header_segment = token.split(".", 1)[0].encode()
+        header = json.loads(_b64url_decode(header_segment))
+    except (ValueError, UnicodeError) as e:
+        raise TokenError("Invalid header") from e
+    if not isinstance(header, dict):
+        raise TokenError("Invalid header")
+    return header
+
+# 서명 검증 없이 토큰 payload 조회 (검증 전 요청 제한 키 추출 등 - 값을 신뢰하면 안 됨)
+def get_unverified_claims(token: str) -> Dict[str, Any]:
+    try:
+        payload_segment = token.split(".", 2)[1].encode()
+        claims = json.loads(_b64url_decode(payload_segment))
+    except (IndexError, ValueError, UnicodeError) as e:
+        raise TokenError("Invalid payload") from e
+    if not isinstance(claims, dict):
+        raise TokenError("Invalid payload")
+    return claims
+
+# JWT 인코딩/디코딩 백엔드 인터페이스
+## 키 객체 파싱(PEM 등)은 백엔드별로 키마다 한 번만 수행하여 캐시
+class JWTBackend:
+    name = ""
+    algorithms = frozenset()
+
+    def __init__(self):
+        self._prepared: Dict[tuple, Any] = {}
+
+    # 키 준비 결과 캐시 (키 교체 시 새 키는 다른 캐시 키를 가짐)
+    def _prepare(self, key: SigningKey, signing: bool) -> Any:
+        cache_key = (signing, key.algorithm, key.kid, key.signing_key)
+        prepared = self._prepared.get(cache_key)
+        if prepared is None:
+            prepared = self.prepare_key(key, signing)
+            self._prepared[cache_key] = prepared
+        return prepared
+
+    def prepare_key(self, key: SigningKey, signing: bool) -> Any:
+        return key.signing_key if signing else key.verifying_key
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        raise NotImplementedError
+
+    # 키를 고정한 인코딩 함수 (토큰 발급기에서 키마다 한 번 생성하여 재사용)
+    def encoder(self, key: SigningKey) -> Callable[[Dict[str, Any]], str]:
+        return lambda claims: self.encode(claims, key)
+
+    # 서명 / 만료(exp) / 발급자(iss) / 대상(aud) 검증 후 claims 반환 - 실패 시 TokenError
+    def decode(self, token: str, key: SigningKey, issuer: Optional[str] = None,
+               audience: Optional[str] = None) -> Dict[str, Any]:
+        raise NotImplementedError
+
+# python-jose 백엔드 (기본값)
+class JoseBackend(JWTBackend):
+    name = "jose"
+    algorithms = frozenset(SYMMETRIC_ALGORITHMS | RSA_ALGORITHMS | set(EC_ALGORITHMS))
+
+    def prepare_key(self, key: SigningKey, signing: bool) -> Any:
+        return jose_jwk.construct(key.signing_key if signing else key.verifying_key, key.algorithm)
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        return jose_jwt.encode(claims, self._prepare(key, True), algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str, key: SigningKey, issuer: Optional[str] = None,
+               audience: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            claims = jose_jwt.decode(token, self._prepare(key, False), algorithms=[key.algorithm], options={"verify_aud": False})
+        except JWTError as e:
+            raise TokenError(str(e)) from e
+        return validate_issuer_audience(claims, issuer, audience)
+
+# PyJWT 백엔드 (선택 설치)
+class PyJWTBackend(JWTBackend):
+    name = "pyjwt"
+    algorithms = frozenset(SYMMETRIC_ALGORITHMS | RSA_ALGORITHMS | set(EC_ALGORITHMS) | OKP_ALGORITHMS)
+
+    def __init__(self):
+        super().__init__()
+        import jwt
+        self._jwt = jwt
+
+    def prepare_key(self, key: SigningKey, signing: bool) -> Any:
+        if key.is_symmetric:
+            return key.signing_key
+        from cryptography.hazmat.primitives import serialization
+        if signing:
+            return serialization.load_pem_private_key(key.signing_key.encode(), password=None)
+        return serialization.load_pem_public_key(key.verifying_key.encode())
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        return self._jwt.encode(claims, self._prepare(key, True), algorithm=key.algorithm, headers={"kid": key.kid})
+
+    def decode(self, token: str, key: SigningKey, issuer: Optional[str] = None,
+               audience: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            claims = self._jwt.decode(token, self._prepare(key, False), algorithms=[key.algorithm], options={"verify_aud": False})
+        except self._jwt.PyJWTError as e:
+            raise TokenError(str(e)) from e
+        return validate_issuer_audience(claims, issuer, audience)
+
+# authlib jose 백엔드
+class AuthlibBackend(JWTBackend):
+    name = "authlib"
+    algorithms = frozenset(SYMMETRIC_ALGORITHMS | RSA_ALGORITHMS | set(EC_ALGORITHMS) | OKP_ALGORITHMS)
+
+    def __init__(self):
+        super().__init__()
+        from authlib import jose
+        from authlib.jose.errors import JoseError
+        self._jose = jose
+        self._error = JoseError
+        self._jwts: Dict[str, Any] = {}
+
+    # 허용 알고리즘을 키의 알고리즘 하나로 제한한 JsonWebToken
+    def _jwt(self, algorithm: str):
+        instance = self._jwts.get(algorithm)
+        if instance is None:
+            instance = self._jwts[algorithm] = self._jose.JsonWebToken([algorithm])
+        return instance
+
+    def prepare_key(self, key: SigningKey, signing: bool) -> Any:
+        material = key.signing_key if signing else key.verifying_key
+        if key.is_symmetric:
+            return self._jose.JsonWebKey.import_key(material, {"kty": "oct"})
+        return self._jose.JsonWebKey.import_key(material)
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        header = {"alg": key.algorithm, "kid": key.kid}
+        return self._jwt(key.algorithm).encode(header, claims, self._prepare(key, True)).decode()
+
+    def decode(self, token: str, key: SigningKey, issuer: Optional[str] = None,
+               audience: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            claims = self._jwt(key.algorithm).decode(token, self._prepare(key, False))
+            claims.validate()
+        except self._error as e:
+            raise TokenError(str(e)) from e
+        return validate_issuer_audience(dict(claims), issuer, audience)
+
+# HMAC(HS256/384/512) 전용 fast path
+## 키마다 헤더 세그먼트(base64)를 미리 만들어 두고, 발급 시에는 payload 직렬화 + HMAC 한 번만 수행
+## 검증 시 헤더 세그먼트가 미리 만든 값과 같으면 헤더 파싱을 생략
+class FastHMACBackend(JWTBackend):
+    name = "fast-hmac"
+    algorithms = frozenset(SYMMETRIC_ALGORITHMS)
+
+    DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+    # (헤더 세그먼트, HMAC 객체) - HMAC 객체는 copy()로 재사용하여 키 처리 비용 절감
+    def prepare_key(self, key: SigningKey, signing: bool) -> Any:
+        if key.signing_key is None:
+            raise TokenError("Secret key is not configured")
+        header = json.dumps({"alg": key.algorithm, "typ": "JWT", "kid": key.kid}, separators=(",", ":"))
+        mac = hmac.new(key.signing_key.encode(), digestmod=self.DIGESTS[key.algorithm])
+        return _b64url_encode(header.encode()), mac
+
+    def _sign(self, mac: Any, signing_input: bytes) -> bytes:
+        mac = mac.copy()
+        mac.update(signing_input)
+        return _b64url_encode(mac.digest())
+
+    def encode(self, claims: Dict[str, Any], key: SigningKey) -> str:
+        header_segment, mac = self._prepare(key, True)
+        payload_segment = _b64url_encode(json.dumps(_normalize_claims(claims), separators=(",", ":")).encode())
+        signing_input = header_segment + b"." + payload_segment
+        return (signing_input + b"." + self._sign(mac, signing_input)).decode()
+
+    # 헤더 세그먼트와 HMAC 객체를 클로저에 묶어 발급 시 캐시 조회도 생략
+    ## claims의 시간 클레임은 epoch 초(int)여야 함
+    def encoder(self, key: SigningKey) -> Callable[[Dict[str, Any]], str]:
+        header_segment, mac = self._prepare(key, True)
+        prefix = header_segment + b"."
+        dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+        def encode(claims: Dict[str, Any]) -> str:
+            signing_input = prefix + _b64url_encode(dumps(claims).encode())
+            signature = mac.copy()
+            signature.update(signing_input)
+            return (signing_input + b"." + _b64url_encode(signature.digest())).decode()
+
+        return encode
+
+    def decode(self, token: str, key: SigningKey, issuer: Optional[str] = None,
+               audience: Optional[str] = None) -> Dict[str, Any]:
+        header_segment, mac = self._prepare(key, False)
+        try:
+            signing_input, signature = token.encode().rsplit(b".", 1)
+            token_header_segment, payload_segment = signing_input.split(b".")
+        except (ValueError, UnicodeError) as e:
+            raise TokenError("Invalid token format") from e
+
+        # 미리 만든 헤더와 다르면(다른 발급자/라이브러리) 헤더의 alg 확인
+        if token_header_segment != header_segment:
+            if get_unverified_header(token).get("alg") != key.algorithm:
+                raise TokenError("Invalid algorithm")
+
+        if not hmac.compare_digest(self._sign(mac, signing_input), signature):
+            raise TokenError("Signature verification failed")
+
+        try:
+            claims = json.loads(_b64url_decode(payload_segment))
+        except (ValueError, UnicodeError) as e:
+            raise TokenError("Invalid payload") from e
+        if not isinstance(claims, dict):
+            raise TokenError("Invalid payload")
+
+        now = time.time()
+        if "exp" in claims and not (isinstance(claims["exp"], (int, float)) and claims["exp"] >= now):
+            raise TokenError("Signature has expired")
+        if "nbf" in claims and not (isinstance(claims["nbf"], (int, float)) and claims["nbf"] <= now):
+            raise TokenError("The token is not yet valid (nbf)")
+        return validate_issuer_audience(claims, issuer, audience)
+
+# 사용 가능한 백엔드
+BACKENDS = {
+    backend.name: backend
+    for backend in (JoseBackend, PyJWTBackend, AuthlibBackend, FastHMACBackend)
+}
+
+# 설정한 백엔드가 키 알고리즘을 지원하지 않을 때 대신 사용할 백엔드 순서
+FALLBACK_BACKENDS = ("jose", "authlib")
+
+# 설치된 라이브러리 기준으로 사용 가능한 백엔드 이름 목록
+def available_backends() -> List[str]:
+    modules = {"jose": "jose", "pyjwt": "jwt", "authlib": "authlib.jose", "fast-hmac": None}
+    names = []
+    for name, module in modules.items():
+        if module is not None:
+            try:
+                __import__(module)
+            except ImportError:
+                continue
+        names.append(name)
+    return names
+
+# 알고리즘별 백엔드 선택
+## 설정한 백엔드가 알고리즘을 지원하지 않으면(예: jose + EdDSA) FALLBACK_BACKENDS 순서로 선택
+class BackendSelector:
+    def __init__(self, name: str):
+        if name not in BACKENDS:
+            raise ValueError(f"지원하지 않는 JWT 백엔드입니다: {name}")
+        self.name = name
+        self._instances: Dict[str, JWTBackend] = {}
+        self._by_algorithm: Dict[str, JWTBackend] = {}
+
+    def _instance(self, name: str) -> JWTBackend:
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = self._instances[name] = BACKENDS[name]()
+        return instance
+
+    def for_algorithm(self, algorithm: str) -> JWTBackend:
+        backend = self._by_algorithm.get(algorithm)
+        if backend is not None:
+            return backend
+
+        for name in (self.name,) + FALLBACK_BACKENDS:
+            if algorithm in BACKENDS[name].algorithms:
+                backend = self._by_algorithm[algorithm] = self._instance(name)
+                return backend
+        raise TokenError(f"Unsupported algorithm: {algorithm}")
@@ -0,0 +1,204 @@
+import base64
+import hashlib
+import json
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+# 지원하는 서명 알고리즘
+SYMMETRIC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+RSA_ALGORITHMS = {"RS256", "RS384", "RS512"}
+EC_ALGORITHMS = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+OKP_ALGORITHMS = {"EdDSA"}
+
+# EC 곡선 이름 -> JWK crv 값
+EC_CURVE_NAMES = {"secp256r1": "P-256", "secp384r1": "P-384", "secp521r1": "P-521"}
+
+# JWK thumbprint(RFC 7638) 계산에 사용하는 필수 멤버
+JWK_THUMBPRINT_MEMBERS = {"RSA": ("e", "kty", "n"), "EC": ("crv", "kty", "x", "y"), "OKP": ("crv", "kty", "x")}
+
+# 대칭키 사용 시 기본 kid
+DEFAULT_SYMMETRIC_KID = "default"
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def _int_to_b64url(value: int, length: Optional[int] = None) -> str:
+    length = length or (value.bit_length() + 7) // 8
+    return _b64url(value.to_bytes(length, "big"))
+
+# 공개키를 JWK(dict)로 변환
+def public_key_to_jwk(public_key: Any) -> Dict[str, str]:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        numbers = public_key.public_numbers()
+        return {"kty": "RSA", "n": _int_to_b64url(numbers.n), "e": _int_to_b64url(numbers.e)}
+
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        numbers = public_key.public_numbers()
+        length = (public_key.curve.key_size + 7) // 8
+        return {
+            "kty": "EC",
+            "crv": EC_CURVE_NAMES[public_key.curve.name],
+            "x": _int_to_b64url(numbers.x, length),
+            "y": _int_to_b64url(numbers.y, length),
+        }
+
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        raw = public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        return {"kty": "OKP", "crv": "Ed25519", "x": _b64url(raw)}
+
+    raise ValueError(f"지원하지 않는 공개키 형식입니다: {type(public_key).__name__}")
+
+# JWK thumbprint(RFC 7638) 계산 - kid 미지정 시 기본값으로 사용
+def jwk_thumbprint(jwk: Dict[str, str]) -> str:
+    members = {name: jwk[name] for name in JWK_THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True)
+    return _b64url(hashlib.sha256(canonical.encode()).digest())
+
+# 알고리즘과 개인키 형식이 맞는지 확인
+def _check_key_algorithm(private_key: Any, algorithm: str) -> None:
+    if algorithm in RSA_ALGORITHMS and isinstance(private_key, rsa.RSAPrivateKey):
+        return
+    if algorithm in EC_ALGORITHMS and isinstance(private_key, ec.EllipticCurvePrivateKey) \
+            and isinstance(private_key.curve, EC_ALGORITHMS[algorithm]):
+        return
+    if algorithm in OKP_ALGORITHMS and isinstance(private_key, ed25519.Ed25519PrivateKey):
+        return
+    raise ValueError(f"{algorithm} 알고리즘에 사용할 수 없는 개인키입니다.")
+
+# 개발/테스트용 개인키(PEM) 생성
+def generate_private_key_pem(algorithm: str) -> str:
+    if algorithm in RSA_ALGORITHMS:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    elif algorithm in EC_ALGORITHMS:
+        private_key = ec.generate_private_key(EC_ALGORITHMS[algorithm]())
+    elif algorithm in OKP_ALGORITHMS:
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        raise ValueError(f"비대칭 서명 알고리즘이 아닙니다: {algorithm}")
+
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+# 토큰 서명/검증 키
+## 대칭키(HS*)는 signing_key와 verifying_key가 같은 secret이고 public_jwk는 None
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    signing_key: Any
+    verifying_key: Any
+    public_jwk: Optional[Dict[str, str]] = None
+
+    @property
+    def is_symmetric(self) -> bool:
+        return self.algorithm in SYMMETRIC_ALGORITHMS
+
+    # 대칭키 생성
+    @classmethod
+    def from_secret(cls, secret: Optional[str], algorithm: str = "HS256", kid: Optional[str] = None) -> "SigningKey":
+        if algorithm not in SYMMETRIC_ALGORITHMS:
+            raise ValueError(f"대칭 서명 알고리즘이 아닙니다: {algorithm}")
+        return cls(kid=kid or DEFAULT_SYMMETRIC_KID, algorithm=algorithm, signing_key=secret, verifying_key=secret)
+
+    # PEM 개인키로부터 비대칭 키 생성 - 공개키와 JWK는 개인키에서 유도
+    @classmethod
+    def from_private_pem(cls, private_pem: str, algorithm: str, kid: Optional[str] = None) -> "SigningKey":
+        private_key = serialization.load_pem_private_key(private_pem.encode(), password=None)
+        _check_key_algorithm(private_key, algorithm)
+
+        public_key = private_key.public_key()
+        public_pem = public_key.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode()
+
+        jwk = public_key_to_jwk(public_key)
+        kid = kid or jwk_thumbprint(jwk)
+        jwk.update({"kid": kid, "alg": algorithm, "use": "sig"})
+
+        return cls(kid=kid, algorithm=algorithm, signing_key=private_pem, verifying_key=public_pem, public_jwk=jwk)
+
+# 미리 직렬화한 JWKS 응답 (본문 / ETag / Cache-Control)
+@dataclass(frozen=True)
+class JWKSDocument:
+    body: bytes
+    etag: str
+    cache_control: str
+
+    @classmethod
+    def build(cls, jwks: Dict[str, Any], max_age: int) -> "JWKSDocument":
+        body = json.dumps(jwks, separators=(",", ":"), sort_keys=True).encode()
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        return cls(body=body, etag=etag, cache_control=f"public, max-age={max_age}")
+
+# 설정(dict)으로부터 서명 키 생성
+## 대칭키는 secret_key, 비대칭키는 private_key(PEM) 또는 private_key_path 사용
+def load_signing_key(entry: Dict[str, Any], kid: Optional[str] = None) -> SigningKey:
+    algorithm = entry["algorithm"]
+
+    if algorithm in SYMMETRIC_ALGORITHMS:
+        return SigningKey.from_secret(entry.get("secret_key"), algorithm, kid)
+
+    private_pem = entry.get("private_key")
+    if not private_pem and entry.get("private_key_path"):
+        with open(entry["private_key_path"]) as key_file:
+            private_pem = key_file.read()
+    if not private_pem:
+        raise ValueError(f"{algorithm} 서명에는 JWT_PRIVATE_KEY 또는 JWT_PRIVATE_KEY_PATH 설정이 필요합니다.")
+    return SigningKey.from_private_pem(private_pem, algorithm, kid)
+
+# 서명 키 링 (active 키 + 이전 키)
+## 토큰 발급은 active 키로 하고, 검증은 토큰 헤더의 kid로 키를 O(1) 조회
+## 이전 키를 유지하므로 키를 교체해도 기존에 발급된 토큰은 만료 전까지 계속 검증 가능
+## 공개키는 JWKS로 배포하여 다른 서비스가 직접 검증하도록 함
+@dataclass
+class KeyRegistry:
+    active: SigningKey
+    keys: Dict[str, SigningKey] = field(default_factory=dict)
+    jwks_max_age: int = 300
+
+    def __post_init__(self):
+        self.keys.setdefault(self.active.kid, self.active)
+        self.jwks_document = JWKSDocument.build(self.jwks(), self.jwks_max_age)
+
+    # kid로 키 조회
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        return self.keys.get(kid)
+
+    # 공개키 목록(JWKS) - 대칭키는 포함하지 않음
+    def jwks(self) -> Dict[str, Any]:
+        return {"keys": [key.public_jwk for key in self.keys.values() if key.public_jwk is not None]}
+
+    # 키 링 파일(JSON)로부터 생성
+    ## {"active": "<kid>", "keys": [{"kid": "<kid>", "algorithm": "RS256", "private_key_path": "..."}, ...]}
+    @classmethod
+    def from_keyring_file(cls, path: str, jwks_max_age: int = 300) -> "KeyRegistry":
+        with open(path) as keyring_file:
+            keyring = json.load(keyring_file)
+
+        keys = {}
+        for entry in keyring["keys"]:
+            key = load_signing_key(entry, entry["kid"])
+            keys[key.kid] = key
+
+        if keyring["active"] not in keys:
+            raise ValueError(f"키 링에 active 키({keyring['active']})가 없습니다.")
+
+        return cls(active=keys[keyring["active"]], keys=keys, jwks_max_age=jwks_max_age)
+
+    # JWT_CONFIG로부터 생성 - keyring_path가 있으면 키 링 파일, 없으면 단일 키 사용
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "KeyRegistry":
+        jwks_max_age = config.get("jwks_max_age", 300)
+        if config.get("keyring_path"):
+            return cls.from_keyring_file(config["keyring_path"], jwks_max_age)
+
+        active = load_signing_key(config, config.get("key_id"))
+        return cls(active=active, jwks_max_age=jwks_max_age)
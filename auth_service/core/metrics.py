@@ -0,0 +1,274 @@
+import bisect
+import functools
+import logging
+import re
+import threading
+import time
+
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 프로세스 내 메트릭 (counter / gauge / histogram)
+## 라벨 값 조합별로 값을 저장하며, 라벨 이름은 메트릭 생성 시 고정
+## 기록 시에는 메트릭별 lock 안에서 값 몇 개만 갱신하고, 누적/직렬화는 조회(render) 시점에 수행
+
+logger = logging.getLogger(__name__)
+
+# Prometheus text format Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 histogram 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 메트릭의 라벨은 {self.labelnames} 입니다.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+# 누적 counter
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    # 다른 객체가 직접 누적하는 값 반영 (collector에서 scrape 시점에 복사)
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = value
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(self._key(labels), 0)
+
+# 현재 값 gauge
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(self._key(labels), 0)
+
+# 구간별 분포 histogram
+## 관측 시에는 해당 구간 하나만 증가시키고(bisect), 누적 값은 render 시 계산
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합 -> [구간별 관측 수(+Inf 포함), 합계, 관측 수]
+        self.values: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self.values.get(key)
+            if entry is None:
+                entry = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    # with 블록 실행 시간 기록
+    def time(self, **labels: str) -> "_Timer":
+        return _Timer(self, labels)
+
+    # 관측 수 / 합계 조회
+    def get(self, **labels: str) -> Tuple[int, float]:
+        entry = self.values.get(self._key(labels))
+        if entry is None:
+            return 0, 0.0
+        return entry[2], entry[1]
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+# 라벨 값 escape (Prometheus text format)
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labelnames: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+# 메트릭 하나를 Prometheus text format 줄 목록으로 변환
+def _render_metric(metric: Metric) -> Iterator[str]:
+    yield f"# HELP {metric.name} {metric.documentation}"
+    yield f"# TYPE {metric.name} {metric.kind}"
+
+    with metric._lock:
+        items = [(key, value if metric.kind != "histogram" else [list(value[0]), value[1], value[2]])
+                 for key, value in metric.values.items()]
+
+    for key, value in items:
+        if metric.kind != "histogram":
+            yield f"{metric.name}{_format_labels(metric.labelnames, key)} {_format_value(value)}"
+            continue
+
+        counts, total, count = value
+        cumulative = 0
+        for bound, bucket_count in zip(metric.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            yield f"{metric.name}_bucket{_format_labels(metric.labelnames, key, le)} {cumulative}"
+        yield f"{metric.name}_sum{_format_labels(metric.labelnames, key)} {_format_value(total)}"
+        yield f"{metric.name}_count{_format_labels(metric.labelnames, key)} {count}"
+
+# 메트릭 등록소
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    # 같은 이름으로 다시 등록하면 기존 메트릭 반환 (모듈 재적재 / 엔진 재생성 대비)
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"이미 다른 형식으로 등록된 메트릭입니다: {metric.name}")
+                return existing
+            self.metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Optional[Sequence[float]] = None) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets or DEFAULT_BUCKETS))
+
+    # render 직전에 실행할 collector 등록 (캐시 통계처럼 요청 경로 밖에서 누적되는 값을 메트릭에 복사)
+    def collector(self, func: Callable[[], None]) -> Callable[[], None]:
+        with self._lock:
+            if func not in self.collectors:
+                self.collectors.append(func)
+        return func
+
+    # 등록된 모든 메트릭을 Prometheus text format으로 직렬화
+    ## collector가 실패해도 나머지 메트릭은 직렬화
+    def render(self) -> str:
+        for collect in list(self.collectors):
+            try:
+                collect()
+            except Exception:
+                logger.exception("메트릭 수집 실패: %s", getattr(collect, "__name__", collect))
+
+        lines = []
+        for metric in list(self.metrics.values()):
+            lines.extend(_render_metric(metric))
+        return "\n".join(lines) + "\n"
+
+# 기본 등록소
+REGISTRY = MetricsRegistry()
+
+# HTTP 요청 처리 시간 (route: 경로 템플릿, 예: /auth/login/{provider})
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", ("method", "route", "status")
+)
+
+# route 경로 정규식에서 시작 고정(^)을 뗀 정규식 (경로 끝부분 매칭용)
+@functools.lru_cache(maxsize=256)
+def _suffix_regex(pattern: str) -> "re.Pattern":
+    return re.compile(pattern[1:] if pattern.startswith("^") else pattern)
+
+# 요청이 매칭된 route의 경로 템플릿
+## FastAPI 버전에 따라 include_router의 prefix가 route 경로에 포함되지 않으므로,
+## route 경로가 실제 경로와 맞지 않으면 실제 경로에서 prefix를 찾아 붙임
+def route_template(scope) -> str:
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+
+    path = scope.get("path", "")
+    regex = getattr(route, "path_regex", None)
+    if regex is None or regex.match(path):
+        return template
+
+    match = _suffix_regex(regex.pattern).search(path)
+    return path[:match.start()] + template if match else template
+
+# 요청 처리 시간 기록 미들웨어 (ASGI)
+## 라벨 수가 늘어나지 않도록 실제 경로 대신 매칭된 route의 경로 템플릿 사용 (매칭 실패 시 unmatched)
+class MetricsMiddleware:
+    def __init__(self, app, histogram: Histogram = HTTP_REQUEST_SECONDS):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.histogram.observe(
+                time.perf_counter() - started,
+                method=scope["method"], route=route_template(scope), status=str(status_code)
+            )
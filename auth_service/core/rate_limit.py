@@ -0,0 +1,126 @@
+import math
+import time
+
+from fastapi import HTTPException, status
+from typing import Any, Callable, Mapping, NamedTuple, Optional
+
+from auth_service.core.cache import TTLCache
+from auth_service.core.config import RATE_LIMIT_CONFIG
+from auth_service.core.metrics import REGISTRY
+
+# 요청 제한 (token bucket)
+## 키마다 최대 burst개의 토큰을 가지며 초당 rate개씩 회복, 요청마다 토큰 1개 사용
+## 토큰이 모두 회복된 bucket은 처음 보는 키와 같으므로 저장하지 않음 (회복 시점에 만료)
+
+# 제한으로 거부된 요청 수
+RATE_LIMIT_REJECTIONS = REGISTRY.counter(
+    "auth_rate_limit_rejections_total", "요청 제한으로 거부된 요청 수", ("rule",)
+)
+
+# 제한 규칙
+class RateLimit(NamedTuple):
+    name: str
+    burst: int
+    rate: float
+
+    @classmethod
+    def from_config(cls, name: str, config: Mapping[str, Any]) -> "RateLimit":
+        return cls(name, int(config["burst"]), float(config["per_minute"]) / 60)
+
+# 요청 제한 저장소 공통 인터페이스
+class RateLimiter:
+    backend = ""
+
+    # 토큰 1개 사용 - 허용되면 0, 거부되면 다음 토큰이 회복될 때까지 남은 시간(초)
+    async def take(self, key: str, limit: RateLimit) -> float:
+        raise NotImplementedError
+
+# 워커 단위 인메모리 저장소
+## 키 -> (남은 토큰 수, 갱신 시각), 조회/갱신 O(1)
+## 회복은 조회 시점에 경과 시간으로 계산하고, 다 회복된 항목은 조회 시 지연 삭제 (키 수는 max_keys로 제한)
+class MemoryRateLimiter(RateLimiter):
+    backend = "memory"
+
+    def __init__(self, max_keys: int, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.buckets = TTLCache(max_keys, math.inf, clock)
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        now = self.clock()
+        tokens, updated = self.buckets.get((limit.name, key), (limit.burst, now))
+        tokens = min(limit.burst, tokens + (now - updated) * limit.rate)
+        if tokens < 1:
+            return (1 - tokens) / limit.rate
+
+        tokens -= 1
+        self.buckets.set((limit.name, key), (tokens, now), expires_at=now + (limit.burst - tokens) / limit.rate)
+        return 0.0
+
+# Redis 저장소 (워커 / 인스턴스 간 공유)
+## 조회와 갱신을 Lua 스크립트 하나로 원자적으로 처리하고, 다 회복되는 시점에 키 만료
+## client: redis.asyncio.Redis 호환 객체 (eval)
+TOKEN_BUCKET_SCRIPT = """
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+if tokens < 1 then
+    return tostring((1 - tokens) / rate)
+end
+tokens = tokens - 1
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.ceil((burst - tokens) / rate * 1000))
+return "0"
+"""
+
+class RedisRateLimiter(RateLimiter):
+    backend = "redis"
+
+    def __init__(self, client, prefix: str = "auth:ratelimit:", clock: Callable[[], float] = time.time):
+        self.client = client
+        self.prefix = prefix
+        self.clock = clock
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        retry_after = await self.client.eval(
+            TOKEN_BUCKET_SCRIPT, 1, f"{self.prefix}{limit.name}:{key}", limit.burst, limit.rate, self.clock()
+        )
+        return float(retry_after)
+
+# 설정에 따라 요청 제한 저장소 생성 (backend: memory / redis / none)
+## redis 백엔드는 redis 패키지 필요 (poetry install -E redis)
+def create_rate_limiter(config: Mapping[str, Any]) -> Optional[RateLimiter]:
+    if config["backend"] == "none":
+        return None
+    if config["backend"] == "memory":
+        return MemoryRateLimiter(config["max_keys"])
+    if config["backend"] == "redis":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise ValueError("redis 요청 제한 저장소는 redis 패키지가 필요합니다.") from e
+        return RedisRateLimiter(redis_asyncio.from_url(config["redis_url"]))
+    raise ValueError(f"지원하지 않는 요청 제한 저장소입니다: {config['backend']}")
+
+rate_limiter = create_rate_limiter(RATE_LIMIT_CONFIG)
+
+# 설정의 제한 규칙
+RATE_LIMITS = {name: RateLimit.from_config(name, rule) for name, rule in RATE_LIMIT_CONFIG["rules"].items()}
+
+# 요청 제한 확인 - 초과 시 429 (Retry-After: 다시 시도할 수 있을 때까지의 초)
+## key가 없으면(클라이언트 주소를 알 수 없는 경우 등) 제한하지 않음
+async def check_rate_limit(limit: RateLimit, key: Optional[str]) -> None:
+    if rate_limiter is None or key is None:
+        return
+
+    retry_after = await rate_limiter.take(key, limit)
+    if retry_after > 0:
+        RATE_LIMIT_REJECTIONS.inc(rule=limit.name)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
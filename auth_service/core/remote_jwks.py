@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+import re
+import time
+
+import httpx
+
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+# 외부 발급자(Google 등)의 공개키 목록(JWKS) 캐시
+## 응답의 Cache-Control max-age 동안 메모리에 보관하고, 만료되었거나 모르는 kid(키 교체)가 오면 재조회
+## 모르는 kid로 인한 재조회는 min_refresh_interval 간격으로 제한 (잘못된 토큰으로 발급자를 반복 호출하지 않도록)
+## path가 주어지면 파일에서 적재한 키만 사용하고 네트워크 조회를 하지 않음 (테스트 / 폐쇄망)
+class RemoteJWKS:
+    def __init__(
+        self,
+        url: str,
+        path: Optional[str] = None,
+        default_max_age: float = 3600,
+        min_refresh_interval: float = 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.url = url
+        self.path = path
+        self.default_max_age = default_max_age
+        self.min_refresh_interval = min_refresh_interval
+        self.clock = clock
+
+        # kid -> JWK
+        self.keys: Dict[str, Dict[str, Any]] = {}
+        self.expires_at = 0.0
+        self.fetched_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+        if path:
+            self.load_file(path)
+
+    # JWKS 파일 적재 (만료 없음)
+    def load_file(self, path: str) -> None:
+        with open(path) as jwks_file:
+            self._set_keys(json.load(jwks_file), float("inf"))
+
+    def _set_keys(self, jwks: Dict[str, Any], expires_at: float) -> None:
+        self.keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+        self.expires_at = expires_at
+
+    # 캐시 상태 직렬화 (디스크 스냅샷용)
+    def snapshot(self) -> Dict[str, Any]:
+        return {"url": self.url, "keys": list(self.keys.values()), "expires_at": self.expires_at}
+
+    # 스냅샷에서 키 적재 - 스냅샷의 만료 시각까지는 재조회하지 않고, 만료 후에는 재조회 실패 시 계속 사용
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        if self.path:
+            return
+        self._set_keys({"keys": snapshot.get("keys", [])}, float(snapshot.get("expires_at", 0)))
+
+    # Cache-Control 헤더의 max-age (초)
+    @staticmethod
+    def max_age(cache_control: Optional[str]) -> Optional[int]:
+        match = CACHE_CONTROL_MAX_AGE.search(cache_control or "")
+        return int(match.group(1)) if match else None
+
+    # 발급자에서 JWKS 재조회
+    async def refresh(self, http_client: httpx.AsyncClient) -> None:
+        self.fetched_at = self.clock()
+        response = await http_client.get(self.url)
+        response.raise_for_status()
+
+        max_age = self.max_age(response.headers.get("cache-control"))
+        if max_age is None:
+            max_age = self.default_max_age
+        self._set_keys(response.json(), self.clock() + max(max_age, self.min_refresh_interval))
+
+    # 만료되었거나 모르는 kid이면 재조회 - 단, 마지막 조회(실패 포함) 후 min_refresh_interval 이내에는 재조회하지 않음
+    def _needs_refresh(self, kid: Optional[str]) -> bool:
+        now = self.clock()
+        if kid in self.keys and now < self.expires_at:
+            return False
+        return self.fetched_at is None or now - self.fetched_at >= self.min_refresh_interval
+
+    # kid로 JWK 조회 - 없으면 None, 한 번도 조회하지 못했으면 ValueError
+    ## 동시에 여러 요청이 재조회를 필요로 하면 한 번만 조회 (lock 획득 후 재확인)
+    ## 재조회에 실패하면 만료된 키라도 있으면 그대로 사용
+    async def get(self, kid: Optional[str], http_client: httpx.AsyncClient) -> Optional[Dict[str, Any]]:
+        if self.path or not self._needs_refresh(kid):
+            return self._get(kid)
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._needs_refresh(kid):
+                try:
+                    await self.refresh(http_client)
+                except (httpx.HTTPError, ValueError):
+                    if kid not in self.keys:
+                        raise
+                    logger.warning("JWKS 재조회 실패 - 캐시된 키 사용 (%s)", self.url, exc_info=True)
+        return self._get(kid)
+
+    def _get(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not self.keys:
+            raise ValueError(f"JWKS를 조회할 수 없습니다: {self.url}")
+        return self.keys.get(kid)
+
+    # 만료 전에 미리 재조회 (앱 lifespan에서 백그라운드 태스크로 실행)
+    ## 키를 한 번 적재한 뒤부터(시작 시 조회 / 스냅샷 / 로그인 요청) 만료 margin_seconds 전마다 재조회하여 요청 경로에서 조회하지 않도록 함
+    async def refresh_periodically(self, http_client: httpx.AsyncClient, margin_seconds: float = 60) -> None:
+        if self.path:
+            return
+
+        while True:
+            delay = self.min_refresh_interval
+            if self.keys:
+                delay = max(self.expires_at - self.clock() - margin_seconds, self.min_refresh_interval)
+            await asyncio.sleep(delay)
+
+            if not self.keys:
+                continue
+            try:
+                await self.refresh(http_client)
+            except Exception:
+                logger.exception("JWKS 재조회 실패 (%s)", self.url)
@@ -0,0 +1,18 @@
+import json
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+# JSON 응답 클래스 (앱 기본 응답 클래스)
+## orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 직렬화
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
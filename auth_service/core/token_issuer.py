@@ -0,0 +1,47 @@
+import time
+import uuid
+
+from typing import Any, Callable, Dict, Optional
+
+from auth_service.core.jwt_backends import JWTBackend
+from auth_service.core.keys import SigningKey
+
+# 토큰 발급기 (토큰 종류별로 한 번 생성하여 재사용)
+## 서명 키에 묶인 인코딩 함수와 고정 클레임(token_type, iss, aud)을 미리 만들어 두고,
+## 발급 시에는 epoch 초(int) 계산 + payload 생성 + 인코딩만 수행
+## fast-hmac 백엔드는 헤더 세그먼트와 HMAC 객체도 미리 준비하므로 발급 1회 = JSON 직렬화 1회 + HMAC 1회
+class TokenIssuer:
+    def __init__(
+        self,
+        key: SigningKey,
+        backend: JWTBackend,
+        token_type: str,
+        lifetime_seconds: int,
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.key = key
+        self.lifetime_seconds = int(lifetime_seconds)
+        self.clock = clock
+
+        self.static_claims: Dict[str, Any] = {"token_type": token_type}
+        if issuer:
+            self.static_claims["iss"] = issuer
+        if audience:
+            self.static_claims["aud"] = audience
+
+        self._encode = backend.encoder(key)
+
+    # 토큰 발급 - data에 고정 클레임, iat/exp, jti와 추가 클레임(claims)을 더해 서명
+    def issue(self, data: Dict[str, Any], lifetime_seconds: Optional[int] = None, **claims: Any) -> str:
+        now = int(self.clock())
+        payload = {
+            **data,
+            **self.static_claims,
+            "iat": now,
+            "exp": now + (self.lifetime_seconds if lifetime_seconds is None else int(lifetime_seconds)),
+            "jti": uuid.uuid4().hex,
+            **claims,
+        }
+        return self._encode(payload)
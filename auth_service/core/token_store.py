@@ -0,0 +1,297 @@
+import asyncio
+import logging
+import threading
+import time
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from auth_service.core.bloom import BloomFilter
+from auth_service.core.cache import TTLCache
+from auth_service.core.database import SessionLocal
+from auth_service.models.auth_model import TokenRevocation
+
+logger = logging.getLogger(__name__)
+
+# 저장 항목 종류
+## used: 이미 사용된(교체된) refresh token의 jti
+## revoked: 폐기된 토큰의 jti
+## family: 폐기된 refresh token family (재사용 감지 시 family 전체 폐기)
+USED = "used"
+REVOKED = "revoked"
+FAMILY = "family"
+
+# 토큰 폐기/교체 이력 저장소 인터페이스
+## 모든 항목은 (종류, ID) 키로 O(1) 조회하며, 원래 토큰의 만료 시각이 지나면 compact()로 정리
+class TokenStore:
+    # DB 등 블로킹 I/O를 사용하는 저장소는 이벤트 루프 밖(스레드풀)에서 호출해야 함
+    blocking = False
+
+    # 최초 사용이면 사용 처리 후 True, 이미 사용된 jti면 False (재사용)
+    def mark_used(self, jti: str, expires_at: float) -> bool:
+        raise NotImplementedError
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        raise NotImplementedError
+
+    def is_revoked(self, jti: str) -> bool:
+        raise NotImplementedError
+
+    def revoke_family(self, family_id: str, expires_at: float) -> None:
+        raise NotImplementedError
+
+    def is_family_revoked(self, family_id: str) -> bool:
+        raise NotImplementedError
+
+    # 만료되지 않은 폐기 jti 목록 - since(epoch 초)가 주어지면 그 이후 폐기된 항목만
+    def revoked_ids(self, since: Optional[float] = None) -> List[str]:
+        raise NotImplementedError
+
+    # 만료된 항목 정리 후 삭제된 항목 수 반환
+    def compact(self) -> int:
+        raise NotImplementedError
+
+# 인메모리 저장소 (워커 단위)
+## 조회 시 만료된 항목은 지연 삭제하고, 주기적인 compact()로 조회되지 않는 항목도 정리
+class MemoryTokenStore(TokenStore):
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        # (종류, ID) -> (만료 시각, 등록 시각)
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _set(self, key: tuple, expires_at: float) -> None:
+        self._entries[key] = (expires_at, self.clock())
+
+    def _contains(self, key: tuple) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if entry[0] <= self.clock():
+            self._entries.pop(key, None)
+            return False
+        return True
+
+    def mark_used(self, jti: str, expires_at: float) -> bool:
+        key = (USED, jti)
+        with self._lock:
+            if self._contains(key):
+                return False
+            self._set(key, expires_at)
+            return True
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        with self._lock:
+            self._set((REVOKED, jti), expires_at)
+
+    def is_revoked(self, jti: str) -> bool:
+        with self._lock:
+            return self._contains((REVOKED, jti))
+
+    def revoke_family(self, family_id: str, expires_at: float) -> None:
+        with self._lock:
+            self._set((FAMILY, family_id), expires_at)
+
+    def is_family_revoked(self, family_id: str) -> bool:
+        with self._lock:
+            return self._contains((FAMILY, family_id))
+
+    def revoked_ids(self, since: Optional[float] = None) -> List[str]:
+        now = self.clock()
+        with self._lock:
+            return [
+                token_id for (kind, token_id), (expires_at, created_at) in self._entries.items()
+                if kind == REVOKED and expires_at > now and (since is None or created_at >= since)
+            ]
+
+    def compact(self) -> int:
+        now = self.clock()
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+        return len(expired)
+
+# DB 저장소 (워커 간 공유)
+## token_revocations 테이블의 (kind, token_id) 기본키로 조회
+class DatabaseTokenStore(TokenStore):
+    blocking = True
+
+    def __init__(self, session_factory: Callable, clock: Callable[[], float] = time.time):
+        self.session_factory = session_factory
+        self.clock = clock
+
+    def _insert(self, kind: str, token_id: str, expires_at: float) -> bool:
+        with self.session_factory() as db:
+            db.add(TokenRevocation(kind=kind, token_id=token_id, expires_at=int(expires_at), created_at=self.clock()))
+            try:
+                db.commit()
+                return True
+            except IntegrityError:
+                db.rollback()
+                return False
+
+    def _contains(self, kind: str, token_id: str) -> bool:
+        with self.session_factory() as db:
+            expires_at = db.execute(
+                select(TokenRevocation.expires_at).where(
+                    TokenRevocation.kind == kind,
+                    TokenRevocation.token_id == token_id
+                )
+            ).scalar()
+        return expires_at is not None and expires_at > self.clock()
+
+    def mark_used(self, jti: str, expires_at: float) -> bool:
+        return self._insert(USED, jti, expires_at)
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        self._insert(REVOKED, jti, expires_at)
+
+    def is_revoked(self, jti: str) -> bool:
+        return self._contains(REVOKED, jti)
+
+    def revoke_family(self, family_id: str, expires_at: float) -> None:
+        self._insert(FAMILY, family_id, expires_at)
+
+    def is_family_revoked(self, family_id: str) -> bool:
+        return self._contains(FAMILY, family_id)
+
+    def revoked_ids(self, since: Optional[float] = None) -> List[str]:
+        query = select(TokenRevocation.token_id).where(
+            TokenRevocation.kind == REVOKED,
+            TokenRevocation.expires_at > int(self.clock())
+        )
+        if since is not None:
+            query = query.where(TokenRevocation.created_at >= since)
+
+        with self.session_factory() as db:
+            return list(db.execute(query).scalars())
+
+    def compact(self) -> int:
+        with self.session_factory() as db:
+            result = db.execute(delete(TokenRevocation).where(TokenRevocation.expires_at <= int(self.clock())))
+            db.commit()
+        return result.rowcount
+
+# 폐기 토큰 목록(denylist) 앞단의 Bloom filter
+## access token 검증마다 저장소(DB)를 조회하지 않도록 filter에 없는 jti는 즉시 통과시키고,
+## filter 양성인 경우에만 저장소에서 정확히 확인 (확인된 폐기 jti는 캐시하여 반복 조회 방지)
+## 항목 추가로 예상 거짓 양성 비율이 임계값을 넘으면 저장소 기준으로 filter 재생성 (만료 항목 제외)
+class RevocationFilter:
+    def __init__(self, store: TokenStore, capacity: int, error_rate: float, max_false_positive_rate: float):
+        self.store = store
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.max_false_positive_rate = max_false_positive_rate
+        self.confirmed = TTLCache(max_size=capacity, ttl_seconds=float("inf"), clock=store.clock)
+        self._lock = threading.RLock()
+
+        # filter 통계
+        self.positives = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.synced_at: Optional[float] = None
+
+    # 저장소의 폐기 목록으로 filter 재생성 후 참조 교체
+    def rebuild(self) -> None:
+        with self._lock:
+            synced_at = self.store.clock()
+            revoked_ids = self.store.revoked_ids()
+            bloom = BloomFilter(max(self.capacity, 2 * len(revoked_ids)), self.error_rate)
+            for token_id in revoked_ids:
+                bloom.add(token_id)
+
+            self.bloom = bloom
+            self.synced_at = synced_at
+            self.rebuilds += 1
+
+    # 다른 워커에서 폐기된 항목을 filter에 반영 (마지막 동기화 이후 항목만)
+    def sync(self) -> int:
+        if self.synced_at is None:
+            self.rebuild()
+            return len(self.bloom)
+
+        synced_at = self.store.clock()
+        revoked_ids = self.store.revoked_ids(since=self.synced_at)
+        for token_id in revoked_ids:
+            self._add(token_id)
+        self.synced_at = synced_at
+        return len(revoked_ids)
+
+    def _add(self, token_id: str) -> None:
+        with self._lock:
+            self.bloom.add(token_id)
+            if self.bloom.estimated_false_positive_rate() > self.max_false_positive_rate:
+                self.rebuild()
+
+    # 토큰 폐기 - 저장소 기록 후 filter에 즉시 반영
+    def revoke(self, jti: str, expires_at: float) -> None:
+        self.store.revoke(jti, expires_at)
+        self.confirmed.set(jti, True, expires_at=expires_at)
+        self._add(jti)
+
+    # 폐기 여부 확인 (expires_at: 토큰 만료 시각, 확인된 폐기 jti 캐시 기간)
+    def is_revoked(self, jti: str, expires_at: Optional[float] = None) -> bool:
+        if jti not in self.bloom:
+            return False
+
+        self.positives += 1
+        if self.confirmed.get(jti):
+            return True
+
+        revoked = self.store.is_revoked(jti)
+        if revoked:
+            self.confirmed.set(jti, True, expires_at=expires_at)
+        else:
+            self.false_positives += 1
+        return revoked
+
+    # filter 통계 조회
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self.bloom),
+            "positives": self.positives,
+            "false_positives": self.false_positives,
+            "rebuilds": self.rebuilds,
+            "estimated_false_positive_rate": self.bloom.estimated_false_positive_rate(),
+        }
+
+# 설정에 따른 저장소 생성
+def create_token_store(config: Mapping[str, Any]) -> TokenStore:
+    if config["backend"] == "memory":
+        return MemoryTokenStore()
+    if config["backend"] == "database":
+        return DatabaseTokenStore(SessionLocal)
+    raise ValueError(f"지원하지 않는 토큰 저장소입니다: {config['backend']}")
+
+# 만료 항목 주기적 정리 (앱 lifespan에서 백그라운드 태스크로 실행)
+async def compact_periodically(store_getter: Callable[[], TokenStore], interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        store = store_getter()
+        try:
+            removed = await run_in_threadpool(store.compact) if store.blocking else store.compact()
+            if removed:
+                logger.info("토큰 저장소 정리: 만료 항목 %d개 삭제", removed)
+        except Exception:
+            logger.exception("토큰 저장소 정리 실패")
+
+# 폐기 filter 주기적 동기화 (워커 간 공유 저장소를 사용하는 경우)
+async def sync_filter_periodically(filter_getter: Callable[[], RevocationFilter], interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        revocation_filter = filter_getter()
+        try:
+            if revocation_filter.store.blocking:
+                await run_in_threadpool(revocation_filter.sync)
+            else:
+                revocation_filter.sync()
+        except Exception:
+            logger.exception("폐기 filter 동기화 실패")
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import time
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, NamedTuple, Optional, Tuple
+
+from auth_service.core.cache import TTLCache
+from auth_service.core.metrics import REGISTRY
+
+# 소셜 계정 사용자 캐시 - (provider, social_id) -> 토큰 발급에 필요한 사용자 컬럼
+## 최근 로그인한 사용자는 DB 조회 없이 캐시에서 확인하고, provider 계정 정보가 바뀐 경우에만 DB 갱신
+
+# 캐시 조회 결과 (hit / miss)
+USER_CACHE_REQUESTS = REGISTRY.counter(
+    "auth_user_cache_requests_total", "소셜 계정 사용자 캐시 조회 수", ("backend", "result")
+)
+
+# 캐시에 저장하는 사용자 정보 (upsert 결과와 같은 컬럼)
+class CachedUser(NamedTuple):
+    id: int
+    email: str
+    name: str
+
+UserKey = Tuple[str, str]
+
+# 사용자 캐시 공통 인터페이스
+class UserCache:
+    backend = ""
+
+    async def get(self, key: UserKey) -> Optional[CachedUser]:
+        raise NotImplementedError
+
+    async def set(self, key: UserKey, user: CachedUser) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: UserKey) -> None:
+        raise NotImplementedError
+
+    def _record(self, user: Optional[CachedUser]) -> Optional[CachedUser]:
+        USER_CACHE_REQUESTS.inc(backend=self.backend, result="miss" if user is None else "hit")
+        return user
+
+# 워커 단위 인메모리 캐시 (LRU + TTL)
+## 워커 간에 공유되지 않으므로 다른 워커에서 갱신된 정보는 TTL이 지나야 반영됨
+class MemoryUserCache(UserCache):
+    backend = "memory"
+
+    def __init__(self, max_size: int, ttl_seconds: float, clock: Callable[[], float] = time.time):
+        self.cache = TTLCache(max_size, ttl_seconds, clock)
+
+    async def get(self, key: UserKey) -> Optional[CachedUser]:
+        return self._record(self.cache.get(key))
+
+    async def set(self, key: UserKey, user: CachedUser) -> None:
+        self.cache.set(key, user)
+
+    async def delete(self, key: UserKey) -> None:
+        self.cache.pop(key)
+
+# Redis 캐시 (워커 / 인스턴스 간 공유)
+## client: redis.asyncio.Redis 호환 객체 (get / set(ex=) / delete)
+class RedisUserCache(UserCache):
+    backend = "redis"
+
+    def __init__(self, client, ttl_seconds: int, prefix: str = "auth:user:"):
+        self.client = client
+        self.ttl_seconds = int(ttl_seconds)
+        self.prefix = prefix
+
+    def _key(self, key: UserKey) -> str:
+        return f"{self.prefix}{key[0]}:{key[1]}"
+
+    async def get(self, key: UserKey) -> Optional[CachedUser]:
+        value = await self.client.get(self._key(key))
+        return self._record(None if value is None else CachedUser(*json.loads(value)))
+
+    async def set(self, key: UserKey, user: CachedUser) -> None:
+        await self.client.set(self._key(key), json.dumps(list(user)), ex=self.ttl_seconds)
+
+    async def delete(self, key: UserKey) -> None:
+        await self.client.delete(self._key(key))
+
+# 설정에 따라 사용자 캐시 생성 (backend: memory / redis / none)
+## redis 백엔드는 redis 패키지 필요 (poetry install -E redis)
+def create_user_cache(config: Mapping[str, Any]) -> Optional[UserCache]:
+    if config["backend"] == "none":
+        return None
+    if config["backend"] == "memory":
+        return MemoryUserCache(config["max_size"], config["ttl_seconds"])
+    if config["backend"] == "redis":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise ValueError("redis 사용자 캐시는 redis 패키지가 필요합니다.") from e
+        return RedisUserCache(redis_asyncio.from_url(config["redis_url"]), config["ttl_seconds"])
+    raise ValueError(f"지원하지 않는 사용자 캐시입니다: {config['backend']}")
+
+# 같은 키의 동시 호출을 하나로 합침 (cache stampede 방지)
+## 첫 호출만 실행하고, 실행 중에 들어온 같은 키의 호출은 그 결과(또는 예외)를 함께 받음
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._calls.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 호출이 없으면 "예외를 조회하지 않음" 경고가 나지 않도록 조회 처리
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
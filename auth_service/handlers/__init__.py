@@ -1,2 +0,0 @@
-from .google_social_handler import *
-from .token_handler import *
\ No newline at end of file
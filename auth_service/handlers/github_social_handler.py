@@ -0,0 +1,36 @@
+from typing import Any, Dict, Optional
+
+from auth_service.core.config import OAUTH_GITHUB_CONFIG
+from auth_service.handlers.social_handler import LOGIN_STAGE_SECONDS, OAuthClient, SocialProfile, SocialProvider
+
+# GitHub
+## 사용자 API(/user) - 이름이 없으면 login 사용
+## 공개 이메일은 GitHub에서 인증된 이메일 중에서만 선택할 수 있으므로 그대로 사용
+## 공개 이메일이 없는 계정은 이메일 목록 API에서 인증된(verified) 대표 이메일 조회
+class GitHubProvider(SocialProvider):
+    name = "github"
+    display_name = "GitHub"
+
+    def profile_from_userinfo(self, data: Dict[str, Any]) -> SocialProfile:
+        return SocialProfile(social_id=str(data["id"]), email=data.get("email"), name=data.get("name") or data.get("login"))
+
+    async def fetch_profile(self, client: OAuthClient, token: Dict[str, Any]) -> SocialProfile:
+        profile = await super().fetch_profile(client, token)
+        if profile.email:
+            return profile
+
+        with LOGIN_STAGE_SECONDS.time(provider=self.name, stage="userinfo"):
+            email = await self.primary_email(client, token)
+        return SocialProfile(social_id=profile.social_id, email=email, name=profile.name)
+
+    # 인증된 대표 이메일 (없으면 None)
+    async def primary_email(self, client: OAuthClient, token: Dict[str, Any]) -> Optional[str]:
+        response = await client.get(self.config["emails_url"], token=token)
+        if response.status_code != 200:
+            return None
+        for item in response.json():
+            if item.get("primary") and item.get("verified"):
+                return item.get("email")
+        return None
+
+github_provider = GitHubProvider(OAUTH_GITHUB_CONFIG)
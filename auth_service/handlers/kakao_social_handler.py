@@ -0,0 +1,23 @@
+from typing import Any, Dict
+
+from auth_service.core.config import OAUTH_KAKAO_CONFIG
+from auth_service.handlers.social_handler import SocialProfile, SocialProvider
+
+# Kakao
+## 사용자 정보 API(v2/user/me) - 이메일 / 닉네임은 kakao_account 아래에 있으며 동의하지 않은 항목은 생략됨
+## 발급 토큰의 sub가 이메일이므로 Kakao가 인증(is_email_verified)했고 유효한(is_email_valid) 이메일만 사용
+class KakaoProvider(SocialProvider):
+    name = "kakao"
+    display_name = "Kakao"
+
+    def profile_from_userinfo(self, data: Dict[str, Any]) -> SocialProfile:
+        account = data.get("kakao_account") or {}
+        profile = account.get("profile") or {}
+        verified = account.get("is_email_verified") is True and account.get("is_email_valid") is True
+        return SocialProfile(
+            social_id=str(data["id"]),
+            email=account.get("email") if verified else None,
+            name=profile.get("nickname")
+        )
+
+kakao_provider = KakaoProvider(OAUTH_KAKAO_CONFIG)
@@ -0,0 +1,21 @@
+from typing import Any, Dict
+
+from auth_service.core.config import OAUTH_NAVER_CONFIG
+from auth_service.handlers.social_handler import SocialProfile, SocialProvider
+
+# Naver
+## 사용자 정보 API(v1/nid/me) - 계정 정보는 response 아래에 있으며, 이름 미동의 시 닉네임 사용
+## 이메일 확인 여부 필드는 없지만, 반환하는 이메일은 네이버 ID 메일 또는 네이버가 인증 코드로 확인한 연락처 이메일이므로 그대로 사용
+class NaverProvider(SocialProvider):
+    name = "naver"
+    display_name = "Naver"
+
+    def profile_from_userinfo(self, data: Dict[str, Any]) -> SocialProfile:
+        account = data.get("response") or {}
+        return SocialProfile(
+            social_id=str(account["id"]),
+            email=account.get("email"),
+            name=account.get("name") or account.get("nickname")
+        )
+
+naver_provider = NaverProvider(OAUTH_NAVER_CONFIG)
@@ -0,0 +1,80 @@
+import asyncio
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from auth_service.core.config import OAUTH_OIDC_CONFIG
+from auth_service.handlers.social_handler import OAuthClient, OIDCProvider
+
+# discovery 문서의 엔드포인트 키
+METADATA_ENDPOINTS = {
+    "token": "token_endpoint",
+    "userinfo": "userinfo_endpoint",
+    "jwks": "jwks_uri",
+}
+
+# OpenID Connect discovery를 사용하는 OAuth 클라이언트
+## 설정에 *_url이 없으면 discovery 문서의 엔드포인트 사용
+## discovery 문서는 처음 필요할 때 한 번만 조회하여 클라이언트(워커)에 보관 - 동시에 요청이 몰려도 한 번만 조회
+class OIDCClient(OAuthClient):
+    def __init__(self, http_client, config: Mapping[str, Any]):
+        super().__init__(http_client, config)
+        self.metadata: Optional[Dict[str, Any]] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    # discovery 문서 URL
+    def metadata_url(self) -> str:
+        if self.config.get("server_metadata_url"):
+            return self.config["server_metadata_url"]
+        return self.config["issuer"].rstrip("/") + "/.well-known/openid-configuration"
+
+    # discovery 문서 조회 (실패 시 httpx.HTTPError / ValueError, 다음 요청에서 재조회)
+    async def load_metadata(self) -> Dict[str, Any]:
+        if self.metadata is not None:
+            return self.metadata
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.metadata is None:
+                await self.refresh_metadata()
+        return self.metadata
+
+    # discovery 문서 재조회
+    async def refresh_metadata(self) -> None:
+        response = await self.http_client.get(self.metadata_url())
+        response.raise_for_status()
+        self.metadata = response.json()
+
+    async def prefetch(self) -> None:
+        await self.refresh_metadata()
+        await super().prefetch()
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot = super().snapshot()
+        if self.metadata is not None:
+            snapshot["metadata"] = self.metadata
+        return snapshot
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        if snapshot.get("metadata"):
+            self.metadata = snapshot["metadata"]
+        super().load_snapshot(snapshot)
+
+    async def endpoint(self, name: str) -> Optional[str]:
+        url = await super().endpoint(name)
+        if url or name not in METADATA_ENDPOINTS:
+            return url
+        return (await self.load_metadata()).get(METADATA_ENDPOINTS[name])
+
+    async def issuers(self) -> Tuple[str, ...]:
+        if self.config.get("issuer"):
+            return (self.config["issuer"],)
+        return ((await self.load_metadata())["issuer"],)
+
+# 범용 OpenID Connect provider
+class GenericOIDCProvider(OIDCProvider):
+    name = "oidc"
+    display_name = "OpenID Connect"
+    client_class = OIDCClient
+
+oidc_provider = GenericOIDCProvider(OAUTH_OIDC_CONFIG)
@@ -0,0 +1,451 @@
+import asyncio
+import logging
+
+import httpx
+
+from dataclasses import dataclass
+from fastapi import HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from authlib.common.errors import AuthlibBaseError
+from jose import JWTError, jwt as jose_jwt
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from auth_service.core.config import USER_CACHE_CONFIG
+from auth_service.core.jwt_backends import TokenError, get_unverified_header
+from auth_service.core.metrics import REGISTRY
+from auth_service.core.remote_jwks import RemoteJWKS
+from auth_service.core.user_cache import CachedUser, SingleFlight, create_user_cache
+from auth_service.models.auth_model import User
+from auth_service.handlers.token_handler import create_access_token, create_refresh_token
+
+logger = logging.getLogger(__name__)
+
+# provider 인가 코드 교환 실패
+## authlib.integrations.starlette_client는 import 비용이 커서(~150ms) 같은 형태의 예외를 직접 정의
+class OAuthError(AuthlibBaseError):
+    error = "oauth_error"
+
+# 로그인 단계별 처리 시간
+## token_exchange: 인가 코드 -> access token 교환 / id_token: id_token 검증
+## userinfo: 사용자 정보 조회 (id_token으로 확인할 수 없는 경우만) / user_upsert: DB 사용자 조회/생성
+## jwt_sign: access/refresh token 발급
+LOGIN_STAGE_SECONDS = REGISTRY.histogram(
+    "auth_login_stage_seconds", "소셜 로그인 단계별 처리 시간 (초)", ("provider", "stage")
+)
+
+# id_token 대신 userinfo를 호출한 횟수 (reason: no_id_token / missing_claims / jwks_unavailable)
+LOGIN_USERINFO_FALLBACKS = REGISTRY.counter(
+    "auth_login_userinfo_fallbacks_total", "id_token 대신 userinfo API를 호출한 횟수", ("provider", "reason")
+)
+
+# provider 계정 정보
+@dataclass(frozen=True)
+class SocialProfile:
+    social_id: str
+    email: Optional[str]
+    name: Optional[str]
+
+# provider별 OAuth 클라이언트 (워커마다 1개, 앱 lifespan에서 생성)
+## 앱 lifespan에서 만든 공유 httpx.AsyncClient로 provider 호출을 처리 (keep-alive 커넥션 재사용)
+## 인가 코드는 프론트엔드가 provider 인가 후 전달하며, state 검증은 인가 요청을 만든 프론트엔드에서 수행
+## 엔드포인트는 설정의 token_url / userinfo_url / jwks_url 사용
+class OAuthClient:
+    def __init__(self, http_client: httpx.AsyncClient, config: Mapping[str, Any]):
+        self.http_client = http_client
+        self.config = config
+        self.jwks: Optional[RemoteJWKS] = None
+        if config.get("jwks_url") or config.get("jwks_path"):
+            self.jwks = RemoteJWKS(config.get("jwks_url"), config.get("jwks_path"))
+
+    # client_id가 설정된 provider만 사용 (시작 시 메타데이터 미리 조회 대상)
+    @property
+    def configured(self) -> bool:
+        return bool(self.config.get("client_id"))
+
+    # provider 메타데이터 재조회 (discovery를 사용하지 않는 provider는 조회할 메타데이터 없음)
+    async def refresh_metadata(self) -> None:
+        pass
+
+    # 요청 경로에서 조회하지 않도록 id_token 검증용 공개키를 미리 조회 (앱 lifespan 시작 시)
+    async def prefetch(self) -> None:
+        jwks = await self.jwks_cache()
+        if jwks is not None and not jwks.path:
+            await jwks.refresh(self.http_client)
+
+    # 캐시된 메타데이터 / 공개키 직렬화 (디스크 스냅샷용)
+    def snapshot(self) -> Dict[str, Any]:
+        if self.jwks is None or self.jwks.path or not self.jwks.keys:
+            return {}
+        return {"jwks": self.jwks.snapshot()}
+
+    # 스냅샷에서 메타데이터 / 공개키 적재
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        if not snapshot.get("jwks"):
+            return
+        if self.jwks is None:
+            self.jwks = RemoteJWKS(snapshot["jwks"]["url"])
+        self.jwks.load_snapshot(snapshot["jwks"])
+
+    # 엔드포인트 URL 조회 (name: token / userinfo / jwks)
+    async def endpoint(self, name: str) -> Optional[str]:
+        return self.config.get(f"{name}_url")
+
+    # id_token 허용 발급자(iss) 목록
+    async def issuers(self) -> Tuple[str, ...]:
+        return tuple(self.config.get("issuers") or ())
+
+    # id_token 검증용 공개키 캐시 (jwks 엔드포인트가 없으면 None)
+    async def jwks_cache(self) -> Optional[RemoteJWKS]:
+        if self.jwks is None:
+            url = await self.endpoint("jwks")
+            if url:
+                self.jwks = RemoteJWKS(url)
+        return self.jwks
+
+    # 요청(query string 또는 form)의 인가 코드로 access token 발급
+    async def authorize_access_token(self, request: Request) -> Dict[str, Any]:
+        params = dict(request.query_params)
+        if "code" not in params and request.headers.get("content-type", "").startswith("application/x-www-form-urlencoded"):
+            params.update(await request.form())
+
+        if params.get("error"):
+            raise OAuthError(error=params["error"], description=params.get("error_description"))
+        if not params.get("code"):
+            raise OAuthError(error="missing_code", description="인가 코드(code)가 없습니다.")
+
+        data = {
+            "grant_type": "authorization_code",
+            "code": params["code"],
+            "client_id": self.config["client_id"],
+            "client_secret": self.config["client_secret"],
+            "redirect_uri": params.get("redirect_uri") or self.config["redirect_uri"],
+        }
+        # state를 함께 검증하는 provider(Naver 등)를 위해 전달
+        if params.get("state"):
+            data["state"] = params["state"]
+
+        try:
+            response = await self.http_client.post(
+                await self.endpoint("token"), data=data, headers={"Accept": "application/json"}
+            )
+            token = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            raise OAuthError(error="token_request_failed", description=str(e)) from e
+
+        if response.status_code != 200 or "access_token" not in token:
+            raise OAuthError(error=token.get("error", "invalid_token_response"), description=token.get("error_description"))
+        return token
+
+    # OpenID id_token 검증 후 claims 반환 (서명 / aud / iss / exp / at_hash)
+    ## 공개키는 캐시된 JWKS에서 kid로 조회 - 검증 실패 시 TokenError, JWKS 조회 실패 시 httpx.HTTPError / ValueError
+    async def parse_id_token(self, token: Dict[str, Any]) -> Dict[str, Any]:
+        id_token = token["id_token"]
+        kid = get_unverified_header(id_token).get("kid")
+        jwks = await self.jwks_cache()
+        if jwks is None:
+            raise ValueError("JWKS 엔드포인트가 설정되지 않았습니다.")
+
+        jwk = await jwks.get(kid, self.http_client)
+        if jwk is None:
+            raise TokenError(f"Unknown key id: {kid}")
+
+        try:
+            return jose_jwt.decode(
+                id_token,
+                jwk,
+                algorithms=[jwk.get("alg", "RS256")],
+                audience=self.config["client_id"],
+                issuer=await self.issuers(),
+                access_token=token.get("access_token"),
+            )
+        except JWTError as e:
+            raise TokenError(str(e)) from e
+
+    # access token으로 provider API 호출 (url: 전체 URL 또는 "userinfo")
+    async def get(self, url: str, token: Dict[str, Any], **kwargs) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {token['access_token']}", **kwargs.pop("headers", {})}
+        if url == "userinfo":
+            url = await self.endpoint("userinfo")
+        return await self.http_client.get(url, headers=headers, **kwargs)
+
+# 소셜 로그인 provider 공통 인터페이스
+## provider별 차이(설정 / 사용자 정보 형식)만 구현하고, 토큰 교환 -> 사용자 조회/생성 -> 토큰 발급은 handle_social_login에서 공통 처리
+class SocialProvider:
+    name = ""
+    display_name = ""
+    client_class = OAuthClient
+
+    def __init__(self, config: Mapping[str, Any]):
+        self.config = config
+
+    # 공유 HTTP 클라이언트를 사용하는 OAuth 클라이언트 생성
+    def create_client(self, http_client: httpx.AsyncClient) -> OAuthClient:
+        return self.client_class(http_client, self.config)
+
+    # userinfo 응답 -> 계정 정보
+    def profile_from_userinfo(self, data: Dict[str, Any]) -> SocialProfile:
+        raise NotImplementedError
+
+    # access token(응답)으로 계정 정보 조회
+    async def fetch_profile(self, client: OAuthClient, token: Dict[str, Any]) -> SocialProfile:
+        with LOGIN_STAGE_SECONDS.time(provider=self.name, stage="userinfo"):
+            response = await client.get("userinfo", token=token)
+            return self.profile_from_userinfo(response.json())
+
+# OpenID Connect provider 공통
+## id_token을 로컬에서 검증하여 userinfo 호출을 생략하고, 확인할 수 없는 경우에만 userinfo 호출
+## 발급 토큰의 sub가 이메일이므로 provider가 확인(email_verified)한 이메일만 사용 - 확인되지 않은 이메일은 없는 것으로 처리
+class OIDCProvider(SocialProvider):
+    # 이메일 확인 여부 claim
+    email_verified_claim = "email_verified"
+
+    # 확인된 이메일 (확인되지 않았으면 None)
+    def verified_email(self, data: Dict[str, Any]) -> Optional[str]:
+        verified = data.get(self.email_verified_claim)
+        if verified is True or verified == "true":
+            return data.get("email")
+        return None
+
+    def profile_from_userinfo(self, data: Dict[str, Any]) -> SocialProfile:
+        return SocialProfile(social_id=str(data["sub"]), email=self.verified_email(data), name=data.get("name"))
+
+    async def fetch_profile(self, client: OAuthClient, token: Dict[str, Any]) -> SocialProfile:
+        claims = await self.id_token_claims(client, token)
+        if claims is not None:
+            return SocialProfile(social_id=claims["sub"], email=self.verified_email(claims), name=claims["name"])
+        return await super().fetch_profile(client, token)
+
+    # id_token을 로컬에서 검증하여 claims 반환
+    ## id_token이 없거나, 필요한 claim이 없거나, 공개키를 조회할 수 없으면 None (userinfo로 대체)
+    ## 서명 / 발급자 / 대상 검증에 실패하면 400
+    async def id_token_claims(self, client: OAuthClient, token: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(token, dict) or not token.get("id_token"):
+            LOGIN_USERINFO_FALLBACKS.inc(provider=self.name, reason="no_id_token")
+            return None
+
+        try:
+            with LOGIN_STAGE_SECONDS.time(provider=self.name, stage="id_token"):
+                claims = await client.parse_id_token(token)
+        except TokenError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="OAuth 에러: invalid_id_token"
+            )
+        except (httpx.HTTPError, ValueError):
+            logger.warning("%s JWKS 조회 실패 - userinfo로 사용자 정보 조회", self.display_name, exc_info=True)
+            LOGIN_USERINFO_FALLBACKS.inc(provider=self.name, reason="jwks_unavailable")
+            return None
+
+        if not claims.get("email") or not claims.get("name"):
+            LOGIN_USERINFO_FALLBACKS.inc(provider=self.name, reason="missing_claims")
+            return None
+        return claims
+
+# ON CONFLICT upsert를 지원하는 dialect별 INSERT 생성자
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# 토큰 발급에 필요한 사용자 컬럼
+USER_COLUMNS = (User.id, User.email, User.name)
+
+# 이메일이 이미 다른 소셜 계정의 사용자로 등록된 경우
+## JWT sub가 이메일이므로 이메일당 사용자 하나만 허용 (다른 provider 계정과 자동으로 연결하지 않음)
+class EmailConflictError(Exception):
+    pass
+
+# 소셜 계정 사용자 조회 구문 - (social_provider, social_id) 고유 인덱스로 조회하고 토큰 발급에 필요한 컬럼만 선택
+def build_user_lookup(provider: str, social_id: str):
+    return select(*USER_COLUMNS).where(
+        User.social_provider == provider,
+        User.social_id == social_id
+    )
+
+# 소셜 사용자 upsert 구문 생성
+## INSERT ... ON CONFLICT (social_provider, social_id) DO UPDATE ... RETURNING 으로 조회/생성/갱신을 한 번의 왕복으로 처리
+def build_user_upsert(dialect_name: str, provider: str, social_id: str, email: str, name: str):
+    insert = UPSERT_INSERTS.get(dialect_name)
+    if insert is None:
+        return None
+
+    stmt = insert(User).values(
+        email=email,
+        name=name,
+        social_provider=provider,
+        social_id=social_id
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[User.social_provider, User.social_id],
+        set_={"email": stmt.excluded.email, "name": stmt.excluded.name}
+    ).returning(*USER_COLUMNS)
+
+# 소셜 계정으로 가입한 사용자 조회 후 없으면 신규 생성 - 비동기 세션
+async def _get_or_create_user_async(db: AsyncSession, provider: str, social_id: str, email: str, name: str):
+    stmt = build_user_upsert(db.get_bind().dialect.name, provider, social_id, email, name)
+    if stmt is not None:
+        # 소셜 계정 충돌은 갱신으로 처리되므로 남은 충돌은 이메일 고유 제약
+        try:
+            user = (await db.execute(stmt)).one()
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            raise EmailConflictError(email) from e
+        return user
+
+    # upsert를 지원하지 않는 DB - 조회 후 생성
+    lookup = build_user_lookup(provider, social_id)
+    user = (await db.execute(lookup)).first()
+
+    if not user:
+        user = User(
+            email=email,
+            name=name,
+            social_provider=provider,
+            social_id=social_id
+        )
+        db.add(user)
+        try:
+            # expire_on_commit=False 이므로 refresh(추가 SELECT) 없이 속성 사용 가능
+            await db.commit()
+        except IntegrityError as e:
+            # 동시 로그인으로 다른 요청이 먼저 생성한 경우 재조회 (없으면 이메일 충돌)
+            await db.rollback()
+            user = (await db.execute(lookup)).first()
+            if user is None:
+                raise EmailConflictError(email) from e
+
+    return user
+
+# 소셜 계정으로 가입한 사용자 조회 후 없으면 신규 생성 - 동기 세션
+def _get_or_create_user_sync(db: Session, provider: str, social_id: str, email: str, name: str):
+    stmt = build_user_upsert(db.get_bind().dialect.name, provider, social_id, email, name)
+    if stmt is not None:
+        # 소셜 계정 충돌은 갱신으로 처리되므로 남은 충돌은 이메일 고유 제약
+        try:
+            user = db.execute(stmt).one()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise EmailConflictError(email) from e
+        return user
+
+    # upsert를 지원하지 않는 DB - 조회 후 생성
+    lookup = build_user_lookup(provider, social_id)
+    user = db.execute(lookup).first()
+
+    if not user:
+        new_user = User(
+            email=email,
+            name=name,
+            social_provider=provider,
+            social_id=social_id
+        )
+        db.add(new_user)
+        try:
+            # commit 후 만료된 속성을 다시 읽지 않도록(refresh SELECT 생략) INSERT 직후 필요한 컬럼만 보관
+            db.flush()
+            user = CachedUser(new_user.id, new_user.email, new_user.name)
+            db.commit()
+        except IntegrityError as e:
+            # 동시 로그인으로 다른 요청이 먼저 생성한 경우 재조회 (없으면 이메일 충돌)
+            db.rollback()
+            user = db.execute(lookup).first()
+            if user is None:
+                raise EmailConflictError(email) from e
+
+    return user
+
+# 세션 종류에 따라 사용자 조회/생성
+## 동기 Session은 이벤트 루프를 막지 않도록 스레드풀에서 실행
+async def get_or_create_user(db: Union[AsyncSession, Session], provider: str, social_id: str, email: str, name: str):
+    if isinstance(db, AsyncSession):
+        return await _get_or_create_user_async(db, provider, social_id, email, name)
+    return await run_in_threadpool(_get_or_create_user_sync, db, provider, social_id, email, name)
+
+# 소셜 계정 사용자 캐시 (워커당 1개)
+user_cache = create_user_cache(USER_CACHE_CONFIG)
+
+# 진행 중인 사용자 조회/생성 - 같은 사용자의 동시 로그인은 DB 쿼리 한 번으로 처리
+user_lookups = SingleFlight()
+
+# 캐시를 거쳐 사용자 조회/생성
+## 캐시된 이메일 / 이름이 provider 계정 정보와 같으면 DB를 거치지 않고, 다르거나 없으면 upsert 후 캐시 갱신
+async def get_or_create_user_cached(db: Union[AsyncSession, Session], provider: str, social_id: str, email: str, name: str):
+    key = (provider, social_id)
+    if user_cache is not None:
+        user = await user_cache.get(key)
+        if user is not None and user.email == email and user.name == name:
+            return user
+        # 계정 정보가 바뀌었으면 갱신에 실패해도 이전 정보가 남지 않도록 먼저 제거
+        if user is not None:
+            await invalidate_user(provider, social_id)
+
+    user = await user_lookups.do(
+        (provider, social_id, email, name),
+        lambda: get_or_create_user(db, provider, social_id, email, name)
+    )
+    if user_cache is not None:
+        await user_cache.set(key, CachedUser(user.id, user.email, user.name))
+    return user
+
+# 사용자 정보가 바뀌었을 때 캐시에서 제거 (로그인 시 계정 정보 변경 / 사용자 가져오기 CLI)
+async def invalidate_user(provider: str, social_id: str) -> None:
+    if user_cache is not None:
+        await user_cache.delete((provider, social_id))
+
+# 여러 사용자 캐시 제거
+async def invalidate_users(keys: Iterable[Tuple[str, str]]) -> None:
+    await asyncio.gather(*(invalidate_user(provider, social_id) for provider, social_id in keys))
+
+# 소셜 로그인 공통 처리
+## provider 토큰 교환 -> 계정 정보 조회 -> 사용자 조회/생성 -> JWT 발급
+async def handle_social_login(provider: SocialProvider, request: Request, db: Union[AsyncSession, Session]) -> Dict[str, Any]:
+    client = getattr(request.app.state.oauth, provider.name)
+    try:
+        # provider에서 access token 발급
+        with LOGIN_STAGE_SECONDS.time(provider=provider.name, stage="token_exchange"):
+            token = await client.authorize_access_token(request)
+    except OAuthError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"OAuth 에러: {error.error}"
+        )
+
+    profile = await provider.fetch_profile(client, token)
+    if not profile.email:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{provider.display_name} 계정에 이메일 정보가 없습니다."
+        )
+
+    # DB에서 이미 소셜 계정으로 가입한 사용자 조회, 존재하지 않으면 신규 생성
+    try:
+        with LOGIN_STAGE_SECONDS.time(provider=provider.name, stage="user_upsert"):
+            user = await get_or_create_user_cached(db, provider.name, profile.social_id, profile.email, profile.name)
+    except EmailConflictError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 다른 로그인 방식으로 가입된 이메일입니다."
+        )
+
+    # 로그인 후 토큰 발급
+    with LOGIN_STAGE_SECONDS.time(provider=provider.name, stage="jwt_sign"):
+        jwt_token = create_access_token({"sub": user.email})
+        refresh_token = create_refresh_token({"sub": user.email})
+
+    return {
+        "jwt_token": jwt_token,
+        "refresh_token": refresh_token,
+        "user": {
+            "id": user.id,
+            "email": user.email,
+            "name": user.name,
+            "social_provider": provider.name
+        }
+    }
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import logging
+import os
+
+import httpx
+
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from auth_service.handlers.social_handler import SocialProvider
+from auth_service.handlers.github_social_handler import github_provider
+from auth_service.handlers.google_social_handler import google_provider
+from auth_service.handlers.kakao_social_handler import kakao_provider
+from auth_service.handlers.naver_social_handler import naver_provider
+from auth_service.handlers.oidc_social_handler import oidc_provider
+
+logger = logging.getLogger(__name__)
+
+# 소셜 로그인 provider 등록소 (provider 이름 -> provider)
+## 새 provider는 SocialProvider를 구현한 모듈을 추가하고 여기에 등록
+SOCIAL_PROVIDERS: Dict[str, SocialProvider] = {
+    provider.name: provider
+    for provider in (google_provider, kakao_provider, naver_provider, github_provider, oidc_provider)
+}
+
+# 이름으로 provider 조회 (미등록 provider는 None)
+def get_social_provider(name: str) -> Optional[SocialProvider]:
+    return SOCIAL_PROVIDERS.get(name)
+
+# provider별 OAuth 클라이언트 생성 (app.state.oauth)
+## 모든 provider가 공유 HTTP 클라이언트를 사용하며, 메타데이터 / JWKS 캐시는 provider 클라이언트별로 보관
+def create_oauth(http_client: httpx.AsyncClient) -> SimpleNamespace:
+    return SimpleNamespace(**{
+        name: provider.create_client(http_client) for name, provider in SOCIAL_PROVIDERS.items()
+    })
+
+# 메타데이터 디스크 스냅샷 적재 (파일이 없거나 읽을 수 없으면 무시)
+def load_oauth_snapshot(oauth: SimpleNamespace, path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        with open(path) as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError):
+        logger.warning("OAuth 메타데이터 스냅샷을 읽을 수 없습니다: %s", path, exc_info=True)
+        return
+
+    for name, oauth_client in vars(oauth).items():
+        if snapshot.get(name):
+            oauth_client.load_snapshot(snapshot[name])
+
+# 메타데이터 디스크 스냅샷 저장
+## 여러 워커가 동시에 저장해도 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+def save_oauth_snapshot(oauth: SimpleNamespace, path: Optional[str]) -> None:
+    if not path:
+        return
+    snapshot = {name: oauth_client.snapshot() for name, oauth_client in vars(oauth).items()}
+    snapshot = {name: value for name, value in snapshot.items() if value}
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w") as snapshot_file:
+            json.dump(snapshot, snapshot_file)
+        os.replace(temp_path, path)
+    except OSError:
+        logger.warning("OAuth 메타데이터 스냅샷을 저장할 수 없습니다: %s", path, exc_info=True)
+
+# 설정된 provider의 메타데이터 / 공개키를 동시에 미리 조회
+## timeout을 넘기거나 실패한 provider는 로그만 남기고 요청 시 조회 (스냅샷이 있으면 스냅샷 사용)
+async def prefetch_oauth_metadata(oauth: SimpleNamespace, timeout: float) -> None:
+    clients = {name: oauth_client for name, oauth_client in vars(oauth).items() if oauth_client.configured}
+    if not clients:
+        return
+
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(*(oauth_client.prefetch() for oauth_client in clients.values()), return_exceptions=True),
+            timeout
+        )
+    except asyncio.TimeoutError:
+        logger.warning("OAuth 메타데이터 조회 시간 초과 (%s초) - 요청 시 조회", timeout)
+        return
+
+    for name, result in zip(clients, results):
+        if isinstance(result, Exception):
+            logger.warning("%s 메타데이터 조회 실패 - 요청 시 조회", name, exc_info=result)
+
+# discovery 문서 주기적 재조회 후 스냅샷 저장 (앱 lifespan에서 백그라운드 태스크로 실행)
+async def refresh_oauth_metadata_periodically(oauth: SimpleNamespace, interval_seconds: float,
+                                              snapshot_path: Optional[str] = None) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for name, oauth_client in vars(oauth).items():
+            if not oauth_client.configured:
+                continue
+            try:
+                await oauth_client.refresh_metadata()
+            except Exception:
+                logger.exception("%s 메타데이터 재조회 실패", name)
+        save_oauth_snapshot(oauth, snapshot_path)
@@ -1,64 +1,261 @@
-from fastapi import FastAPI, Depends, HTTPException, status
-from fastapi.security import OAuth2AuthorizationCodeBearer
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
-from typing import Optional
+import asyncio
+import hashlib
+import logging
+import signal
+import time
+import uuid
 
-from auth_service.core.config import JWT_CONFIG
+from fastapi import HTTPException, status
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
-app = FastAPI(title="Auth Service", version="0.1.0")
+from auth_service.core.cache import TTLCache
+from auth_service.core.config import JWT_CONFIG, TOKEN_CACHE_CONFIG, TOKEN_STORE_CONFIG
+from auth_service.core.jwt_backends import BackendSelector, TokenError, get_unverified_header
+from auth_service.core.keys import KeyRegistry, SigningKey
+from auth_service.core.metrics import REGISTRY
+from auth_service.core.token_issuer import TokenIssuer
+from auth_service.core.token_store import RevocationFilter, TokenStore, create_token_store
 
-# OAuth2 토큰 생성
-oauth2_scheme = OAuth2AuthorizationCodeBearer(
-    authorizationUrl="login",
-    tokenUrl="token"
+logger = logging.getLogger(__name__)
+
+# 서명 키 레지스트리
+## 비대칭 키(RS*/ES*/EdDSA)를 사용하면 공개키를 JWKS로 배포하여 다른 서비스가 직접 토큰을 검증
+key_registry = KeyRegistry.from_config(JWT_CONFIG)
+
+# 현재 서명 키 레지스트리 조회
+def get_key_registry() -> KeyRegistry:
+    return key_registry
+
+# 키 링 재적재 (워커 재시작 없이 키 교체)
+## 새 키 링을 모두 만든 뒤 참조를 한 번에 교체하므로, 처리 중인 요청은 이전/새 키 링 중 하나만 사용
+## 적재에 실패하면 기존 키 링을 그대로 유지
+def reload_key_registry() -> KeyRegistry:
+    global key_registry
+    key_registry = KeyRegistry.from_config(JWT_CONFIG)
+
+    # 제거된 키로 검증된 payload가 남지 않도록 캐시 초기화
+    if token_cache is not None:
+        token_cache.clear()
+    return key_registry
+
+# SIGHUP 수신 시 키 링 재적재
+def install_key_reload_signal(loop: asyncio.AbstractEventLoop) -> None:
+    def handle_reload():
+        try:
+            registry = reload_key_registry()
+            logger.info("서명 키 링 재적재 완료 (active kid: %s, 키 %d개)", registry.active.kid, len(registry.keys))
+        except Exception:
+            logger.exception("서명 키 링 재적재 실패 - 기존 키 링 유지")
+
+    loop.add_signal_handler(signal.SIGHUP, handle_reload)
+
+# JWT 인코딩/디코딩 백엔드 (알고리즘별로 선택)
+jwt_backends = BackendSelector(JWT_CONFIG.backend)
+
+# 토큰 종류별 발급기 (access, refresh) - active 키로 서명하고 헤더에 kid 포함
+## 키 링 / 백엔드 / 설정이 바뀌면(재적재 등) 다음 발급 시 새로 생성
+_token_issuers: Optional[Tuple[tuple, TokenIssuer, TokenIssuer]] = None
+
+def get_token_issuers() -> Tuple[TokenIssuer, TokenIssuer]:
+    global _token_issuers
+    state = (key_registry, jwt_backends, JWT_CONFIG)
+    issuers = _token_issuers
+    if issuers is None or any(current is not cached for current, cached in zip(state, issuers[0])):
+        key = key_registry.active
+        backend = jwt_backends.for_algorithm(key.algorithm)
+        static_claims = {"issuer": JWT_CONFIG.issuer, "audience": JWT_CONFIG.audience}
+        issuers = _token_issuers = (
+            state,
+            TokenIssuer(key, backend, JWT_CONFIG.access_token_type,
+                        JWT_CONFIG.access_token_expire_minutes * 60, **static_claims),
+            TokenIssuer(key, backend, JWT_CONFIG.refresh_token_type,
+                        _refresh_token_lifetime_seconds(), **static_claims),
+        )
+    return issuers[1], issuers[2]
+
+# 토큰 헤더의 kid로 검증 키 조회
+## kid가 없는 토큰(kid 도입 이전 발급)은 active 키로 검증
+def _verifying_key(token: str) -> SigningKey:
+    registry = key_registry
+    kid = get_unverified_header(token).get("kid")
+    if kid is None:
+        return registry.active
+    # 헤더는 서명 검증 전이므로 문자열이 아닌 kid(list / dict 등)는 조회하지 않고 거부
+    if not isinstance(kid, str):
+        raise TokenError("Invalid key id")
+
+    key = registry.get(kid)
+    if key is None:
+        raise TokenError(f"Unknown key id: {kid}")
+    return key
+
+# JWT 디코딩 및 서명/만료/발급자/대상 검증 - 실패 시 TokenError
+## JWT_ISSUER / JWT_AUDIENCE를 설정하면 같은 키로 서명된 다른 발급자 / 대상의 토큰은 거부
+def _decode_token(token: str) -> Dict[str, Any]:
+    key = _verifying_key(token)
+    return jwt_backends.for_algorithm(key.algorithm).decode(token, key, JWT_CONFIG.issuer, JWT_CONFIG.audience)
+
+# 토큰 폐기/교체 이력 저장소
+token_store = create_token_store(TOKEN_STORE_CONFIG)
+
+# 현재 토큰 저장소 조회
+def get_token_store() -> TokenStore:
+    return token_store
+
+# 폐기된 access token jti의 Bloom filter (저장소 앞단)
+## 앱 시작 시 저장소 기준으로 생성하고, 이후 폐기는 즉시 반영 / 다른 워커의 폐기는 주기적으로 동기화
+revocation_filter = RevocationFilter(
+    token_store,
+    capacity=TOKEN_STORE_CONFIG["filter_capacity"],
+    error_rate=TOKEN_STORE_CONFIG["filter_error_rate"],
+    max_false_positive_rate=TOKEN_STORE_CONFIG["filter_max_false_positive_rate"],
+)
+
+# 현재 폐기 filter 조회
+def get_revocation_filter() -> RevocationFilter:
+    return revocation_filter
+
+# 검증이 끝난 access token payload 캐시
+## 같은 토큰이 만료 전까지 반복 검증되므로 jwt.decode 대신 digest 기반 조회로 처리
+token_cache = TTLCache(
+    max_size=TOKEN_CACHE_CONFIG["max_size"],
+    ttl_seconds=TOKEN_CACHE_CONFIG["ttl_seconds"],
+) if TOKEN_CACHE_CONFIG["enabled"] else None
+
+# 토큰 캐시 키 생성 (원본 토큰 대신 digest 저장)
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+# 토큰 캐시 통계 조회 (hit/miss/eviction)
+def get_token_cache_stats() -> Dict[str, int]:
+    if token_cache is None:
+        return {}
+    return token_cache.stats()
+
+# 토큰 캐시 / 폐기 filter 통계 (/metrics)
+## 검증 경로에 기록 비용을 더하지 않도록 각 객체가 누적한 값을 scrape 시점에 복사
+TOKEN_CACHE_REQUESTS = REGISTRY.counter(
+    "auth_token_cache_requests_total", "access token 검증 캐시 조회 수", ("result",)
 )
+TOKEN_CACHE_EVICTIONS = REGISTRY.counter("auth_token_cache_evictions_total", "access token 검증 캐시에서 밀려난 항목 수")
+TOKEN_CACHE_ENTRIES = REGISTRY.gauge("auth_token_cache_entries", "access token 검증 캐시 항목 수")
+REVOCATION_FILTER_POSITIVES = REGISTRY.counter(
+    "auth_revocation_filter_positives_total", "폐기 filter 양성(저장소 확인) 수", ("result",)
+)
+REVOCATION_FILTER_REBUILDS = REGISTRY.counter("auth_revocation_filter_rebuilds_total", "폐기 filter 재생성 수")
+REVOCATION_FILTER_ENTRIES = REGISTRY.gauge("auth_revocation_filter_entries", "폐기 filter 항목 수")
+REVOCATION_FILTER_FALSE_POSITIVE_RATE = REGISTRY.gauge(
+    "auth_revocation_filter_estimated_false_positive_rate", "폐기 filter 예상 거짓 양성 비율"
+)
+
+@REGISTRY.collector
+def _collect_token_metrics() -> None:
+    stats = get_token_cache_stats()
+    if stats:
+        TOKEN_CACHE_REQUESTS.set(stats["hits"], result="hit")
+        TOKEN_CACHE_REQUESTS.set(stats["misses"], result="miss")
+        TOKEN_CACHE_EVICTIONS.set(stats["evictions"])
+        TOKEN_CACHE_ENTRIES.set(stats["size"])
+
+    stats = revocation_filter.stats()
+    REVOCATION_FILTER_POSITIVES.set(stats["positives"] - stats["false_positives"], result="revoked")
+    REVOCATION_FILTER_POSITIVES.set(stats["false_positives"], result="false_positive")
+    REVOCATION_FILTER_REBUILDS.set(stats["rebuilds"])
+    REVOCATION_FILTER_ENTRIES.set(stats["size"])
+    REVOCATION_FILTER_FALSE_POSITIVE_RATE.set(stats["estimated_false_positive_rate"])
 
 # 토큰 생성 함수
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-    to_encode = data.copy()
+    access_issuer, _ = get_token_issuers()
 
-    # 토큰 만료 시간 설정
+    # 토큰 만료 시간 설정 (미지정 시 access_token_expire_minutes)
     if expires_delta:
-        expire = datetime.now() + expires_delta
-    else:
-        expire = datetime.now() + timedelta(minutes=JWT_CONFIG["access_token_expire_minutes"])
-    to_encode.update({
-        "exp": expire,
-        "token_type": JWT_CONFIG["access_token_type"]
-        })
-
-    # JWT 토큰 인코딩
-    encoded_jwt = jwt.encode(to_encode, JWT_CONFIG["secret_key"], algorithm=JWT_CONFIG["algorithm"])
-    return encoded_jwt
+        return access_issuer.issue(data, int(expires_delta.total_seconds()))
+    return access_issuer.issue(data)
 
 # 갱신 토큰 생성 함수
-def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
-    to_encode = data.copy()
+## jti(토큰 ID)와 fid(family ID)를 포함하며, 교체 발급 시 기존 family ID를 이어받음
+def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None, family_id: Optional[str] = None):
+    _, refresh_issuer = get_token_issuers()
+    family_id = family_id or uuid.uuid4().hex
 
-    # 토큰 만료 시간 설정
-    expire = datetime.now() + timedelta(days=JWT_CONFIG["refresh_token_expire_days"])
-    to_encode.update({
-        "exp": expire,
-        "token_type": JWT_CONFIG["refresh_token_type"]
-    })
-
-    # JWT 토큰 인코딩
-    encoded_jwt = jwt.encode(to_encode, JWT_CONFIG["secret_key"], algorithm=JWT_CONFIG["algorithm"])
-    return encoded_jwt
+    # 토큰 만료 시간 설정 (미지정 시 refresh_token_expire_days)
+    if expires_delta:
+        return refresh_issuer.issue(data, int(expires_delta.total_seconds()), fid=family_id)
+    return refresh_issuer.issue(data, fid=family_id)
 
 # 토큰 갱신 함수
-def refresh_token(token: str):
+## refresh token은 1회만 사용 가능하며, 사용할 때마다 같은 family의 새 refresh token을 발급 (rotation)
+## 이미 사용된 refresh token이 다시 제시되면 탈취로 간주하여 family 전체를 폐기
+def refresh_token(token: str) -> Dict[str, str]:
+    payload = verify_refresh_token(token)
+
+    # jti가 없는 토큰(rotation 도입 이전 발급)은 토큰 digest를 jti로 사용
+    jti = payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+    family_id = payload["fid"]
+
+    if not token_store.mark_used(jti, payload["exp"]):
+        token_store.revoke_family(family_id, time.time() + _refresh_token_lifetime_seconds())
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = {"sub": payload.get("sub")}
+    return {
+        "jwt_token": create_access_token(user),
+        "refresh_token": create_refresh_token(user, family_id=family_id)
+    }
+
+# refresh token 수명 (초) - family 폐기 기록은 family에서 마지막으로 발급될 수 있는 토큰의 만료까지 유지
+def _refresh_token_lifetime_seconds() -> int:
+    return JWT_CONFIG.refresh_token_expire_days * 24 * 60 * 60
+
+# 토큰 폐기 함수
+def revoke_refresh_token(token: str) -> None:
     payload = verify_refresh_token(token)
-    return create_access_token({"sub": payload.get("sub")})
+    jti = payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+    token_store.revoke(jti, payload["exp"])
+    token_store.revoke_family(payload["fid"], time.time() + _refresh_token_lifetime_seconds())
+
+# access token 폐기 여부 확인 - Bloom filter에 없으면 저장소 조회 없이 통과
+def _check_access_token_revoked(payload: Dict[str, Any]) -> None:
+    jti = payload.get("jti")
+    if jti is not None and revocation_filter.is_revoked(jti, payload.get("exp")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Revoked token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+# access token 폐기 함수
+def revoke_access_token(token: str) -> None:
+    payload = verify_token(token)
+    if payload.get("jti") is None:
+        return
+
+    revocation_filter.revoke(payload["jti"], payload["exp"])
+    if token_cache is not None:
+        token_cache.pop(_token_cache_key(token))
 
 # 토큰 검증 함수
 def verify_token(token: str):
+    # 이미 검증된 토큰이면 캐시된 payload 반환
+    if token_cache is not None:
+        cache_key = _token_cache_key(token)
+        payload = token_cache.get(cache_key)
+        if payload is not None:
+            _check_access_token_revoked(payload)
+            return dict(payload)
+
     try:
-        payload = jwt.decode(token, JWT_CONFIG["secret_key"], algorithms=[JWT_CONFIG["algorithm"]])
+        payload = _decode_token(token)
 
+        # refresh token(fid 포함)은 family 폐기 여부를 확인하지 않으므로 access token으로 인정하지 않음
         token_type = payload.get("token_type")
-        if token_type != JWT_CONFIG["access_token_type"]:
+        if token_type != JWT_CONFIG.access_token_type or "fid" in payload:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token type",
@@ -73,8 +270,14 @@ def verify_token(token: str):
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        _check_access_token_revoked(payload)
+
+        # 토큰 만료 시점(exp)까지 캐시
+        if token_cache is not None:
+            token_cache.set(cache_key, dict(payload), expires_at=payload.get("exp"))
+
         return payload
-    except JWTError:
+    except TokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
@@ -85,28 +288,52 @@ def verify_token(token: str):
 def verify_refresh_token(token: str):
     try:
         # "refresh token" 검증
-        payload = jwt.decode(token, JWT_CONFIG["secret_key"], algorithms=JWT_CONFIG["algorithm"])
+        payload = _decode_token(token)
 
         token_type = payload.get("token_type")
-        if token_type != JWT_CONFIG["refresh_token_type"]:
+        if token_type != JWT_CONFIG.refresh_token_type:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token type",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        user_id = payload.get("sub")
-        if user_id is None:
+        # family ID가 없는 토큰은 로그아웃 / 재사용 감지 대상이 아니므로 거부 (새 family를 만들지 않음)
+        user_id, family_id = payload.get("sub"), payload.get("fid")
+        if user_id is None or not isinstance(family_id, str):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid refresh token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        # 폐기된 토큰 / family 확인
+        jti = payload.get("jti")
+        if (jti is not None and token_store.is_revoked(jti)) or token_store.is_family_revoked(family_id):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Revoked refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
         return payload
-    except JWTError:
+    except TokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+
+# 토큰 일괄 검증 함수
+## 토큰별로 active 여부와 claims(또는 실패 사유)를 반환하며, 중복 토큰은 한 번만 검증
+def introspect_tokens(tokens: List[str]) -> List[Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    for token in tokens:
+        if token in results:
+            continue
+        try:
+            results[token] = {"active": True, "claims": verify_token(token)}
+        except HTTPException as e:
+            results[token] = {"active": False, "error": e.detail}
+
+    return [results[token] for token in tokens]
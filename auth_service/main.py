@@ -1,5 +1,88 @@
+import asyncio
+import logging
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .routers import auth_router
+from fastapi.concurrency import run_in_threadpool
+
+from .core.config import HTTP_CLIENT_CONFIG, OAUTH_METADATA_CONFIG, TOKEN_STORE_CONFIG
+from .core.database import async_engine, engine
+from .core.http_client import create_http_client
+from .core.metrics import MetricsMiddleware
+from .core.responses import FastJSONResponse
+from .core.token_store import compact_periodically, sync_filter_periodically
+from .handlers.social_providers import (
+    create_oauth,
+    load_oauth_snapshot,
+    prefetch_oauth_metadata,
+    refresh_oauth_metadata_periodically,
+    save_oauth_snapshot
+)
+from .handlers.token_handler import get_revocation_filter, get_token_store, install_key_reload_signal
+from .routers import auth_router, jwks_router, metrics_router
+
+logger = logging.getLogger(__name__)
+
+# 앱 시작/종료 시 실행할 작업
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # SIGHUP 수신 시 서명 키 링 재적재 (메인 스레드에서만 시그널 핸들러 등록 가능)
+    try:
+        install_key_reload_signal(asyncio.get_running_loop())
+    except (NotImplementedError, RuntimeError, ValueError):
+        pass
+
+    # 외부 API(OAuth provider) 호출용 공유 HTTP 클라이언트 (워커당 1개, keep-alive 커넥션 재사용)
+    app.state.http_client = create_http_client(HTTP_CLIENT_CONFIG)
+    app.state.oauth = create_oauth(app.state.http_client)
+
+    # provider discovery 문서 / 공개키(JWKS) 캐시 준비 - 디스크 스냅샷을 먼저 적재한 뒤 최신 값으로 조회
+    load_oauth_snapshot(app.state.oauth, OAUTH_METADATA_CONFIG["snapshot_path"])
+    await prefetch_oauth_metadata(app.state.oauth, OAUTH_METADATA_CONFIG["prefetch_timeout"])
+    save_oauth_snapshot(app.state.oauth, OAUTH_METADATA_CONFIG["snapshot_path"])
+
+    # 저장소의 폐기 목록으로 access token 폐기 filter 생성
+    try:
+        await run_in_threadpool(get_revocation_filter().rebuild)
+    except Exception:
+        logger.exception("폐기 filter 생성 실패 - 이후 동기화 시 재시도")
+
+    # 토큰 저장소 만료 항목 주기적 정리 / 다른 워커의 폐기 항목 동기화
+    background_tasks = [
+        asyncio.create_task(
+            compact_periodically(get_token_store, TOKEN_STORE_CONFIG["compaction_interval_seconds"])
+        ),
+    ]
+    # provider discovery 문서 주기적 재조회 / provider별 id_token 검증용 공개키(JWKS) 만료 전 재조회
+    background_tasks.append(asyncio.create_task(refresh_oauth_metadata_periodically(
+        app.state.oauth, OAUTH_METADATA_CONFIG["refresh_interval_seconds"], OAUTH_METADATA_CONFIG["snapshot_path"]
+    )))
+    for oauth_client in vars(app.state.oauth).values():
+        if oauth_client.jwks is not None:
+            background_tasks.append(asyncio.create_task(
+                oauth_client.jwks.refresh_periodically(app.state.http_client)
+            ))
+    if get_token_store().blocking:
+        background_tasks.append(asyncio.create_task(
+            sync_filter_periodically(get_revocation_filter, TOKEN_STORE_CONFIG["filter_sync_interval_seconds"])
+        ))
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+
+        await app.state.http_client.aclose()
+
+        # 풀에 남아 있는 DB 커넥션 정리
+        engine.dispose()
+        if async_engine is not None:
+            await async_engine.dispose()
+
+auth_app = FastAPI(title="Auth Service", version="0.1.0", lifespan=lifespan, default_response_class=FastJSONResponse)
+auth_app.include_router(auth_router.router, prefix="/auth", tags=["auth"])
+auth_app.include_router(jwks_router.router, tags=["jwks"])
+auth_app.include_router(metrics_router.router, tags=["metrics"])
 
-auth_app = FastAPI(title="Auth Service", version="0.1.0")
-auth_app.include_router(auth_router.router, prefix="/auth", tags=["auth"])
\ No newline at end of file
+# 라우트별 요청 처리 시간 기록
+auth_app.add_middleware(MetricsMiddleware)
@@ -0,0 +1,40 @@
+from alembic import op
+from sqlalchemy import text
+from typing import Sequence
+
+# 운영 중(로그인 트래픽 처리 중)에도 안전한 인덱스 변경
+## Postgres는 CREATE / DROP INDEX CONCURRENTLY로 테이블 쓰기 잠금 없이 인덱스를 생성/삭제
+## CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit 블록에서 실행
+## 그 외 DB(SQLite 등)는 일반 CREATE / DROP INDEX 사용
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+# 이전에 실패한 CONCURRENTLY 생성으로 남은 유효하지 않은(INVALID) 인덱스인지 확인 (SQL 생성 모드에서는 확인하지 않음)
+def _is_invalid_index(name: str) -> bool:
+    if op.get_context().as_sql:
+        return False
+    return bool(op.get_bind().execute(text(
+        "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name AND NOT i.indisvalid"
+    ), {"name": name}).scalar())
+
+# 인덱스 생성 - 이미 있으면 건너뛰고, 실패로 남은 INVALID 인덱스는 삭제 후 다시 생성
+def create_index_online(name: str, table: str, columns: Sequence[str], unique: bool = False) -> None:
+    if not _is_postgresql():
+        op.create_index(name, table, list(columns), unique=unique)
+        return
+
+    with op.get_context().autocommit_block():
+        if _is_invalid_index(name):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        op.create_index(name, table, list(columns), unique=unique, postgresql_concurrently=True, if_not_exists=True)
+
+# 인덱스 삭제
+def drop_index_online(name: str, table: str) -> None:
+    if not _is_postgresql():
+        op.drop_index(name, table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,35 @@
+"""create auth tables
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# 기존 스키마 (Base.metadata.create_all로 생성하던 테이블)
+## 이미 테이블이 있는 DB는 alembic stamp 0001 후 upgrade
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("social_provider", sa.String(), nullable=False),
+        sa.Column("social_id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_social_provider", "users", ["social_provider"])
+    op.create_index("ix_users_social_id", "users", ["social_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_table("users")
@@ -0,0 +1,28 @@
+"""users (social_provider, social_id) unique index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from auth_service.migrations.online import create_index_online, drop_index_online
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+# 로그인 조회 / upsert 충돌 대상인 (social_provider, social_id) 복합 고유 인덱스로 교체
+## 같은 social_id라도 provider가 다르면 다른 계정이므로 social_id 단독 고유 제약은 제거
+## 이메일 고유 제약(ix_users_email)은 유지 - 토큰 sub가 이메일이므로 다른 provider 계정도 같은 이메일을 사용할 수 없음 (로그인 시 409)
+## 사용자 수가 많은 운영 DB에서도 로그인(쓰기)을 막지 않도록 CONCURRENTLY로 생성/삭제
+def upgrade() -> None:
+    create_index_online("ux_users_social_provider_social_id", "users", ["social_provider", "social_id"], unique=True)
+    drop_index_online("ix_users_social_id", "users")
+    drop_index_online("ix_users_social_provider", "users")
+
+
+def downgrade() -> None:
+    create_index_online("ix_users_social_provider", "users", ["social_provider"])
+    create_index_online("ix_users_social_id", "users", ["social_id"], unique=True)
+    drop_index_online("ux_users_social_provider_social_id", "users")
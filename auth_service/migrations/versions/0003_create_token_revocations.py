@@ -0,0 +1,33 @@
+"""create token_revocations
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+# 토큰 폐기/교체 이력 테이블 (TOKEN_STORE_BACKEND=database)
+## 기존 스키마(0001)에는 없던 테이블이므로 stamp 0001 후 upgrade한 DB에도 생성
+## 이 테이블까지 0001에서 생성하던 이전 버전으로 만든 DB는 이미 있으므로 건너뜀
+def upgrade() -> None:
+    op.create_table(
+        "token_revocations",
+        sa.Column("kind", sa.String(), primary_key=True),
+        sa.Column("token_id", sa.String(), primary_key=True),
+        sa.Column("expires_at", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.Float(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_token_revocations_expires_at", "token_revocations", ["expires_at"], if_not_exists=True)
+    op.create_index("ix_token_revocations_created_at", "token_revocations", ["created_at"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_table("token_revocations")
@@ -1 +0,0 @@
-from .auth_model import *
\ No newline at end of file
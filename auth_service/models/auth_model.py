@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy import Column, Float, Index, Integer, String, DateTime, func
 from sqlalchemy.orm import Session, declarative_base
 
 Base = declarative_base()
@@ -10,6 +10,20 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)  # 기본키
     email = Column(String, unique=True, index=True, nullable=False) # 고유키
     name = Column(String, nullable=True)
-    social_provider = Column(String, nullable=False, index=True)
-    social_id = Column(String, nullable=False, index=True, unique=True) # 고유키
+    social_provider = Column(String, nullable=False)
+    social_id = Column(String, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        # 소셜 계정 고유키 - 로그인 시 (provider, social_id) 조회 / upsert 충돌 대상
+        Index("ux_users_social_provider_social_id", "social_provider", "social_id", unique=True),
+    )
+
+# 토큰 폐기/교체 이력 (refresh token 재사용 감지 및 폐기 목록)
+class TokenRevocation(Base):
+    __tablename__ = 'token_revocations'
+
+    kind = Column(String, primary_key=True)  # used / revoked / family
+    token_id = Column(String, primary_key=True)  # jti 또는 family ID
+    expires_at = Column(Integer, nullable=False, index=True)  # 원래 토큰 만료 시각 (epoch 초), 정리 기준
+    created_at = Column(Float, nullable=False, index=True)  # 등록 시각 (epoch 초), 폐기 filter 동기화 기준
@@ -1 +0,0 @@
-from .auth_router import *
\ No newline at end of file
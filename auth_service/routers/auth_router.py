@@ -1,49 +1,132 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from typing import Optional, Union
 from pydantic import BaseModel
 
+from auth_service.core.config import JWT_CONFIG
 from auth_service.core.database import get_db
-from auth_service.handlers.google_social_handler import handle_auth_google
-from auth_service.handlers.token_handler import refresh_token
+from auth_service.core.jwt_backends import TokenError, get_unverified_claims
+from auth_service.core.rate_limit import RATE_LIMITS, check_rate_limit
+from auth_service.core.responses import FastJSONResponse
+from auth_service.handlers.social_handler import handle_social_login
+from auth_service.handlers.social_providers import get_social_provider
+from auth_service.handlers.token_handler import (
+    get_token_store,
+    introspect_tokens,
+    refresh_token,
+    revoke_access_token,
+    revoke_refresh_token
+)
+from auth_service.schemas.auth_schemas import LoginResponse, TokenIntrospectRequest, TokenIntrospectResponse, TokenResponse
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 요청 제한 키 - 클라이언트 IP
+def _client_ip(request: Request) -> Optional[str]:
+    return request.client.host if request.client else None
+
+# 소셜 로그인 요청 제한 (IP별) - provider 토큰 교환 / DB 조회 전에 확인
+async def limit_login(request: Request):
+    await check_rate_limit(RATE_LIMITS["login_ip"], _client_ip(request))
+
+# 응답 직렬화
+## response_model은 응답 형식(OpenAPI 문서)만 정의하고, 응답은 FastJSONResponse로 한 번만 직렬화
+## Response를 반환하면 FastAPI의 응답 검증 / 직렬화 단계를 거치지 않음
+
 # 소셜 로그인 라우터
-@router.post(path="/login/{provider}", description="소셜 로그인 / 회원가입")
-async def auth_social(provider: str, request: Request, db: Session = Depends(get_db)):
+@router.post(path="/login/{provider}", response_model=LoginResponse, dependencies=[Depends(limit_login)], description="소셜 로그인 / 회원가입")
+async def auth_social(provider: str, request: Request, db: Union[AsyncSession, Session] = Depends(get_db)):
 
-    # provier에 따라 로직 분기
+    # provider 등록소에서 handler 조회
     if not provider:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Provider is required"
         )
-    
+
+    social_provider = get_social_provider(provider)
+    if social_provider is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"지원하지 않는 provider입니다: {provider}"
+        )
+
     try:
         # Stateless를 위해 handler에서 JWT을 발급 후 반환
-        if provider == "google":
-            result = await handle_auth_google(request, db)
-            return JSONResponse(
-                content=result,
-                status_code=status.HTTP_200_OK
-            )
-    except Exception as e:
+        return FastJSONResponse(await handle_social_login(social_provider, request, db))
+    except HTTPException:
+        raise
+    except Exception:
+        # 예외 메시지(SQL 등 내부 정보)는 응답에 포함하지 않고 로그로만 남김
+        logger.exception("소셜 로그인 실패 (provider: %s)", provider)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
+            detail="로그인에 실패했습니다."
         )
 
 # 토큰 갱신 클래스
 class TokenRefreshRequest(BaseModel):
     refresh_token: str
 
+# 요청 제한 키 - refresh token의 family ID (로그인 세션)
+## 서명 검증 전이므로 다른 사용자가 알 수 없는 family ID를 사용 (sub를 키로 쓰면 위조 토큰으로 다른 사용자를 제한할 수 있음)
+def _refresh_token_family(token: str) -> Optional[str]:
+    try:
+        family_id = get_unverified_claims(token).get("fid")
+    except TokenError:
+        return None
+    return family_id if isinstance(family_id, str) else None
+
+# 토큰 갱신 요청 제한 (IP별 / 로그인 세션별)
+async def limit_refresh(request: Request, token_request: TokenRefreshRequest):
+    await check_rate_limit(RATE_LIMITS["refresh_ip"], _client_ip(request))
+    await check_rate_limit(RATE_LIMITS["refresh_subject"], _refresh_token_family(token_request.refresh_token))
+
 # 토큰 갱신 라우터
-@router.post(path="/token/refresh")
-async def token_refresh(request: Request, token_request: TokenRefreshRequest, db: Session = Depends(get_db)):
-    new_jmt_token = refresh_token(token_request.refresh_token)
-
-    return JSONResponse(
-        content={"jwt_token": new_jmt_token},
-        status_code=status.HTTP_200_OK
-    )
\ No newline at end of file
+@router.post(path="/token/refresh", response_model=TokenResponse, dependencies=[Depends(limit_refresh)])
+async def token_refresh(token_request: TokenRefreshRequest):
+    # 새 access token과 교체된 refresh token 발급
+    return FastJSONResponse(await _call_with_token_store(refresh_token, token_request.refresh_token))
+
+# 토큰 폐기 클래스
+class TokenRevokeRequest(BaseModel):
+    refresh_token: str
+    access_token: Optional[str] = None
+
+# 토큰 폐기 라우터 (로그아웃)
+## refresh token과 같은 family의 토큰을 모두 폐기하고, access token이 주어지면 함께 폐기
+@router.post(path="/token/revoke")
+async def token_revoke(token_request: TokenRevokeRequest):
+    await _call_with_token_store(revoke_refresh_token, token_request.refresh_token)
+    if token_request.access_token is not None:
+        await _call_with_token_store(revoke_access_token, token_request.access_token)
+
+    return {}
+
+# 토큰 저장소가 DB 등 블로킹 I/O를 사용하면 스레드풀에서 실행
+async def _call_with_token_store(func, *args):
+    if get_token_store().blocking:
+        return await run_in_threadpool(func, *args)
+    return func(*args)
+
+# 토큰 검증(introspection) 라우터
+## 게이트웨이 등 다른 서비스가 여러 요청의 토큰을 한 번의 호출로 검증할 수 있도록 일괄 검증 지원
+## access token만 검증하며, refresh token은 active: false (Invalid token type)
+@router.post(path="/token/introspect", response_model=TokenIntrospectResponse, description="토큰 검증 (단일 / 일괄)")
+async def token_introspect(introspect_request: TokenIntrospectRequest):
+    tokens = introspect_request.token_list()
+
+    if len(tokens) > JWT_CONFIG.introspect_max_tokens:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {JWT_CONFIG.introspect_max_tokens}개의 토큰만 검증할 수 있습니다."
+        )
+
+    # 폐기 filter 양성이면 토큰 저장소를 조회하므로 refresh / revoke와 같이 스레드풀에서 실행
+    return FastJSONResponse({"results": await _call_with_token_store(introspect_tokens, tokens)})
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Request, Response, status
+
+from auth_service.handlers.token_handler import get_key_registry
+
+router = APIRouter()
+
+# 공개키(JWKS) 라우터
+## 미리 직렬화한 응답을 그대로 반환하고, ETag가 일치하면 304로 본문 전송 생략
+@router.get(path="/.well-known/jwks.json", description="토큰 검증용 공개키 목록 (JWKS)")
+async def jwks(request: Request):
+    document = get_key_registry().jwks_document
+    headers = {"ETag": document.etag, "Cache-Control": document.cache_control}
+
+    if request.headers.get("if-none-match") == document.etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=document.body, media_type="application/json", headers=headers)
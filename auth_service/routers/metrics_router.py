@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+
+from auth_service.core.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter()
+
+# 메트릭 라우터 (Prometheus scrape 대상)
+@router.get(path="/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
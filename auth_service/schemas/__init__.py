@@ -1 +0,0 @@
-from .auth_schemas import *
\ No newline at end of file
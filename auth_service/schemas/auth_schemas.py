@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, model_validator
+from typing import Any, Dict, List, Optional
 
 # 클라이언트로부터 받을 데이터를 정의하는 클래스
 class UserBase(BaseModel):
@@ -12,9 +12,45 @@ class UserCreate(UserBase):
     social_id: str
 
 # 사용자 정보 응답 클래스
-class UserResponse(UserBase):
+## 응답 값은 DB에 저장된 값이므로 이메일 형식을 다시 검증하지 않음
+class UserResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
+    email: str
+    name: Optional[str] = None
     social_provider: str
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+# 토큰 발급 응답 클래스 (토큰 갱신)
+class TokenResponse(BaseModel):
+    jwt_token: str
+    refresh_token: str
+
+# 소셜 로그인 응답 클래스
+class LoginResponse(TokenResponse):
+    user: UserResponse
+
+# 토큰 검증(introspection) 요청 클래스 - 단일 토큰(token) 또는 토큰 목록(tokens) 중 하나
+class TokenIntrospectRequest(BaseModel):
+    token: Optional[str] = None
+    tokens: Optional[List[str]] = None
+
+    @model_validator(mode="after")
+    def check_token_or_tokens(self):
+        if (self.token is None) == (self.tokens is None):
+            raise ValueError("token 또는 tokens 중 하나만 입력해야 합니다.")
+        return self
+
+    # 요청에 포함된 토큰 목록 반환
+    def token_list(self) -> List[str]:
+        return [self.token] if self.token is not None else self.tokens
+
+# 토큰별 검증 결과 클래스
+class TokenIntrospectResult(BaseModel):
+    active: bool
+    claims: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+# 토큰 검증 응답 클래스 - 요청 토큰 순서대로 결과 반환
+class TokenIntrospectResponse(BaseModel):
+    results: List[TokenIntrospectResult]
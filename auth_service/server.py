@@ -0,0 +1,150 @@
+import importlib.util
+import logging
+import math
+import os
+import sys
+
+from typing import Any, Dict, Mapping, Optional
+
+from auth_service.core.config import SERVER_CONFIG, TOKEN_STORE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 운영 서버 실행
+## python -m auth_service.server
+## gunicorn이 있으면 앱을 마스터 프로세스에서 미리 적재(preload)한 뒤 CPU 수만큼 uvicorn 워커를 fork
+## gunicorn이 없으면(Windows 등) uvicorn의 멀티 프로세스 모드로 실행
+
+APP = "auth_service.main:auth_app"
+
+# cgroup v2 CPU 할당량 (컨테이너 CPU limit) - 제한이 없거나 확인할 수 없으면 None
+def _cgroup_cpu_limit(path: str = "/sys/fs/cgroup/cpu.max") -> Optional[float]:
+    try:
+        with open(path) as cpu_max:
+            quota, period = cpu_max.read().split()[:2]
+    except (OSError, ValueError):
+        return None
+    if quota == "max":
+        return None
+    return int(quota) / int(period)
+
+# 사용 가능한 CPU 수 (CPU affinity와 컨테이너 CPU limit 중 작은 값, 최소 1)
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(cpus, 1)
+
+# 워커 프로세스 수 (설정값이 0이면 CPU 수)
+def worker_count(config: Mapping[str, Any]) -> int:
+    return config["workers"] or available_cpus()
+
+# 워커 단위 저장소(memory)로는 여러 워커에서 refresh token 재사용 감지 / 폐기가 공유되지 않으므로 실행 거부
+def check_token_store(config: Mapping[str, Any], token_store_config: Mapping[str, Any] = TOKEN_STORE_CONFIG) -> None:
+    workers = worker_count(config)
+    if workers > 1 and token_store_config["backend"] == "memory":
+        raise SystemExit(
+            f"워커 {workers}개에서 memory 토큰 저장소를 사용할 수 없습니다. "
+            "TOKEN_STORE_BACKEND=database로 설정하거나 SERVER_WORKERS=1로 실행하세요."
+        )
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+# uvicorn 이벤트 루프 / HTTP 파서 - uvloop / httptools가 설치되어 있으면 사용
+def uvicorn_options(config: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "limit_concurrency": config["limit_concurrency"] or None,
+        "access_log": config["access_log"],
+        "forwarded_allow_ips": config["forwarded_allow_ips"],
+    }
+
+# gunicorn 설정
+def gunicorn_options(config: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "bind": f"{config['host']}:{config['port']}",
+        "workers": worker_count(config),
+        "backlog": config["backlog"],
+        "keepalive": config["keepalive_timeout"],
+        "max_requests": config["max_requests"],
+        "max_requests_jitter": config["max_requests_jitter"],
+        "graceful_timeout": config["graceful_timeout"],
+        "preload_app": True,
+        "accesslog": "-" if config["access_log"] else None,
+        "forwarded_allow_ips": config["forwarded_allow_ips"],
+    }
+
+# fork 후 마스터에서 만든 DB 커넥션 풀을 워커에서 공유하지 않도록 초기화
+## 앱을 미리 적재하므로 SIGHUP(gunicorn 워커 재시작) 후에도 마스터의 키 링이 그대로 복사됨 - 워커에서 키 링 재적재
+def _post_fork(server, worker) -> None:
+    from auth_service.core.database import async_engine, engine
+    from auth_service.handlers.token_handler import reload_key_registry
+
+    engine.dispose(close=False)
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=False)
+
+    try:
+        registry = reload_key_registry()
+        logger.info("서명 키 링 재적재 완료 (active kid: %s, 키 %d개)", registry.active.kid, len(registry.keys))
+    except Exception:
+        logger.exception("서명 키 링 재적재 실패 - 미리 적재한 키 링 사용")
+
+def run_gunicorn(config: Mapping[str, Any]) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    try:
+        from uvicorn_worker import UvicornWorker
+    except ImportError:
+        from uvicorn.workers import UvicornWorker
+
+    options = uvicorn_options(config)
+    worker_class = type("AuthUvicornWorker", (UvicornWorker,), {
+        "CONFIG_KWARGS": {key: options[key] for key in ("loop", "http", "limit_concurrency")}
+    })
+
+    class AuthApplication(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options(config).items():
+                self.cfg.set(key, value)
+            self.cfg.set("worker_class", worker_class)
+            self.cfg.set("post_fork", _post_fork)
+
+        def load(self):
+            from auth_service.main import auth_app
+            return auth_app
+
+    AuthApplication().run()
+
+def run_uvicorn(config: Mapping[str, Any]) -> None:
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=config["host"],
+        port=config["port"],
+        workers=worker_count(config),
+        backlog=config["backlog"],
+        timeout_keep_alive=config["keepalive_timeout"],
+        limit_max_requests=config["max_requests"] or None,
+        timeout_graceful_shutdown=config["graceful_timeout"],
+        **uvicorn_options(config),
+    )
+
+def main(config: Mapping[str, Any] = SERVER_CONFIG) -> None:
+    check_token_store(config)
+    if _installed("gunicorn") and sys.platform != "win32":
+        run_gunicorn(config)
+    else:
+        logger.warning("gunicorn이 설치되어 있지 않아 uvicorn 멀티 프로세스 모드로 실행합니다. (앱 미리 적재 안 함)")
+        run_uvicorn(config)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# 토큰 발급 microbenchmark - 기존 발급 함수 vs TokenIssuer
+## 실행: python -m benchmarks.bench_issuer [--seconds 1.0]
+## 기존 방식: 입력 dict 복사, datetime.now()로 exp 계산, JWT_CONFIG 조회, 호출마다 JOSE 헤더 직렬화 (python-jose)
+import argparse
+import uuid
+
+from datetime import datetime, timedelta
+from jose import jwt
+
+from auth_service.core.jwt_backends import BACKENDS
+from auth_service.core.keys import SigningKey
+from auth_service.core.token_issuer import TokenIssuer
+from benchmarks.bench_tokens import measure
+
+LEGACY_JWT_CONFIG = {
+    "secret_key": "benchmark_secret_key_benchmark_secret_key",
+    "algorithm": "HS256",
+    "access_token_expire_minutes": 15,
+    "refresh_token_expire_days": 7,
+    "access_token_type": "bearer",
+    "refresh_token_type": "bearer",
+}
+
+# 기존 access token 발급 함수
+def legacy_create_access_token(data: dict) -> str:
+    to_encode = data.copy()
+    expire = datetime.now() + timedelta(minutes=LEGACY_JWT_CONFIG["access_token_expire_minutes"])
+    to_encode.update({
+        "exp": expire,
+        "token_type": LEGACY_JWT_CONFIG["access_token_type"],
+        "jti": uuid.uuid4().hex
+    })
+    return jwt.encode(to_encode, LEGACY_JWT_CONFIG["secret_key"], algorithm=LEGACY_JWT_CONFIG["algorithm"])
+
+# 기존 refresh token 발급 함수
+def legacy_create_refresh_token(data: dict) -> str:
+    to_encode = data.copy()
+    expire = datetime.now() + timedelta(days=LEGACY_JWT_CONFIG["refresh_token_expire_days"])
+    to_encode.update({
+        "exp": expire,
+        "token_type": LEGACY_JWT_CONFIG["refresh_token_type"],
+        "jti": uuid.uuid4().hex,
+        "fid": uuid.uuid4().hex
+    })
+    return jwt.encode(to_encode, LEGACY_JWT_CONFIG["secret_key"], algorithm=LEGACY_JWT_CONFIG["algorithm"])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기존 토큰 발급 함수와 TokenIssuer 발급 처리량 비교")
+    parser.add_argument("--seconds", type=float, default=1.0, help="측정 항목별 실행 시간 (초)")
+    args = parser.parse_args()
+
+    key = SigningKey.from_secret(LEGACY_JWT_CONFIG["secret_key"], "HS256")
+    user = {"sub": "bench@example.com"}
+
+    cases = {"legacy": (legacy_create_access_token, legacy_create_refresh_token)}
+    for backend_name in ("jose", "fast-hmac"):
+        backend = BACKENDS[backend_name]()
+        access_issuer = TokenIssuer(key, backend, "bearer", 15 * 60)
+        refresh_issuer = TokenIssuer(key, backend, "bearer", 7 * 24 * 60 * 60)
+        cases[f"issuer ({backend_name})"] = (
+            access_issuer.issue,
+            lambda data, issuer=refresh_issuer: issuer.issue(data, fid=uuid.uuid4().hex),
+        )
+
+    baseline = None
+    print(f"{'implementation':<22}{'access/s':>14}{'refresh/s':>14}{'speedup':>10}")
+    for name, (create_access, create_refresh) in cases.items():
+        access_rate = measure(lambda: create_access(user), args.seconds)
+        refresh_rate = measure(lambda: create_refresh(user), args.seconds)
+        baseline = baseline or access_rate
+        print(f"{name:<22}{access_rate:>14,.0f}{refresh_rate:>14,.0f}{access_rate / baseline:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
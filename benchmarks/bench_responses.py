@@ -0,0 +1,116 @@
+# 라우트별 응답 직렬화 방식 벤치마크
+## 실행: python -m benchmarks.bench_responses [--seconds 2.0]
+## before: 라우트에서 JSONResponse를 직접 만들어 반환 (표준 json 직렬화)
+## after: auth_app의 실제 라우터 (FastJSONResponse로 한 번만 직렬화, response_model은 문서용)
+## 토큰 서명 / 검증 비용을 제외하고 응답 직렬화 비용만 비교하도록 handler는 미리 만든 응답을 반환
+import argparse
+import asyncio
+import time
+
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from auth_service.core.responses import FastJSONResponse
+from auth_service.routers import auth_router
+
+LOGIN_RESULT = {
+    "jwt_token": "a" * 400,
+    "refresh_token": "r" * 450,
+    "user": {"id": 1, "email": "bench@example.com", "name": "벤치마크 사용자", "social_provider": "google"},
+}
+REFRESH_RESULT = {"jwt_token": "a" * 400, "refresh_token": "r" * 450}
+INTROSPECT_TOKENS = 100
+INTROSPECT_RESULT = [
+    {"active": True, "claims": {"sub": f"user{i}@example.com", "exp": 1900000000, "iat": 1800000000,
+                                "jti": f"{i:032x}", "token_type": "access"}}
+    for i in range(INTROSPECT_TOKENS)
+]
+
+# 라우트: (이름, 경로, 요청 본문)
+ROUTES = [
+    ("login", "/auth/login/google", {}),
+    ("refresh", "/auth/token/refresh", {"refresh_token": "r"}),
+    ("introspect", "/auth/token/introspect", {"tokens": ["t"] * INTROSPECT_TOKENS}),
+]
+
+async def get_db():
+    yield None
+
+# 변경 전 라우트 - JSONResponse를 직접 만들어 반환 (요청 파라미터 / 의존성은 변경 후와 동일)
+def build_before_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/auth/login/{provider}")
+    async def login(provider: str, request: Request, db=Depends(get_db)):
+        return JSONResponse(content=LOGIN_RESULT, status_code=200)
+
+    @app.post("/auth/token/refresh")
+    async def refresh(token_request: auth_router.TokenRefreshRequest):
+        return JSONResponse(content=REFRESH_RESULT, status_code=200)
+
+    @app.post("/auth/token/introspect")
+    async def introspect(introspect_request: auth_router.TokenIntrospectRequest):
+        return JSONResponse(content={"results": INTROSPECT_RESULT[:len(introspect_request.token_list())]}, status_code=200)
+
+    return app
+
+# 변경 후 라우트 - 실제 auth_router에 미리 만든 응답을 반환하는 handler 연결
+def build_after_app() -> FastAPI:
+    async def handle_social_login(provider, request, db):
+        return LOGIN_RESULT
+
+    auth_router.handle_social_login = handle_social_login
+    auth_router.refresh_token = lambda token: REFRESH_RESULT
+    auth_router.introspect_tokens = lambda tokens: INTROSPECT_RESULT[:len(tokens)]
+
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(auth_router.router, prefix="/auth")
+    app.dependency_overrides[auth_router.get_db] = get_db
+    return app
+
+# 주어진 시간 동안 요청을 반복하여 초당 요청 수 측정
+async def measure(app: FastAPI, path: str, body: Dict[str, Any], seconds: float) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(10):
+            response = await client.post(path, json=body)
+            response.raise_for_status()
+
+        count = 0
+        started = time.perf_counter()
+        deadline = started + seconds
+        while True:
+            for _ in range(50):
+                await client.post(path, json=body)
+            count += 50
+            now = time.perf_counter()
+            if now >= deadline:
+                return count / (now - started)
+
+def run(seconds: float) -> List[Dict[str, Any]]:
+    apps: Dict[str, Callable[[], FastAPI]] = {"before": build_before_app, "after": build_after_app}
+    built = {name: build() for name, build in apps.items()}
+
+    results = []
+    for route, path, body in ROUTES:
+        rps = {name: asyncio.run(measure(app, path, body, seconds)) for name, app in built.items()}
+        results.append({"route": route, **rps})
+    return results
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    print(f"{'route':<12} {'before req/s':>14} {'after req/s':>14} {'speedup':>9}")
+    for result in results:
+        print(f"{result['route']:<12} {result['before']:>14.0f} {result['after']:>14.0f} {result['after'] / result['before']:>8.2f}x")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="라우트별 응답 직렬화 방식 벤치마크")
+    parser.add_argument("--seconds", type=float, default=2.0, help="라우트 / 방식별 측정 시간 (초)")
+    args = parser.parse_args()
+    print_results(run(args.seconds))
+
+if __name__ == "__main__":
+    main()
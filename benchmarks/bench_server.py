@@ -0,0 +1,110 @@
+# 서버 실행 방식별 /auth/token/refresh 처리량 벤치마크
+## 실행: python -m benchmarks.bench_server [--setups baseline,tuned] [--seconds 10] [--concurrency 64]
+## baseline: 기존 Dockerfile 방식 (uvicorn 단일 워커, asyncio 루프 + h11)
+## tuned: python -m auth_service.server (CPU 수만큼 워커, uvloop + httptools, 앱 미리 적재)
+## 가상 사용자마다 자신의 refresh token을 교체해 가며 요청하므로(재사용 감지 회피) 매 요청이 실제 토큰 교체를 수행
+## 부하 발생기도 같은 머신에서 실행되므로 CPU 수가 적으면 절대값보다 두 방식의 비율을 비교
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from typing import Dict, List, Optional
+
+BENCH_SECRET_KEY = "benchmark_secret_key_benchmark_secret_key"
+
+# 서버와 같은 서명 키로 초기 refresh token 발급
+os.environ.setdefault("SECRET_KEY", BENCH_SECRET_KEY)
+
+import httpx
+
+from auth_service.handlers.token_handler import create_refresh_token
+
+SETUPS = {
+    "baseline": [sys.executable, "-m", "uvicorn", "auth_service.main:auth_app", "--loop", "asyncio", "--http", "h11",
+                 "--no-access-log", "--host", "127.0.0.1", "--port", "{port}"],
+    "tuned": [sys.executable, "-m", "auth_service.server"],
+}
+
+# 서버 프로세스 시작 후 응답할 때까지 대기
+## extra_env: 서버에 추가로 전달할 환경변수
+def start_server(setup: str, port: int, extra_env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+    # memory 토큰 저장소는 워커 1개에서만 실행 가능 - 여러 워커는 TOKEN_STORE_BACKEND=database와 SERVER_WORKERS로 지정
+    env = {"TOKEN_STORE_BACKEND": "memory", "SERVER_WORKERS": "1", **os.environ,
+           "SERVER_HOST": "127.0.0.1", "SERVER_PORT": str(port),
+           # 모든 가상 사용자가 같은 IP에서 요청하므로 요청 제한 해제
+           "RATE_LIMIT_BACKEND": "none", **(extra_env or {})}
+    command = [arg.format(port=port) for arg in SETUPS[setup]]
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/.well-known/jwks.json").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{setup} 서버가 시작되지 않았습니다.")
+
+# 가상 사용자 - 응답으로 받은 새 refresh token으로 계속 갱신
+async def virtual_user(client: httpx.AsyncClient, deadline: float, latencies: List[float], errors: List[int]) -> None:
+    token = create_refresh_token({"sub": "bench@example.com"})
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.post("/auth/token/refresh", json={"refresh_token": token})
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+            token = create_refresh_token({"sub": "bench@example.com"})
+            continue
+        token = response.json()["refresh_token"]
+
+async def load(port: int, seconds: float, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors: List[int] = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+        started = time.perf_counter()
+        deadline = started + seconds
+        await asyncio.gather(*(virtual_user(client, deadline, latencies, errors) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+    }
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'setup':<10} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}")
+    for setup, result in results.items():
+        print(f"{setup:<10} {result['rps']:>10.0f} {result['p50_ms']:>10.1f} {result['p99_ms']:>10.1f} {result['errors']:>8}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="서버 실행 방식별 /auth/token/refresh 처리량 벤치마크")
+    parser.add_argument("--setups", default=",".join(SETUPS), help="비교할 실행 방식 (쉼표 구분)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="방식별 측정 시간 (초)")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 가상 사용자 수")
+    parser.add_argument("--port", type=int, default=8765, help="서버 포트")
+    args = parser.parse_args()
+
+    results = {}
+    for setup in args.setups.split(","):
+        process = start_server(setup, args.port)
+        try:
+            # 워커 준비 / 연결 수립 비용 제외
+            asyncio.run(load(args.port, 1.0, args.concurrency))
+            results[setup] = asyncio.run(load(args.port, args.seconds, args.concurrency))
+        finally:
+            process.terminate()
+            process.wait()
+    print_results(results)
+
+if __name__ == "__main__":
+    main()
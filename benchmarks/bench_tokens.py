@@ -0,0 +1,90 @@
+# 토큰 발급/검증 백엔드별 처리량 벤치마크
+## 실행: python -m benchmarks.bench_tokens [--backends jose,pyjwt] [--algorithms HS256,RS256] [--seconds 1.0]
+## create_access_token / create_refresh_token / verify_token / verify_refresh_token 의 초당 처리 토큰 수 측정
+## verify_token은 검증 캐시를 끈 상태(매번 디코딩)로 측정
+import argparse
+import time
+
+from typing import Callable, Dict, List
+
+from auth_service.core.jwt_backends import BACKENDS, BackendSelector, available_backends
+from auth_service.core.keys import SYMMETRIC_ALGORITHMS, KeyRegistry, SigningKey, generate_private_key_pem
+from auth_service.core.token_store import MemoryTokenStore, RevocationFilter
+from auth_service.handlers import token_handler
+
+DEFAULT_ALGORITHMS = ["HS256", "RS256", "ES256", "EdDSA"]
+BENCH_SECRET_KEY = "benchmark_secret_key_benchmark_secret_key"
+
+# 주어진 시간 동안 함수를 반복 실행하여 초당 실행 횟수 측정
+def measure(func: Callable[[], object], seconds: float) -> float:
+    # 키 준비 등 최초 호출 비용 제외
+    for _ in range(10):
+        func()
+
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        for _ in range(100):
+            func()
+        count += 100
+        now = time.perf_counter()
+        if now >= deadline:
+            return count / (now - started)
+
+## 알고리즘별 벤치마크용 서명 키 생성
+def make_key(algorithm: str) -> SigningKey:
+    if algorithm in SYMMETRIC_ALGORITHMS:
+        return SigningKey.from_secret(BENCH_SECRET_KEY, algorithm, "bench")
+    return SigningKey.from_private_pem(generate_private_key_pem(algorithm), algorithm, "bench")
+
+## token_handler의 전역 상태를 벤치마크 대상 백엔드/키로 교체
+def configure(backend_name: str, key: SigningKey) -> None:
+    store = MemoryTokenStore()
+    token_handler.key_registry = KeyRegistry(active=key)
+    token_handler.jwt_backends = BackendSelector(backend_name)
+    token_handler.token_cache = None
+    token_handler.token_store = store
+    token_handler.revocation_filter = RevocationFilter(store, capacity=1000, error_rate=0.001, max_false_positive_rate=0.01)
+
+# 백엔드 x 알고리즘 조합별 처리량 측정
+def run(backends: List[str], algorithms: List[str], seconds: float) -> List[Dict[str, object]]:
+    results = []
+    for algorithm in algorithms:
+        key = make_key(algorithm)
+        for backend_name in backends:
+            if algorithm not in BACKENDS[backend_name].algorithms:
+                continue
+            configure(backend_name, key)
+
+            user = {"sub": "bench@example.com"}
+            access_token = token_handler.create_access_token(user)
+            refresh = token_handler.create_refresh_token(user)
+
+            results.append({
+                "backend": backend_name,
+                "algorithm": algorithm,
+                "create_access_token": measure(lambda: token_handler.create_access_token(user), seconds),
+                "create_refresh_token": measure(lambda: token_handler.create_refresh_token(user), seconds),
+                "verify_token": measure(lambda: token_handler.verify_token(access_token), seconds),
+                "verify_refresh_token": measure(lambda: token_handler.verify_refresh_token(refresh), seconds),
+            })
+    return results
+
+def print_results(results: List[Dict[str, object]]) -> None:
+    columns = ["create_access_token", "create_refresh_token", "verify_token", "verify_refresh_token"]
+    print(f"{'algorithm':<10}{'backend':<11}" + "".join(f"{column:>22}" for column in columns))
+    for result in results:
+        print(f"{result['algorithm']:<10}{result['backend']:<11}" + "".join(f"{result[column]:>18,.0f}/s  " for column in columns))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JWT 백엔드별 토큰 발급/검증 처리량 벤치마크")
+    parser.add_argument("--backends", default=",".join(available_backends()))
+    parser.add_argument("--algorithms", default=",".join(DEFAULT_ALGORITHMS))
+    parser.add_argument("--seconds", type=float, default=1.0, help="측정 항목별 실행 시간 (초)")
+    args = parser.parse_args()
+
+    print_results(run(args.backends.split(","), args.algorithms.split(","), args.seconds))
+
+if __name__ == "__main__":
+    main()
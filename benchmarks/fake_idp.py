@@ -0,0 +1,146 @@
+# 부하 테스트용 가짜 Google OAuth2 / OpenID Connect provider
+## 실행: python -m benchmarks.fake_idp [--port 9000] [--latency-ms 50] [--jitter-ms 20] [--error-rate 0.01]
+## 인가 코드 교환(/token) / 사용자 정보(/userinfo) / 공개키(/jwks) / discovery 문서 제공
+## 인가 코드가 곧 사용자 ID - code=user42 로 교환하면 sub=user42, email=user42@example.com 인 id_token 발급
+## 엔드포인트마다 지정한 지연 시간만큼 기다린 뒤 응답하고, error_rate 비율만큼 503 응답
+import argparse
+import asyncio
+import base64
+import hashlib
+import random
+import time
+
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl
+
+from fastapi import FastAPI, Header, HTTPException, Request, status
+from fastapi.responses import JSONResponse
+from jose import jwk, jwt
+
+from auth_service.core.keys import SigningKey, generate_private_key_pem
+
+ISSUER = "https://accounts.google.com"
+CLIENT_ID = "load-test-client"
+CLIENT_SECRET = "load-test-secret"
+
+# OAuth 토큰 응답의 at_hash (access token SHA-256 앞 절반)
+def _at_hash(access_token: str) -> str:
+    digest = hashlib.sha256(access_token.encode()).digest()
+    return base64.urlsafe_b64encode(digest[:len(digest) // 2]).rstrip(b"=").decode()
+
+# 사용자 ID -> 계정 정보
+def _profile(user_id: str) -> Dict[str, Any]:
+    return {"sub": user_id, "id": user_id, "email": f"{user_id}@example.com", "verified_email": True,
+            "name": f"Load Test {user_id}"}
+
+def create_fake_idp(latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                    include_id_token: bool = True, client_id: str = CLIENT_ID,
+                    seed: Optional[int] = None) -> FastAPI:
+    signing_key = SigningKey.from_private_pem(generate_private_key_pem("RS256"), "RS256", "fake-idp")
+    # PEM 파싱은 수십 ms가 걸리므로 한 번만 수행 (provider 서명 비용이 측정을 지배하지 않도록)
+    jose_key = jwk.construct(signing_key.signing_key, "RS256")
+    rng = random.Random(seed)
+    app = FastAPI(title="Fake IdP")
+
+    # 지연 / 오류 주입
+    async def simulate() -> None:
+        delay = latency_ms + (rng.uniform(-jitter_ms, jitter_ms) if jitter_ms else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if error_rate and rng.random() < error_rate:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="injected error")
+
+    @app.get("/.well-known/openid-configuration")
+    async def discovery(request: Request):
+        base_url = str(request.base_url).rstrip("/")
+        return {
+            "issuer": ISSUER,
+            "token_endpoint": f"{base_url}/token",
+            "userinfo_endpoint": f"{base_url}/userinfo",
+            "jwks_uri": f"{base_url}/jwks",
+        }
+
+    @app.get("/jwks")
+    async def jwks():
+        await simulate()
+        return JSONResponse({"keys": [signing_key.public_jwk]}, headers={"Cache-Control": "public, max-age=3600"})
+
+    @app.post("/token")
+    async def token(request: Request):
+        await simulate()
+        # form 파싱 (python-multipart 없이)
+        form = dict(parse_qsl((await request.body()).decode()))
+        if form.get("client_id") != client_id:
+            return JSONResponse({"error": "invalid_client"}, status_code=status.HTTP_401_UNAUTHORIZED)
+        if not form.get("code"):
+            return JSONResponse({"error": "invalid_grant"}, status_code=status.HTTP_400_BAD_REQUEST)
+
+        code = form["code"]
+        access_token = f"fake-access-{code}"
+        response = {"access_token": access_token, "token_type": "Bearer", "expires_in": 3600}
+        if include_id_token:
+            now = int(time.time())
+            claims = {
+                **_profile(code),
+                "iss": ISSUER,
+                "aud": client_id,
+                "iat": now,
+                "exp": now + 3600,
+                "at_hash": _at_hash(access_token),
+                "email_verified": True,
+            }
+            claims.pop("id")
+            claims.pop("verified_email")
+            response["id_token"] = jwt.encode(
+                claims, jose_key, algorithm="RS256", headers={"kid": signing_key.kid}
+            )
+        return response
+
+    @app.get("/userinfo")
+    async def userinfo(authorization: str = Header("")):
+        await simulate()
+        if not authorization.startswith("Bearer fake-access-"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token")
+        return _profile(authorization.removeprefix("Bearer fake-access-"))
+
+    return app
+
+# 가짜 provider를 사용하도록 Google OAuth 설정 덮어쓰기 (base_url: 가짜 provider 주소)
+def google_config_overrides(base_url: str) -> Dict[str, Any]:
+    return {
+        "client_id": CLIENT_ID,
+        "client_secret": CLIENT_SECRET,
+        "token_url": f"{base_url}/token",
+        "userinfo_url": f"{base_url}/userinfo",
+        "jwks_url": f"{base_url}/jwks",
+        "jwks_path": None,
+    }
+
+# 같은 설정의 환경변수 (별도 프로세스로 실행하는 auth 서버용)
+def google_env(base_url: str) -> Dict[str, str]:
+    config = google_config_overrides(base_url)
+    return {
+        "GOOGLE_CLIENT_ID": config["client_id"],
+        "GOOGLE_CLIENT_SECRET": config["client_secret"],
+        "GOOGLE_TOKEN_URL": config["token_url"],
+        "GOOGLE_USERINFO_URL": config["userinfo_url"],
+        "GOOGLE_JWKS_URL": config["jwks_url"],
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="부하 테스트용 가짜 Google OAuth2 / OIDC provider")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="엔드포인트별 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="응답 지연 편차 (±ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--no-id-token", action="store_true", help="id_token 없이 응답 (userinfo 조회 경로)")
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_fake_idp(args.latency_ms, args.jitter_ms, args.error_rate, include_id_token=not args.no_id_token)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
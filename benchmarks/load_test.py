@@ -0,0 +1,261 @@
+# 가짜 Google provider를 사용한 로그인 / 토큰 갱신 부하 테스트
+## 실행: python -m benchmarks.load_test [--scenarios login,refresh] [--mode in-process|server] [--concurrency 32] [--seconds 10]
+## in-process: auth 앱과 가짜 provider를 같은 프로세스에서 ASGI로 직접 호출 (소켓 / 네트워크 없음)
+## server: 가짜 provider와 auth 서버(python -m auth_service.server)를 별도 프로세스로 실행
+## --target URL: 이미 실행 중인 auth 서버 (가짜 provider를 사용하도록 GOOGLE_* 환경변수를 설정해야 함)
+## --max-p99-ms / --max-error-rate / --min-rps 를 넘으면 종료 코드 1 (성능 회귀 감지용)
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+BENCH_SECRET_KEY = "benchmark_secret_key_benchmark_secret_key"
+
+# auth_service 설정은 import 시점에 읽으므로 먼저 지정 (이미 설정된 값은 유지)
+## 모든 가상 사용자가 같은 IP에서 요청하므로 요청 제한 해제
+os.environ.setdefault("SECRET_KEY", BENCH_SECRET_KEY)
+os.environ.setdefault("RATE_LIMIT_BACKEND", "none")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.gettempdir()}/auth_load_test.db")
+
+import httpx
+
+from benchmarks.fake_idp import create_fake_idp, google_config_overrides, google_env
+
+SCENARIOS = ("login", "refresh")
+
+# in-process 모드의 가상 호스트
+IDP_URL = "http://fake-idp"
+AUTH_URL = "http://auth"
+
+# 정렬된 값의 백분위수
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+# 측정 결과 요약
+def summarize(latencies: List[float], errors: Dict[int, int], elapsed: float) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    requests = len(latencies)
+    error_count = sum(errors.values())
+    return {
+        "requests": requests,
+        "errors": error_count,
+        "error_rate": error_count / requests if requests else 0.0,
+        "error_statuses": dict(errors),
+        "rps": requests / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+# 소셜 로그인 (인가 코드 = 사용자 ID)
+async def login(client: httpx.AsyncClient, user_id: str) -> httpx.Response:
+    return await client.post("/auth/login/google", params={"code": user_id})
+
+## 가상 사용자
+### latencies / errors: 모든 가상 사용자가 결과를 함께 기록
+
+# 로그인 - users명의 계정 중 하나로 계속 로그인 (첫 로그인은 가입, 이후는 기존 사용자 조회)
+async def login_user(client: httpx.AsyncClient, deadline: float, users: int, rng: random.Random,
+                     latencies: List[float], errors: Dict[int, int]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await login(client, f"user{rng.randrange(users)}")
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+# 토큰 갱신 - 로그인(측정 제외)으로 받은 refresh token을 응답으로 받은 새 토큰으로 계속 교체
+async def refresh_user(client: httpx.AsyncClient, deadline: float, users: int, rng: random.Random,
+                       latencies: List[float], errors: Dict[int, int]) -> None:
+    user_id = f"user{rng.randrange(users)}"
+    token = None
+    while time.perf_counter() < deadline:
+        if token is None:
+            response = await login(client, user_id)
+            if response.status_code != 200:
+                errors[response.status_code] = errors.get(response.status_code, 0) + 1
+                continue
+            token = response.json()["refresh_token"]
+
+        started = time.perf_counter()
+        response = await client.post("/auth/token/refresh", json={"refresh_token": token})
+        latencies.append(time.perf_counter() - started)
+        if response.status_code != 200:
+            errors[response.status_code] = errors.get(response.status_code, 0) + 1
+            token = None
+            continue
+        token = response.json()["refresh_token"]
+
+VIRTUAL_USERS = {"login": login_user, "refresh": refresh_user}
+
+# 시나리오 실행 - concurrency명의 가상 사용자가 seconds 동안 요청
+async def run_scenario(client: httpx.AsyncClient, scenario: str, concurrency: int, seconds: float,
+                       users: int, seed: Optional[int] = None) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: Dict[int, int] = {}
+    rng = random.Random(seed)
+
+    started = time.perf_counter()
+    deadline = started + seconds
+    await asyncio.gather(*(
+        VIRTUAL_USERS[scenario](client, deadline, users, random.Random(rng.random()), latencies, errors)
+        for _ in range(concurrency)
+    ))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+## 부하 대상
+
+# 같은 프로세스의 auth 앱 (가짜 provider도 ASGI로 직접 호출)
+## 앱 lifespan을 실행한 뒤 Google 클라이언트만 가짜 provider를 사용하는 클라이언트로 교체
+@asynccontextmanager
+async def in_process_target(idp_options: Dict[str, Any]) -> AsyncIterator[httpx.AsyncClient]:
+    from auth_service.core import rate_limit
+    from auth_service.core.database import Base, engine
+    from auth_service.handlers.google_social_handler import google_provider
+    from auth_service.main import auth_app
+
+    Base.metadata.create_all(engine)
+    idp_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=create_fake_idp(**idp_options)), base_url=IDP_URL)
+    rate_limiter, rate_limit.rate_limiter = rate_limit.rate_limiter, None
+
+    try:
+        async with auth_app.router.lifespan_context(auth_app):
+            auth_app.state.oauth.google = google_provider.client_class(
+                idp_client, {**google_provider.config, **google_config_overrides(IDP_URL)}
+            )
+            transport = httpx.ASGITransport(app=auth_app)
+            async with httpx.AsyncClient(transport=transport, base_url=AUTH_URL) as client:
+                yield client
+    finally:
+        rate_limit.rate_limiter = rate_limiter
+        await idp_client.aclose()
+
+def _idp_command(port: int, idp_options: Dict[str, Any]) -> List[str]:
+    command = [sys.executable, "-m", "benchmarks.fake_idp", "--port", str(port),
+               "--latency-ms", str(idp_options.get("latency_ms", 0.0)),
+               "--jitter-ms", str(idp_options.get("jitter_ms", 0.0)),
+               "--error-rate", str(idp_options.get("error_rate", 0.0))]
+    if not idp_options.get("include_id_token", True):
+        command.append("--no-id-token")
+    return command
+
+# 별도 프로세스의 가짜 provider + auth 서버
+@asynccontextmanager
+async def server_target(concurrency: int, idp_options: Dict[str, Any], port: int,
+                        idp_port: int) -> AsyncIterator[httpx.AsyncClient]:
+    from sqlalchemy import create_engine
+
+    from auth_service.core.config import DB_CONFIG
+    from auth_service.models.auth_model import Base
+    from benchmarks.bench_server import start_server
+
+    db_engine = create_engine(DB_CONFIG["postgresql"]["sqlalchemy_url"])
+    Base.metadata.create_all(db_engine)
+    db_engine.dispose()
+
+    idp = subprocess.Popen(_idp_command(idp_port, idp_options), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        server = start_server("tuned", port, google_env(f"http://127.0.0.1:{idp_port}"))
+        try:
+            async with _client(f"http://127.0.0.1:{port}", concurrency) as client:
+                yield client
+        finally:
+            server.terminate()
+            server.wait()
+    finally:
+        idp.terminate()
+        idp.wait()
+
+# 이미 실행 중인 서버에 연결하는 HTTP 클라이언트
+def _client(base_url: str, concurrency: int) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0)
+
+## 결과 출력 / 판정
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"{'scenario':<10} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>8}")
+    for scenario, result in results.items():
+        print(f"{scenario:<10} {result['requests']:>9} {result['rps']:>9.0f} {result['p50_ms']:>9.1f} "
+              f"{result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f} {result['errors']:>8}")
+        if result["error_statuses"]:
+            print(f"{'':<10} 오류 응답: {result['error_statuses']}")
+
+# 기준을 넘은 항목 목록 (없으면 통과)
+def check_thresholds(results: Dict[str, Dict[str, Any]], max_p99_ms: Optional[float] = None,
+                     max_error_rate: Optional[float] = None, min_rps: Optional[float] = None) -> List[str]:
+    failures = []
+    for scenario, result in results.items():
+        if max_p99_ms is not None and result["p99_ms"] > max_p99_ms:
+            failures.append(f"{scenario}: p99 {result['p99_ms']:.1f}ms > {max_p99_ms}ms")
+        if max_error_rate is not None and result["error_rate"] > max_error_rate:
+            failures.append(f"{scenario}: error rate {result['error_rate']:.3f} > {max_error_rate}")
+        if min_rps is not None and result["rps"] < min_rps:
+            failures.append(f"{scenario}: {result['rps']:.0f} req/s < {min_rps} req/s")
+    return failures
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    idp_options = {
+        "latency_ms": args.idp_latency_ms,
+        "jitter_ms": args.idp_jitter_ms,
+        "error_rate": args.idp_error_rate,
+        "include_id_token": not args.no_id_token,
+    }
+    if args.target:
+        target = _client(args.target, args.concurrency)
+    elif args.mode == "server":
+        target = server_target(args.concurrency, idp_options, args.port, args.idp_port)
+    else:
+        target = in_process_target(idp_options)
+
+    results = {}
+    async with target as client:
+        for scenario in args.scenarios.split(","):
+            # 가입 / 커넥션 수립 / 공개키 조회 등 최초 요청 비용 제외
+            await run_scenario(client, scenario, args.concurrency, min(args.seconds, 1.0), args.users, args.seed)
+            results[scenario] = await run_scenario(client, scenario, args.concurrency, args.seconds, args.users, args.seed)
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="가짜 Google provider를 사용한 로그인 / 토큰 갱신 부하 테스트")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="실행할 시나리오 (쉼표 구분)")
+    parser.add_argument("--mode", choices=("in-process", "server"), default="in-process", help="부하 대상 실행 방식")
+    parser.add_argument("--target", default=None, help="이미 실행 중인 auth 서버 URL")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 가상 사용자 수")
+    parser.add_argument("--seconds", type=float, default=10.0, help="시나리오별 측정 시간 (초)")
+    parser.add_argument("--users", type=int, default=1000, help="로그인에 사용할 계정 수")
+    parser.add_argument("--seed", type=int, default=None, help="계정 선택 / 오류 주입 난수 seed")
+    parser.add_argument("--idp-latency-ms", type=float, default=0.0, help="가짜 provider 응답 지연 (ms)")
+    parser.add_argument("--idp-jitter-ms", type=float, default=0.0, help="가짜 provider 응답 지연 편차 (±ms)")
+    parser.add_argument("--idp-error-rate", type=float, default=0.0, help="가짜 provider 503 응답 비율 (0~1)")
+    parser.add_argument("--no-id-token", action="store_true", help="id_token 없이 응답 (userinfo 조회 경로)")
+    parser.add_argument("--port", type=int, default=8765, help="server 모드 auth 서버 포트")
+    parser.add_argument("--idp-port", type=int, default=8766, help="server 모드 가짜 provider 포트")
+    parser.add_argument("--max-p99-ms", type=float, default=None, help="시나리오별 p99 지연 상한 (ms)")
+    parser.add_argument("--max-error-rate", type=float, default=None, help="시나리오별 오류율 상한 (0~1)")
+    parser.add_argument("--min-rps", type=float, default=None, help="시나리오별 처리량 하한 (req/s)")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"지원하지 않는 시나리오입니다: {', '.join(sorted(unknown))}")
+
+    results = asyncio.run(run(args))
+    print_results(results)
+
+    failures = check_thresholds(results, args.max_p99_ms, args.max_error_rate, args.min_rps)
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
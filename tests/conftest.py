@@ -0,0 +1,38 @@
+import pytest
+
+## 테스트용 시계 - 시간을 직접 진행 (clock.now += 초)
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+## redis.asyncio.Redis 대체
+## get / set(ex=) / delete는 값과 만료 시간을 저장하고, eval은 호출을 기록한 뒤 eval_result 반환
+class FakeRedis:
+    def __init__(self, eval_result=None):
+        self.values = {}
+        self.eval_result = eval_result
+        self.calls = []
+
+    async def get(self, key):
+        return self.values.get(key, (None,))[0]
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = (value.encode() if isinstance(value, str) else value, ex)
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def eval(self, script, numkeys, *args):
+        self.calls.append((numkeys, args))
+        return self.eval_result
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
@@ -1,9 +1,25 @@
+import httpx
+import json
 import pytest
+import time
 
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from jose import jwt
+from starlette.requests import Request
+from urllib.parse import parse_qsl
 
+from auth_service.core.config import OAUTH_GOOGLE_CONFIG
+from auth_service.core.keys import SigningKey, generate_private_key_pem
 from auth_service.main import auth_app as app
 from auth_service.handlers.google_social_handler import handle_auth_google
+from auth_service.handlers.social_handler import (
+    LOGIN_STAGE_SECONDS,
+    LOGIN_USERINFO_FALLBACKS,
+    OAuthClient,
+    OAuthError
+)
+from auth_service.core.user_cache import MemoryUserCache
 from auth_service.models.auth_model import User
 
 client = TestClient(app)
@@ -18,6 +34,7 @@ def setup(monkeypatch):
         "client_secret": "dummy_client_secret"
     })
     monkeypatch.setattr("auth_service.handlers.google_social_handler.OAUTH_GOOGLE_CONFIG", {
+        **OAUTH_GOOGLE_CONFIG,
         "client_id": "dummy_client_id",
         "client_secret": "dummy_client_secret"
     })
@@ -31,7 +48,7 @@ async def fake_authorize_access_token(request):
 async def fake_get(url, token):
     class FakeResponse:
         def json(self):
-            return {"id": "dummy_id", "email": "dummy_email", "name": "dummy_name"}
+            return {"id": "dummy_id", "email": "dummy_email", "verified_email": True, "name": "dummy_name"}
     return FakeResponse()
 
 ### Fake google 사용자 정보 조회 함수 - 이메일 정보 없음
@@ -46,16 +63,17 @@ class FaskeDBSession:
     def __init__(self, user_exists=False):
         self.user_exists = user_exists
         self.added_users = [] # 추가된 사용자 저장용
+
+    # upsert를 지원하지 않는 dialect로 동작 (조회 후 생성 경로)
+    def get_bind(self):
+        return type("FakeBind", (), {"dialect": type("FakeDialect", (), {"name": "default"})})
     
-    def query(self, model):
-        # 모의 쿼리 클래스
-        class FakeQuery:
+    def execute(self, stmt):
+        # 모의 조회 결과 클래스
+        class FakeResult:
             def __init__(self, user_exists):
                 self.user_exists = user_exists
 
-            def filter(self, *args, **kwargs):
-                return self
-            
             def first(self):
                 # 기존 사용자가 있는 경우
                 if self.user_exists:
@@ -63,16 +81,16 @@ class FaskeDBSession:
                 # 기존 사용자가 없는 경우
                 else:
                     return None
-        return FakeQuery(self.user_exists)
+        return FakeResult(self.user_exists)
     
     def add(self, user):
         self.added_users.append(user)
+
+    def flush(self):
+        pass
     
     def commit(self):
         pass
-
-    def refresh(self, user):
-        pass
             
 ## 테스트용 Request 객체
 class FakeRequest:
@@ -87,8 +105,13 @@ def mock_token(monkeypatch):
     def fake_create_refresh_token(data):
         return "fake_refresh_token"
     
-    monkeypatch.setattr("auth_service.handlers.google_social_handler.create_access_token", fake_create_access_token)
-    monkeypatch.setattr("auth_service.handlers.google_social_handler.create_refresh_token", fake_create_refresh_token)
+    monkeypatch.setattr("auth_service.handlers.social_handler.create_access_token", fake_create_access_token)
+    monkeypatch.setattr("auth_service.handlers.social_handler.create_refresh_token", fake_create_refresh_token)
+
+## 테스트마다 빈 사용자 캐시 사용 (이전 테스트의 로그인 결과로 DB 조회가 생략되지 않도록)
+@pytest.fixture(autouse=True)
+def empty_user_cache(monkeypatch):
+    monkeypatch.setattr("auth_service.handlers.social_handler.user_cache", MemoryUserCache(max_size=100, ttl_seconds=60))
 
 # Google 로그인 테스트
 ## 기존 사용자 로그인
@@ -194,4 +217,181 @@ async def test_handle_auth_google_no_email():
 
     # 테스트용 로직 실행
     with pytest.raises(Exception):
-        await handle_auth_google(fake_request, db)
\ No newline at end of file
+        await handle_auth_google(fake_request, db)
+
+## 로그인 단계별 처리 시간 기록
+@pytest.mark.asyncio
+async def test_handle_auth_google_stage_metrics():
+    fake_request = FakeRequest()
+    fake_request.app = type("FakeApp", (), {"state": type("FakeState", (), {"oauth": type("FakeOAuth", (), {
+        "google": type("FakeGoogle", (), {"authorize_access_token": fake_authorize_access_token, "get": fake_get})
+    })})})
+
+    stages = ("token_exchange", "userinfo", "user_upsert", "jwt_sign")
+    before = {stage: LOGIN_STAGE_SECONDS.get(provider="google", stage=stage)[0] for stage in stages}
+
+    await handle_auth_google(fake_request, FaskeDBSession(user_exists=True))
+
+    for stage in stages:
+        assert LOGIN_STAGE_SECONDS.get(provider="google", stage=stage)[0] == before[stage] + 1
+
+## Google token / userinfo 엔드포인트 mocking (httpx.MockTransport)
+def make_google_client(token_status=200, id_token=None, jwks_path=None):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/token":
+            if token_status != 200:
+                return httpx.Response(token_status, json={"error": "invalid_grant", "error_description": "Bad code"})
+            token = {"access_token": "google_access_token", "token_type": "Bearer"}
+            if id_token is not None:
+                token["id_token"] = id_token
+            return httpx.Response(200, json=token)
+        if request.url.path == "/certs":
+            return httpx.Response(503)
+        return httpx.Response(200, json={"id": "dummy_id", "email": "dummy_email", "verified_email": True, "name": "dummy_name"})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    config = {
+        "client_id": "dummy_client_id",
+        "client_secret": "dummy_client_secret",
+        "redirect_uri": "https://example.com/callback",
+        "token_url": "https://oauth2.example.com/token",
+        "userinfo_url": "https://api.example.com/userinfo",
+        "jwks_url": "https://api.example.com/certs",
+        "jwks_path": jwks_path,
+        "issuers": ("https://accounts.google.com", "accounts.google.com"),
+    }
+    return OAuthClient(http_client, config), requests
+
+## 테스트용 Google 서명 키 / 로컬 JWKS 파일
+@pytest.fixture(scope="module")
+def google_signing_key():
+    return SigningKey.from_private_pem(generate_private_key_pem("RS256"), "RS256", "google-kid")
+
+@pytest.fixture
+def google_jwks_path(tmp_path, google_signing_key):
+    path = tmp_path / "google_jwks.json"
+    path.write_text(json.dumps({"keys": [google_signing_key.public_jwk]}))
+    return str(path)
+
+## Google id_token 생성
+def make_id_token(signing_key, **overrides):
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": "dummy_client_id",
+        "sub": "google_sub",
+        "email": "id_token_email",
+        "email_verified": True,
+        "name": "id_token_name",
+        "iat": int(time.time()),
+        "exp": int(time.time()) + 3600,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, signing_key.signing_key, algorithm="RS256", headers={"kid": signing_key.kid})
+
+## 공유 Google 클라이언트를 사용하는 Request 객체
+def make_google_request(google, query_string=b"code=dummy_code"):
+    request = make_code_request(query_string)
+    request.scope["app"] = type("FakeApp", (), {"state": type("FakeState", (), {"oauth": type("FakeOAuth", (), {"google": google})})})
+    return request
+
+## 인가 코드가 포함된 요청
+def make_code_request(query_string=b"code=dummy_code"):
+    return Request({"type": "http", "method": "POST", "query_string": query_string, "headers": []})
+
+# 공유 HTTP 클라이언트로 인가 코드 교환 / 사용자 정보 조회
+@pytest.mark.asyncio
+async def test_google_oauth_client():
+    google, requests = make_google_client()
+
+    token = await google.authorize_access_token(make_code_request())
+    response = await google.get("userinfo", token=token)
+
+    assert token["access_token"] == "google_access_token"
+    assert response.json()["email"] == "dummy_email"
+
+    token_request, userinfo_request = requests
+    assert dict(parse_qsl(token_request.content.decode())) == {
+        "grant_type": "authorization_code",
+        "code": "dummy_code",
+        "client_id": "dummy_client_id",
+        "client_secret": "dummy_client_secret",
+        "redirect_uri": "https://example.com/callback",
+    }
+    assert str(userinfo_request.url) == "https://api.example.com/userinfo"
+    assert userinfo_request.headers["Authorization"] == "Bearer google_access_token"
+
+# 인가 코드 누락 / 교환 실패 시 OAuthError
+@pytest.mark.asyncio
+async def test_google_oauth_client_errors():
+    google, _ = make_google_client(token_status=400)
+
+    with pytest.raises(OAuthError) as e:
+        await google.authorize_access_token(make_code_request())
+    assert e.value.error == "invalid_grant"
+
+    with pytest.raises(OAuthError) as e:
+        await google.authorize_access_token(make_code_request(b""))
+    assert e.value.error == "missing_code"
+
+# 앱 lifespan에서 공유 HTTP 클라이언트 / OAuth 클라이언트 생성 후 종료 시 정리
+def test_lifespan_http_client():
+    with TestClient(app) as test_client:
+        http_client = test_client.app.state.http_client
+        assert isinstance(http_client, httpx.AsyncClient)
+        assert test_client.app.state.oauth.google.http_client is http_client
+    assert http_client.is_closed
+
+# id_token을 로컬에서 검증하면 userinfo를 호출하지 않음
+@pytest.mark.asyncio
+async def test_handle_auth_google_id_token(google_signing_key, google_jwks_path):
+    google, requests = make_google_client(id_token=make_id_token(google_signing_key), jwks_path=google_jwks_path)
+    db = FaskeDBSession()
+
+    result = await handle_auth_google(make_google_request(google), db)
+
+    assert [request.url.path for request in requests] == ["/token"]
+    assert result["user"] == {"id": None, "email": "id_token_email", "name": "id_token_name", "social_provider": "google"}
+    assert db.added_users[0].social_id == "google_sub"
+
+# id_token에 필요한 claim이 없거나 공개키를 조회할 수 없으면 userinfo 호출
+@pytest.mark.asyncio
+async def test_handle_auth_google_userinfo_fallback(google_signing_key, google_jwks_path):
+    missing_name = make_id_token(google_signing_key, name=None)
+    google, requests = make_google_client(id_token=missing_name, jwks_path=google_jwks_path)
+    before = LOGIN_USERINFO_FALLBACKS.get(provider="google", reason="missing_claims")
+
+    result = await handle_auth_google(make_google_request(google), FaskeDBSession())
+    assert [request.url.path for request in requests] == ["/token", "/userinfo"]
+    assert result["user"]["email"] == "dummy_email"
+    assert LOGIN_USERINFO_FALLBACKS.get(provider="google", reason="missing_claims") == before + 1
+
+    # JWKS 조회 실패 (503)
+    google, requests = make_google_client(id_token=make_id_token(google_signing_key))
+    result = await handle_auth_google(make_google_request(google), FaskeDBSession())
+    assert [request.url.path for request in requests] == ["/token", "/certs", "/userinfo"]
+    assert result["user"]["email"] == "dummy_email"
+
+# 서명 / 대상(aud) 검증 실패 시 로그인 거부
+@pytest.mark.asyncio
+async def test_handle_auth_google_invalid_id_token(google_signing_key, google_jwks_path):
+    other_key = SigningKey.from_private_pem(generate_private_key_pem("RS256"), "RS256", "google-kid")
+    for id_token in (make_id_token(google_signing_key, aud="other_client"), make_id_token(other_key)):
+        google, requests = make_google_client(id_token=id_token, jwks_path=google_jwks_path)
+        with pytest.raises(HTTPException) as e:
+            await handle_auth_google(make_google_request(google), FaskeDBSession())
+        assert e.value.status_code == 400
+        assert [request.url.path for request in requests] == ["/token"]
+
+# provider가 확인하지 않은 이메일(email_verified: false)로는 로그인 거부 (다른 사용자의 이메일 선점 방지)
+@pytest.mark.asyncio
+async def test_handle_auth_google_unverified_email(google_signing_key, google_jwks_path):
+    google, _ = make_google_client(id_token=make_id_token(google_signing_key, email_verified=False), jwks_path=google_jwks_path)
+    db = FaskeDBSession()
+
+    with pytest.raises(HTTPException) as e:
+        await handle_auth_google(make_google_request(google), db)
+    assert e.value.status_code == 400
+    assert db.added_users == []
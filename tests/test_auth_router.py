@@ -1,20 +1,39 @@
+import asyncio
 import pytest
 
 from fastapi.testclient import TestClient
 from auth_service.main import auth_app as app
+from auth_service.core import rate_limit
+from auth_service.core.config import JWT_CONFIG
+from auth_service.core.rate_limit import MemoryRateLimiter
+from auth_service.core.keys import KeyRegistry
+from auth_service.routers import auth_router
 
 client = TestClient(app)
 
+## 테스트마다 요청 제한 초기화
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    monkeypatch.setattr(rate_limit, "rate_limiter", MemoryRateLimiter(max_keys=100))
+
+## 로그인 handler 응답 mocking
+def fake_login_result(provider):
+    return {
+        "jwt_token": "fake_token",
+        "refresh_token": "fake_refresh_token",
+        "user": {"id": 1, "email": "dummy@example.com", "name": "dummy", "social_provider": provider}
+    }
+
 # google 소셜 로그인 라우터 테스트
 @pytest.mark.asyncio
 async def test_auth_social_google(monkeypatch):
     # Handler 함수 mocking
-    async def fake_handle_auth_google(request, db):
-        return {"jwt_token": "fake_token"}
+    async def fake_handle_social_login(provider, request, db):
+        return fake_login_result(provider.name)
 
     monkeypatch.setattr(
-        "auth_service.routers.auth_router.handle_auth_google",
-        fake_handle_auth_google
+        "auth_service.routers.auth_router.handle_social_login",
+        fake_handle_social_login
     )
 
     # Mocking된 handler 함수를 호출하는 라우터 테스트
@@ -22,33 +41,57 @@ async def test_auth_social_google(monkeypatch):
 
     # 토큰 발급 성공 여부 확인
     assert response.status_code == 200
-    assert response.json() == {"jwt_token": "fake_token"}
+    assert response.json() == fake_login_result("google")
+
+# 등록된 provider별 라우팅 테스트
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", ["kakao", "naver", "github", "oidc"])
+async def test_auth_social_providers(monkeypatch, provider):
+    async def fake_handle_social_login(provider, request, db):
+        return fake_login_result(provider.name)
+
+    monkeypatch.setattr(
+        "auth_service.routers.auth_router.handle_social_login",
+        fake_handle_social_login
+    )
+
+    response = client.post(f"/auth/login/{provider}", json={})
+
+    assert response.status_code == 200
+    assert response.json() == fake_login_result(provider)
+
+# 지원하지 않는 provider 테스트
+def test_auth_social_unknown_provider():
+    response = client.post("/auth/login/unknown", json={})
+
+    assert response.status_code == 404
 
 ## 로그인 예외 처리 테스트
 @pytest.mark.asyncio
 async def test_auth_social_exception(monkeypatch):
     # Handler 함수 mocking
-    async def fake_handle_auth_google(request, db):
+    async def fake_handle_social_login(provider, request, db):
         raise Exception("test_exception")
 
     monkeypatch.setattr(
-        "auth_service.routers.auth_router.handle_auth_google",
-        fake_handle_auth_google
+        "auth_service.routers.auth_router.handle_social_login",
+        fake_handle_social_login
     )
 
     # Mocking된 handler 함수를 호출하는 라우터 테스트
     response = client.post("/auth/login/google", json={})
 
     # 예외 처리 성공 여부 확인
+    # 예외 메시지(SQL 등 내부 정보)는 응답에 포함하지 않음
     assert response.status_code == 400
-    assert response.json() == {"detail": "test_exception"}
+    assert response.json() == {"detail": "로그인에 실패했습니다."}
 
 # 토큰 갱신 라우터 테스트
 ## 예외가 발생하는 경우는 refresh_token 함수에서 처리하므로, 성공하는 경우만 테스트
 def test_token_refresh(monkeypatch):
     # refresh_token 함수를 mocking
     def fake_refresh_token(refresh_token):
-        return "new_fake_token"
+        return {"jwt_token": "new_fake_token", "refresh_token": "new_fake_refresh_token"}
     monkeypatch.setattr(
         "auth_service.routers.auth_router.refresh_token",
         fake_refresh_token
@@ -59,5 +102,87 @@ def test_token_refresh(monkeypatch):
 
     # 토큰 갱신 성공 여부 확인
     assert response.status_code == 200
-    assert response.json() == {"jwt_token": "new_fake_token"}
+    assert response.json() == {"jwt_token": "new_fake_token", "refresh_token": "new_fake_refresh_token"}
+
+# 토큰 검증(introspection) 라우터 테스트
+## 단일 토큰 검증
+def test_token_introspect_single(monkeypatch):
+    # introspect_tokens 함수를 mocking
+    def fake_introspect_tokens(tokens):
+        return [{"active": True, "claims": {"sub": token}} for token in tokens]
+    monkeypatch.setattr(
+        "auth_service.routers.auth_router.introspect_tokens",
+        fake_introspect_tokens
+    )
+
+    response = client.post("/auth/token/introspect", json={"token": "dummy_token"})
+
+    assert response.status_code == 200
+    assert response.json() == {"results": [{"active": True, "claims": {"sub": "dummy_token"}}]}
+
+## DB 등 블로킹 토큰 저장소를 사용하면 이벤트 루프가 아닌 스레드풀에서 검증
+def test_token_introspect_blocking_store(monkeypatch):
+    def fake_introspect_tokens(tokens):
+        try:
+            asyncio.get_running_loop()
+            on_loop = True
+        except RuntimeError:
+            on_loop = False
+        return [{"active": True, "claims": {"on_loop": on_loop}} for token in tokens]
+    monkeypatch.setattr("auth_service.routers.auth_router.introspect_tokens", fake_introspect_tokens)
+    monkeypatch.setattr(
+        "auth_service.routers.auth_router.get_token_store", lambda: type("FakeStore", (), {"blocking": True})()
+    )
+
+    response = client.post("/auth/token/introspect", json={"token": "dummy_token"})
+
+    assert response.status_code == 200
+    assert response.json()["results"][0]["claims"] == {"on_loop": False}
+
+## 여러 토큰 일괄 검증 - 유효/무효 토큰 혼합
+def test_token_introspect_batch(monkeypatch):
+    from auth_service.handlers.token_handler import create_access_token
+    monkeypatch.setattr(
+        "auth_service.handlers.token_handler.key_registry",
+        KeyRegistry.from_config({**JWT_CONFIG, "secret_key": "dummy_secret_key"})
+    )
+
+    valid_token = create_access_token({"sub": "test@example.com"})
+    response = client.post("/auth/token/introspect", json={"tokens": [valid_token, "invalid_token", valid_token]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["active"] for result in results] == [True, False, True]
+    assert results[0]["claims"]["sub"] == "test@example.com"
+    assert results[1]["error"] == "Invalid authentication credentials"
+
+## 최대 토큰 수 초과 / 잘못된 요청
+def test_token_introspect_invalid_request(monkeypatch):
+    monkeypatch.setattr(auth_router, "JWT_CONFIG", JWT_CONFIG.model_copy(update={"introspect_max_tokens": 2}))
+
+    response = client.post("/auth/token/introspect", json={"tokens": ["a", "b", "c"]})
+    assert response.status_code == 400
+
+    response = client.post("/auth/token/introspect", json={"token": "a", "tokens": ["b"]})
+    assert response.status_code == 422
+
+# 응답 모델이 OpenAPI 문서에 노출되는지 테스트
+def test_auth_response_models():
+    paths = app.openapi()["paths"]
+
+    def response_schema(path):
+        return paths[path]["post"]["responses"]["200"]["content"]["application/json"]["schema"]["$ref"]
+
+    assert response_schema("/auth/login/{provider}").endswith("/LoginResponse")
+    assert response_schema("/auth/token/refresh").endswith("/TokenResponse")
+    assert response_schema("/auth/token/introspect").endswith("/TokenIntrospectResponse")
+
+# orjson이 없으면 표준 json으로 직렬화
+def test_fast_json_response_fallback(monkeypatch):
+    from auth_service.core import responses
+
+    content = {"email": "사용자@example.com", "results": [{"active": True}]}
+    fast = responses.FastJSONResponse(content).body
+    monkeypatch.setattr(responses, "orjson", None)
 
+    assert responses.FastJSONResponse(content).body == fast
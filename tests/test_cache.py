@@ -0,0 +1,39 @@
+from auth_service.core.cache import TTLCache
+
+# 저장/조회 및 hit/miss 통계 테스트
+def test_cache_hit_and_miss(clock):
+    cache = TTLCache(max_size=10, ttl_seconds=60, clock=clock)
+
+    assert cache.get("key") is None
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+# TTL 및 항목별 만료 시간 테스트
+def test_cache_expiration(clock):
+    cache = TTLCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.set("ttl", "value")
+    cache.set("exp", "value", expires_at=clock.now + 10)
+
+    clock.now += 11
+    assert cache.get("exp") is None
+    assert cache.get("ttl") == "value"
+
+    clock.now += 50
+    assert cache.get("ttl") is None
+    assert len(cache) == 0
+
+# 크기 제한 초과 시 가장 오래 사용되지 않은 항목 제거 테스트
+def test_cache_lru_eviction(clock):
+    cache = TTLCache(max_size=2, ttl_seconds=60, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+import pytest
+
+from sqlalchemy import create_engine, func, select
+
+from auth_service.cli import Progress, batched, export_users, import_users, main, read_users
+from auth_service.models.auth_model import Base, User
+
+## 테스트용 DB
+@pytest.fixture
+def db_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'auth.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return url
+
+def make_users(count, provider="google"):
+    return [
+        {"email": f"user{i}@example.com", "name": f"user{i}", "social_provider": provider, "social_id": i}
+        for i in range(count)
+    ]
+
+def write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    return str(path)
+
+# JSONL 가져오기 - 배치 단위로 저장하고, 다시 가져오면 이메일 / 이름 갱신
+def test_import_users_jsonl(tmp_path, db_url, capsys):
+    assert main(["import-users", write_jsonl(tmp_path / "users.jsonl", make_users(25)), "--url", db_url, "--batch-size", "10"]) == 0
+    assert capsys.readouterr().err.count("rows/s") == 4
+
+    updated = make_users(25)
+    updated[0]["email"] = "changed@example.com"
+    assert main(["import-users", write_jsonl(tmp_path / "users.jsonl", updated), "--url", db_url]) == 0
+
+    engine = create_engine(db_url)
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(User)).scalar_one() == 25
+        assert conn.execute(select(User.email).where(User.social_id == "0")).scalar_one() == "changed@example.com"
+    engine.dispose()
+
+# 가져온 계정은 배치마다 공유(redis) 사용자 캐시에서 제거 - memory 캐시는 서버 워커 안에 있으므로 제거하지 않음
+@pytest.mark.parametrize("backend, expected_batches", [("redis", 3), ("memory", 0)])
+def test_import_users_invalidates_cache(monkeypatch, tmp_path, db_url, backend, expected_batches):
+    invalidated = []
+
+    async def fake_invalidate_users(keys):
+        invalidated.append(keys)
+
+    monkeypatch.setattr("auth_service.cli.user_cache", type("FakeUserCache", (), {"backend": backend})())
+    monkeypatch.setattr("auth_service.cli.invalidate_users", fake_invalidate_users)
+
+    assert main(["import-users", write_jsonl(tmp_path / "users.jsonl", make_users(25)), "--url", db_url, "--batch-size", "10"]) == 0
+
+    assert len(invalidated) == expected_batches
+    if invalidated:
+        assert invalidated[0][0] == ("google", "0")
+        assert sum(map(len, invalidated)) == 25
+
+# 같은 배치 안의 같은 소셜 계정은 마지막 행만 저장 / 필수 값이 없으면 실패
+def test_import_users_duplicates_and_invalid(tmp_path, db_url):
+    rows = make_users(2) + [{"email": "last@example.com", "social_provider": "google", "social_id": 0}]
+    engine = create_engine(db_url)
+    with engine.connect() as conn:
+        assert import_users(conn, rows, batch_size=10) == 2
+        assert conn.execute(select(User.email).where(User.social_id == "0")).scalar_one() == "last@example.com"
+    engine.dispose()
+
+    invalid = write_jsonl(tmp_path / "invalid.jsonl", [{"email": "a@example.com", "social_provider": "google"}])
+    assert main(["import-users", invalid, "--url", db_url]) == 1
+
+# 다른 소셜 계정이 사용 중인 이메일이면 해당 배치를 반영하지 않고 실패
+def test_import_users_email_conflict(tmp_path, db_url, capsys):
+    assert main(["import-users", write_jsonl(tmp_path / "users.jsonl", make_users(2)), "--url", db_url]) == 0
+
+    conflict = write_jsonl(tmp_path / "conflict.jsonl", make_users(1, provider="github"))
+    assert main(["import-users", conflict, "--url", db_url]) == 1
+    assert "이메일" in capsys.readouterr().err
+
+    engine = create_engine(db_url)
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(User)).scalar_one() == 2
+    engine.dispose()
+
+# CSV 가져오기 / JSONL, CSV 내보내기
+def test_export_users(tmp_path, db_url):
+    source = tmp_path / "users.csv"
+    with open(source, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=["email", "name", "social_provider", "social_id"])
+        writer.writeheader()
+        writer.writerows(make_users(5, provider="kakao"))
+    assert main(["import-users", str(source), "--url", db_url]) == 0
+
+    engine = create_engine(db_url)
+    with engine.connect() as conn:
+        output = io.StringIO()
+        assert export_users(conn, output, "jsonl", batch_size=2) == 5
+        exported = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        output = io.StringIO()
+        export_users(conn, output, "csv", batch_size=2)
+        exported_csv = list(csv.DictReader(io.StringIO(output.getvalue())))
+    engine.dispose()
+
+    assert [user["social_id"] for user in exported] == ["0", "1", "2", "3", "4"]
+    assert set(exported[0]) == {"id", "email", "name", "social_provider", "social_id", "created_at"}
+    assert [user["email"] for user in exported_csv] == [user["email"] for user in exported]
+
+# 입력을 배치 단위로 읽으며 처리량 기록
+def test_batched_streaming():
+    rows = read_users(io.StringIO("".join(json.dumps(row) + "\n" for row in make_users(5))), "jsonl")
+    progress = Progress("import", out=io.StringIO())
+
+    sizes = []
+    for batch in batched(rows, 2):
+        sizes.append(len(batch))
+        progress.add(len(batch))
+
+    assert sizes == [2, 2, 1]
+    assert progress.rows == 5
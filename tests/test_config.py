@@ -0,0 +1,55 @@
+import pydantic
+import pytest
+
+from auth_service.core.config import RATE_LIMIT_RULE_DEFAULTS, load_settings
+
+# 환경변수 문자열을 타입에 맞게 변환
+def test_typed_settings():
+    settings = load_settings({
+        "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+        "SERVER_PORT": "9000",
+        "TOKEN_CACHE_ENABLED": "0",
+        "HTTP_CLIENT_READ_TIMEOUT": "2.5",
+        "RATE_LIMIT_LOGIN_IP_BURST": "3",
+    })
+
+    assert settings.jwt.access_token_expire_minutes == 30
+    assert settings.server.port == 9000
+    assert settings.token_cache.enabled is False
+    assert settings.http_client.read_timeout == 2.5
+    assert settings.rate_limit.rules["login_ip"].burst == 3
+    assert settings.rate_limit.rules["refresh_ip"].burst == RATE_LIMIT_RULE_DEFAULTS["refresh_ip"][0]
+
+# 잘못된 값은 시작 시점에 실패
+@pytest.mark.parametrize("env", [
+    {"SERVER_PORT": "http"},
+    {"SERVER_PORT": "70000"},
+    {"ACCESS_TOKEN_EXPIRE_MINUTES": "0"},
+    {"USER_CACHE_BACKEND": "memcached"},
+    {"ACCESS_TOKEN_TYPE": "bearer", "REFRESH_TOKEN_TYPE": "bearer"},
+])
+def test_invalid_settings(env):
+    with pytest.raises(pydantic.ValidationError):
+        load_settings(env)
+
+# 테스트 환경(TEST_ENV=1)에서만 테스트 DB 사용
+def test_database_url():
+    env = {"DATABASE_URL": "postgresql://db/auth", "TEST_DATABASE_URL": "sqlite:///./test.db"}
+
+    assert load_settings(env).database.postgresql.sqlalchemy_url == "postgresql://db/auth"
+    assert load_settings({**env, "TEST_ENV": "0"}).database.postgresql.sqlalchemy_url == "postgresql://db/auth"
+    assert load_settings({**env, "TEST_ENV": "1"}).database.postgresql.sqlalchemy_url == "sqlite:///./test.db"
+
+# 설정은 변경할 수 없고, 기존 dict 설정처럼 조회 가능
+def test_settings_mapping_access():
+    config = load_settings({"SERVER_HOST": "127.0.0.1"}).server
+
+    with pytest.raises(pydantic.ValidationError):
+        config.port = 9000
+
+    assert config["host"] == config.get("host") == "127.0.0.1"
+    assert config.get("missing", "default") == "default"
+    assert "port" in config and "missing" not in config
+    assert {**config, "port": 9000}["port"] == 9000
+    with pytest.raises(KeyError):
+        config["missing"]
@@ -0,0 +1,256 @@
+import asyncio
+import gc
+import time
+import pytest
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import TimeoutError as SQLAlchemyTimeoutError
+from sqlalchemy.orm import sessionmaker
+
+from auth_service.core.database import (
+    POOL_CAPACITY,
+    POOL_CHECKOUT_TIMEOUTS,
+    POOL_CHECKOUT_WAIT,
+    POOL_IN_USE,
+    POOL_OPEN,
+    InstrumentedAsyncQueuePool,
+    InstrumentedNullPool,
+    InstrumentedQueuePool,
+    engine_options,
+    instrument_engine,
+    to_async_url,
+)
+from auth_service.handlers.google_social_handler import handle_auth_google
+from auth_service.handlers.social_handler import EmailConflictError, build_user_upsert, get_or_create_user
+from auth_service.core.user_cache import MemoryUserCache
+from auth_service.models.auth_model import Base, User
+
+# 동시 로그인 수 / 허용 가능한 이벤트 루프 지연
+CONCURRENT_LOGINS = 50
+MAX_LOOP_LAG_SECONDS = 0.1
+
+## 테스트용 JWT 토큰 발급 함수
+@pytest.fixture(autouse=True)
+def mock_token(monkeypatch):
+    monkeypatch.setattr("auth_service.handlers.social_handler.create_access_token", lambda data: "fake_token")
+    monkeypatch.setattr("auth_service.handlers.social_handler.create_refresh_token", lambda data: "fake_refresh_token")
+
+## 테스트마다 빈 사용자 캐시 사용 (이전 테스트의 로그인 결과로 DB 조회가 생략되지 않도록)
+@pytest.fixture(autouse=True)
+def empty_user_cache(monkeypatch):
+    monkeypatch.setattr("auth_service.handlers.social_handler.user_cache", MemoryUserCache(max_size=100, ttl_seconds=60))
+
+## 사용자별 Fake Google 클라이언트를 가진 Request 객체 생성
+def make_fake_request(index, google_id=None):
+    class FakeGoogle:
+        async def authorize_access_token(self, request):
+            return "dummy_token"
+
+        async def get(self, url, token):
+            class FakeResponse:
+                def json(self):
+                    return {"id": google_id or f"google_{index}", "email": f"user{index}@example.com", "verified_email": True, "name": f"user{index}"}
+            return FakeResponse()
+
+    class FakeRequest:
+        pass
+
+    request = FakeRequest()
+    request.app = type("FakeApp", (), {"state": type("FakeState", (), {"oauth": type("FakeOAuth", (), {"google": FakeGoogle()})})})
+    return request
+
+## 로그인이 진행되는 동안 이벤트 루프 지연(스케줄링 지연)의 최댓값 측정
+async def measure_loop_lag(stop_event, interval=0.005):
+    max_lag = 0.0
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, time.perf_counter() - started - interval)
+    return max_lag
+
+async def run_concurrent_logins(session_factory, google_id=None):
+    async def login(index):
+        db = session_factory()
+        try:
+            return await handle_auth_google(make_fake_request(index, google_id), db)
+        finally:
+            close = db.close()
+            if asyncio.iscoroutine(close):
+                await close
+
+    # 앞선 테스트에서 쌓인 객체로 인한 GC 지연이 측정에 섞이지 않도록 미리 수집
+    gc.collect()
+    stop_event = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop_event))
+    results = await asyncio.gather(*(login(index) for index in range(CONCURRENT_LOGINS)))
+    stop_event.set()
+    return results, await lag_task
+
+# 동기 URL -> 비동기 드라이버 URL 변환 테스트
+def test_to_async_url():
+    assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+    assert to_async_url("postgresql://user:pw@db:5432/auth") == "postgresql+asyncpg://user:pw@db:5432/auth"
+    assert to_async_url("postgresql+asyncpg://user:pw@db/auth") == "postgresql+asyncpg://user:pw@db/auth"
+
+# 비동기 세션(aiosqlite)으로 동시 로그인 시 이벤트 루프 지연 테스트
+@pytest.mark.asyncio
+async def test_concurrent_logins_async_session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    results, max_lag = await run_concurrent_logins(session_factory)
+
+    async with session_factory() as db:
+        user_count = (await db.execute(select(func.count()).select_from(User))).scalar_one()
+    await engine.dispose()
+
+    assert user_count == CONCURRENT_LOGINS
+    assert {result["user"]["email"] for result in results} == {f"user{index}@example.com" for index in range(CONCURRENT_LOGINS)}
+    assert max_lag < MAX_LOOP_LAG_SECONDS
+
+# 동기 세션 사용 시에도 DB 작업이 스레드풀에서 실행되어 이벤트 루프를 막지 않는지 테스트
+@pytest.mark.asyncio
+async def test_concurrent_logins_sync_session_does_not_block_loop(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'auth.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+
+    # 느린 DB 왕복을 흉내내기 위해 쿼리 실행마다 지연 추가
+    class SlowSession(sessionmaker(bind=engine, autoflush=False).class_):
+        def execute(self, *args, **kwargs):
+            time.sleep(0.02)
+            return super().execute(*args, **kwargs)
+
+    results, max_lag = await run_concurrent_logins(lambda: SlowSession(bind=engine, autoflush=False))
+    engine.dispose()
+
+    assert len(results) == CONCURRENT_LOGINS
+    assert max_lag < MAX_LOOP_LAG_SECONDS
+
+# Postgres upsert 구문 생성 테스트
+def test_build_user_upsert_postgresql():
+    stmt = build_user_upsert("postgresql", "google", "google_1", "user1@example.com", "user1")
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (social_provider, social_id) DO UPDATE" in sql
+    assert "RETURNING users.id, users.email, users.name" in sql
+    assert build_user_upsert("mysql", "google", "google_1", "user1@example.com", "user1") is None
+
+# 같은 Google 계정의 동시 최초 로그인 시 IntegrityError 없이 한 명의 사용자만 생성되는지 테스트
+@pytest.mark.asyncio
+async def test_concurrent_first_logins_same_account(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    results, _ = await run_concurrent_logins(session_factory, google_id="same_google_id")
+
+    async with session_factory() as db:
+        user_count = (await db.execute(select(func.count()).select_from(User))).scalar_one()
+    await engine.dispose()
+
+    assert len(results) == CONCURRENT_LOGINS
+    assert user_count == 1
+
+# Google 계정의 이메일/이름이 변경되면 기존 사용자 정보가 갱신되는지 테스트
+@pytest.mark.asyncio
+async def test_upsert_updates_changed_profile(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async with session_factory() as db:
+        created = await get_or_create_user(db, "google", "google_1", "old@example.com", "old")
+    async with session_factory() as db:
+        updated = await get_or_create_user(db, "google", "google_1", "new@example.com", "new")
+    await engine.dispose()
+
+    assert updated.id == created.id
+    assert (updated.email, updated.name) == ("new@example.com", "new")
+
+# 다른 provider 계정이 이미 사용 중인 이메일은 연결하지 않고 충돌(409)로 처리 (비동기 / 동기 세션)
+@pytest.mark.asyncio
+async def test_same_email_other_provider_conflict(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'auth.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async with session_factory() as db:
+        await get_or_create_user(db, "github", "h1", "user0@example.com", "user0")
+    async with session_factory() as db:
+        with pytest.raises(EmailConflictError):
+            await get_or_create_user(db, "google", "g1", "user0@example.com", "user0")
+
+        with pytest.raises(HTTPException) as e:
+            await handle_auth_google(make_fake_request(0), db)
+        assert e.value.status_code == 409
+        assert "user0@example.com" not in e.value.detail
+    await engine.dispose()
+
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'auth.db'}")
+    with sessionmaker(bind=sync_engine)() as db:
+        with pytest.raises(EmailConflictError):
+            await get_or_create_user(db, "kakao", "k1", "user0@example.com", "user0")
+    sync_engine.dispose()
+
+## 풀 메트릭 측정용 설정
+def make_pool_config(**overrides):
+    config = {
+        "pool_size": 1, "max_overflow": 0, "pool_timeout": 0.1,
+        "pool_recycle": -1, "pool_pre_ping": True, "external_pooler": False,
+    }
+    config.update(overrides)
+    return config
+
+# 풀 설정 -> 엔진 인자 변환 테스트
+def test_engine_options():
+    config = make_pool_config(pool_size=10, max_overflow=20)
+    options = engine_options("postgresql://user:pw@db/auth", config, "sync")
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert (options["pool_size"], options["max_overflow"], options["pool_pre_ping"]) == (10, 20, True)
+
+    options = engine_options("postgresql+asyncpg://user:pw@db/auth", config, "async", is_async=True)
+    assert options["poolclass"] is InstrumentedAsyncQueuePool
+
+    # 외부 풀러(PgBouncer) 사용 시 NullPool / asyncpg prepared statement 캐시 비활성화
+    options = engine_options("postgresql+asyncpg://user:pw@db/auth", make_pool_config(external_pooler=True), "async", is_async=True)
+    assert options["poolclass"] is InstrumentedNullPool
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert "pool_size" not in options
+
+    # 인메모리 SQLite는 기본 풀 유지
+    assert "poolclass" not in engine_options("sqlite://", config, "sync")
+
+# 풀 이벤트 기반 사용 중 커넥션 gauge / checkout 대기 시간 / timeout counter 테스트
+def test_pool_metrics(tmp_path):
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    config = make_pool_config()
+    engine = create_engine(url, **engine_options(url, config, "test_pool"))
+    instrument_engine(engine, "test_pool", config)
+
+    checkouts_before, _ = POOL_CHECKOUT_WAIT.get(pool="test_pool")
+    with engine.connect():
+        assert POOL_IN_USE.get(pool="test_pool") == 1
+
+        # 풀(1개)이 모두 사용 중이면 pool_timeout 후 실패
+        with pytest.raises(SQLAlchemyTimeoutError):
+            engine.connect()
+        assert POOL_CHECKOUT_TIMEOUTS.get(pool="test_pool") == 1
+
+    assert POOL_IN_USE.get(pool="test_pool") == 0
+    assert POOL_OPEN.get(pool="test_pool") == 1
+    assert POOL_CAPACITY.get(pool="test_pool") == 1
+
+    checkouts, wait_seconds = POOL_CHECKOUT_WAIT.get(pool="test_pool")
+    assert checkouts - checkouts_before == 2
+    assert wait_seconds >= 0.1
+
+    engine.dispose()
+    assert POOL_OPEN.get(pool="test_pool") == 0
@@ -0,0 +1,28 @@
+import os
+import re
+import subprocess
+import sys
+
+# 앱 import(콜드 스타트) 시간 예산 (ms) - 워커 시작 / 재시작 시간에 그대로 더해짐
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", 2000))
+
+# 새 프로세스에서 모듈 import 후 적재된 모듈 목록 / python -X importtime 누적 시간(ms)
+def import_module(module: str):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys, {module}; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True,
+    )
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", result.stderr, re.M)
+    return set(result.stdout.split()), int(match.group(1)) / 1000
+
+# 앱 import 시간이 예산 이내인지 테스트 (실행 편차를 줄이기 위해 3회 중 최솟값)
+def test_app_import_time_budget():
+    elapsed_ms = min(import_module("auth_service.main")[1] for _ in range(3))
+
+    assert elapsed_ms < IMPORT_TIME_BUDGET_MS, f"auth_service.main import {elapsed_ms:.0f}ms > {IMPORT_TIME_BUDGET_MS:.0f}ms"
+
+# 서버 마스터 프로세스 / 설정 모듈은 웹 프레임워크와 DB 라이브러리를 적재하지 않음
+def test_light_modules_skip_heavy_imports():
+    for module in ("auth_service.server", "auth_service.core.config"):
+        modules, _ = import_module(module)
+        assert not {"fastapi", "sqlalchemy", "authlib"} & modules, module
@@ -0,0 +1,99 @@
+import time
+import pytest
+
+from auth_service.core.jwt_backends import BACKENDS, BackendSelector, TokenError, available_backends, get_unverified_header
+from auth_service.core.keys import SYMMETRIC_ALGORITHMS, SigningKey, generate_private_key_pem
+
+ALGORITHMS = ["HS256", "RS256", "ES256", "EdDSA"]
+
+## 알고리즘별 테스트 키 (모듈 단위로 한 번만 생성)
+@pytest.fixture(scope="module")
+def keys():
+    result = {}
+    for algorithm in ALGORITHMS:
+        if algorithm in SYMMETRIC_ALGORITHMS:
+            result[algorithm] = SigningKey.from_secret("dummy_secret_key_for_jwt_backends", algorithm, "test-kid")
+        else:
+            result[algorithm] = SigningKey.from_private_pem(generate_private_key_pem(algorithm), algorithm, "test-kid")
+    return result
+
+## (백엔드, 알고리즘) 조합 - 설치되어 있고 알고리즘을 지원하는 경우만
+def backend_algorithm_pairs():
+    return [
+        (name, algorithm)
+        for name in available_backends()
+        for algorithm in ALGORITHMS
+        if algorithm in BACKENDS[name].algorithms
+    ]
+
+# 백엔드/알고리즘별 발급 및 검증 테스트
+@pytest.mark.parametrize("backend_name, algorithm", backend_algorithm_pairs())
+def test_roundtrip(keys, backend_name, algorithm):
+    backend = BACKENDS[backend_name]()
+    claims = {"sub": "test@example.com", "exp": int(time.time()) + 60}
+
+    token = backend.encode(claims, keys[algorithm])
+
+    assert get_unverified_header(token)["kid"] == "test-kid"
+    assert get_unverified_header(token)["alg"] == algorithm
+    assert backend.decode(token, keys[algorithm])["sub"] == "test@example.com"
+
+# 한 백엔드로 발급한 토큰을 다른 백엔드로 검증할 수 있는지 테스트
+@pytest.mark.parametrize("backend_name, algorithm", backend_algorithm_pairs())
+def test_cross_backend_compatibility(keys, backend_name, algorithm):
+    token = BACKENDS[backend_name]().encode({"sub": "test@example.com", "exp": int(time.time()) + 60}, keys[algorithm])
+
+    for other_name, other_algorithm in backend_algorithm_pairs():
+        if other_algorithm == algorithm:
+            assert BACKENDS[other_name]().decode(token, keys[algorithm])["sub"] == "test@example.com"
+
+# 만료 / 서명 위조 토큰 거부 테스트
+@pytest.mark.parametrize("backend_name, algorithm", backend_algorithm_pairs())
+def test_rejects_invalid_tokens(keys, backend_name, algorithm):
+    backend = BACKENDS[backend_name]()
+
+    expired = backend.encode({"sub": "test@example.com", "exp": int(time.time()) - 10}, keys[algorithm])
+    with pytest.raises(TokenError):
+        backend.decode(expired, keys[algorithm])
+
+    valid = backend.encode({"sub": "test@example.com", "exp": int(time.time()) + 60}, keys[algorithm])
+    header, payload, signature = valid.split(".")
+    forged = backend.encode({"sub": "attacker@example.com", "exp": int(time.time()) + 60}, keys[algorithm]).split(".")[1]
+    with pytest.raises(TokenError):
+        backend.decode(f"{header}.{forged}.{signature}", keys[algorithm])
+
+    with pytest.raises(TokenError):
+        backend.decode("not.a.token", keys[algorithm])
+
+# 발급자(iss) / 대상(aud) 불일치 토큰 거부 테스트 - 설정하지 않으면 검증하지 않음
+@pytest.mark.parametrize("backend_name, algorithm", backend_algorithm_pairs())
+def test_rejects_issuer_audience_mismatch(keys, backend_name, algorithm):
+    backend = BACKENDS[backend_name]()
+    claims = {"sub": "test@example.com", "exp": int(time.time()) + 60, "iss": "auth-service", "aud": "api"}
+    token = backend.encode(claims, keys[algorithm])
+
+    assert backend.decode(token, keys[algorithm], "auth-service", "api")["sub"] == "test@example.com"
+    assert backend.decode(token, keys[algorithm])["sub"] == "test@example.com"
+
+    with pytest.raises(TokenError):
+        backend.decode(token, keys[algorithm], "other-service", "api")
+    with pytest.raises(TokenError):
+        backend.decode(token, keys[algorithm], "auth-service", "other-api")
+
+    # aud 목록에 포함되면 허용 / 클레임이 없으면 거부
+    token = backend.encode({**claims, "aud": ["web", "api"]}, keys[algorithm])
+    assert backend.decode(token, keys[algorithm], audience="api")["sub"] == "test@example.com"
+    token = backend.encode({"sub": "test@example.com", "exp": int(time.time()) + 60}, keys[algorithm])
+    with pytest.raises(TokenError):
+        backend.decode(token, keys[algorithm], audience="api")
+
+# 설정한 백엔드가 알고리즘을 지원하지 않으면 대체 백엔드 선택 테스트
+def test_backend_selector_fallback():
+    selector = BackendSelector("fast-hmac")
+
+    assert selector.for_algorithm("HS256").name == "fast-hmac"
+    assert selector.for_algorithm("RS256").name == "jose"
+    assert selector.for_algorithm("EdDSA").name == "authlib"
+
+    with pytest.raises(ValueError):
+        BackendSelector("unknown")
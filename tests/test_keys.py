@@ -0,0 +1,145 @@
+import pytest
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from auth_service.main import auth_app as app
+from auth_service.core.config import JWT_CONFIG
+from auth_service.core.keys import KeyRegistry, generate_private_key_pem
+from auth_service.handlers.token_handler import (
+    create_access_token,
+    get_key_registry,
+    reload_key_registry,
+    verify_token
+)
+
+client = TestClient(app)
+
+## 테스트용 비대칭 키 레지스트리 생성
+def make_registry(algorithm, kid=None):
+    return KeyRegistry.from_config({
+        "algorithm": algorithm,
+        "private_key": generate_private_key_pem(algorithm),
+        "key_id": kid,
+        "jwks_max_age": 600,
+    })
+
+# 비대칭 알고리즘별 토큰 발급/검증 및 kid 헤더 테스트
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256", "EdDSA"])
+def test_asymmetric_token_roundtrip(monkeypatch, algorithm):
+    registry = make_registry(algorithm)
+    monkeypatch.setattr("auth_service.handlers.token_handler.key_registry", registry)
+    monkeypatch.setattr("auth_service.handlers.token_handler.token_cache", None)
+
+    token = create_access_token({"sub": "test@example.com"})
+
+    assert jwt.get_unverified_header(token)["kid"] == registry.active.kid
+    assert jwt.get_unverified_header(token)["alg"] == algorithm
+    assert verify_token(token)["sub"] == "test@example.com"
+
+# 다른 서비스가 JWKS 공개키만으로 토큰을 검증할 수 있는지 테스트
+def test_verify_with_published_jwk(monkeypatch):
+    registry = make_registry("RS256", kid="test-kid")
+    monkeypatch.setattr("auth_service.handlers.token_handler.key_registry", registry)
+
+    token = create_access_token({"sub": "test@example.com"})
+    jwk = client.get("/.well-known/jwks.json").json()["keys"][0]
+
+    assert jwk["kid"] == "test-kid"
+    assert "d" not in jwk
+    assert jwt.decode(token, jwk, algorithms=["RS256"])["sub"] == "test@example.com"
+
+# JWKS 응답 캐시 헤더(ETag / Cache-Control) 및 304 응답 테스트
+def test_jwks_cache_headers(monkeypatch):
+    monkeypatch.setattr("auth_service.handlers.token_handler.key_registry", make_registry("ES256"))
+
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=600"
+
+    response = client.get("/.well-known/jwks.json", headers={"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+
+# 대칭키(HS256)는 JWKS에 공개되지 않는지 테스트
+def test_symmetric_key_not_published():
+    registry = KeyRegistry.from_config({"algorithm": "HS256", "secret_key": "dummy_secret_key"})
+    assert registry.jwks() == {"keys": []}
+
+# 알고리즘과 맞지 않는 개인키 설정 시 예외 발생 테스트
+def test_key_algorithm_mismatch():
+    with pytest.raises(ValueError):
+        KeyRegistry.from_config({"algorithm": "ES256", "private_key": generate_private_key_pem("RS256")})
+
+## 테스트용 키 링 파일 작성
+def write_keyring(path, active, keys):
+    import json
+    path.write_text(json.dumps({"active": active, "keys": keys}))
+
+# 키 교체 후에도 이전 키로 발급된 토큰이 kid로 검증되는지 테스트
+def test_key_rotation_with_reload(monkeypatch, tmp_path):
+    keyring_path = tmp_path / "keyring.json"
+    old_key = {"kid": "old", "algorithm": "RS256", "private_key": generate_private_key_pem("RS256")}
+    new_key = {"kid": "new", "algorithm": "ES256", "private_key": generate_private_key_pem("ES256")}
+
+    # 테스트 종료 후 원래 키 링으로 복구되도록 monkeypatch로 등록
+    monkeypatch.setattr("auth_service.handlers.token_handler.key_registry", get_key_registry())
+    monkeypatch.setattr(
+        "auth_service.handlers.token_handler.JWT_CONFIG", JWT_CONFIG.model_copy(update={"keyring_path": str(keyring_path)})
+    )
+    monkeypatch.setattr("auth_service.handlers.token_handler.token_cache", None)
+
+    # 기존 키로 토큰 발급
+    write_keyring(keyring_path, "old", [old_key])
+    reload_key_registry()
+    old_token = create_access_token({"sub": "test@example.com"})
+
+    # 새 키를 active로 교체 - 이전 키는 검증용으로 유지
+    write_keyring(keyring_path, "new", [new_key, old_key])
+    reload_key_registry()
+    new_token = create_access_token({"sub": "test@example.com"})
+
+    assert jwt.get_unverified_header(new_token)["kid"] == "new"
+    assert verify_token(old_token)["sub"] == "test@example.com"
+    assert verify_token(new_token)["sub"] == "test@example.com"
+    assert {key["kid"] for key in client.get("/.well-known/jwks.json").json()["keys"]} == {"new", "old"}
+
+    # 이전 키 제거 후에는 이전 토큰 검증 실패
+    write_keyring(keyring_path, "new", [new_key])
+    reload_key_registry()
+    with pytest.raises(HTTPException):
+        verify_token(old_token)
+
+# 키 링에 active 키가 없으면 재적재 실패 및 기존 키 링 유지 테스트
+def test_reload_failure_keeps_registry(monkeypatch, tmp_path):
+    keyring_path = tmp_path / "keyring.json"
+    write_keyring(keyring_path, "missing", [{"kid": "only", "algorithm": "HS256", "secret_key": "dummy_secret_key"}])
+    registry = make_registry("RS256")
+
+    monkeypatch.setattr(
+        "auth_service.handlers.token_handler.JWT_CONFIG", JWT_CONFIG.model_copy(update={"keyring_path": str(keyring_path)})
+    )
+    monkeypatch.setattr("auth_service.handlers.token_handler.key_registry", registry)
+
+    with pytest.raises(ValueError):
+        reload_key_registry()
+    assert get_key_registry() is registry
+
+# 문자열이 아닌 kid 헤더는 검증 실패로 처리 (500이 아닌 401 / active: false)
+@pytest.mark.parametrize("kid", [{"a": 1}, ["a"], 1])
+def test_invalid_kid_header(monkeypatch, kid):
+    registry = KeyRegistry.from_config({"algorithm": "HS256", "secret_key": "dummy_secret_key"})
+    monkeypatch.setattr("auth_service.handlers.token_handler.key_registry", registry)
+    token = jwt.encode({"sub": "test@example.com"}, "dummy_secret_key", algorithm="HS256", headers={"kid": kid})
+
+    with pytest.raises(HTTPException) as e:
+        verify_token(token)
+    assert e.value.status_code == 401
+
+    response = client.post("/auth/token/introspect", json={"tokens": [token, create_access_token({"sub": "test@example.com"})]})
+    assert response.status_code == 200
+    assert [result["active"] for result in response.json()["results"]] == [False, True]
+
+    response = client.post("/auth/token/refresh", json={"refresh_token": token})
+    assert response.status_code == 401
@@ -0,0 +1,59 @@
+import os
+import pytest
+
+from unittest import mock
+
+from auth_service.core.config import JWT_CONFIG
+from auth_service.core.keys import KeyRegistry
+
+# 부하 테스트 모듈은 import 시 기본 환경변수를 지정하므로 테스트 프로세스 환경에 남지 않도록 import
+with mock.patch.dict(os.environ):
+    from benchmarks import load_test
+    from benchmarks.fake_idp import CLIENT_ID, create_fake_idp
+
+import httpx
+
+@pytest.fixture(autouse=True)
+def signing_key(monkeypatch):
+    monkeypatch.setattr(
+        "auth_service.handlers.token_handler.key_registry",
+        KeyRegistry.from_config({**JWT_CONFIG, "secret_key": "dummy_secret_key"})
+    )
+
+# 가짜 provider - 인가 코드 교환 / userinfo / 오류 주입
+@pytest.mark.asyncio
+async def test_fake_idp():
+    transport = httpx.ASGITransport(app=create_fake_idp(include_id_token=False))
+    async with httpx.AsyncClient(transport=transport, base_url="http://fake-idp") as client:
+        token = (await client.post("/token", data={"code": "user7", "client_id": CLIENT_ID})).json()
+        userinfo = await client.get("/userinfo", headers={"Authorization": f"Bearer {token['access_token']}"})
+        invalid_client = await client.post("/token", data={"code": "user7", "client_id": "other"})
+
+    assert "id_token" not in token
+    assert userinfo.json()["email"] == "user7@example.com"
+    assert invalid_client.status_code == 401
+
+    transport = httpx.ASGITransport(app=create_fake_idp(error_rate=1.0))
+    async with httpx.AsyncClient(transport=transport, base_url="http://fake-idp") as client:
+        assert (await client.post("/token", data={"code": "user7", "client_id": CLIENT_ID})).status_code == 503
+
+# 같은 프로세스에서 실제 로그인 / 토큰 갱신 경로를 가짜 provider로 실행
+@pytest.mark.asyncio
+async def test_in_process_load():
+    async with load_test.in_process_target({"include_id_token": True}) as client:
+        login = await load_test.run_scenario(client, "login", concurrency=2, seconds=0.3, users=4, seed=1)
+        refresh = await load_test.run_scenario(client, "refresh", concurrency=2, seconds=0.3, users=4, seed=1)
+
+    assert login["requests"] > 0 and login["errors"] == 0
+    assert refresh["requests"] > 0 and refresh["errors"] == 0
+    assert login["p50_ms"] <= login["p95_ms"] <= login["p99_ms"]
+
+# provider 오류는 로그인 오류로 집계되고, 기준을 넘으면 실패 항목으로 보고
+@pytest.mark.asyncio
+async def test_in_process_load_idp_errors():
+    async with load_test.in_process_target({"error_rate": 1.0}) as client:
+        results = {"login": await load_test.run_scenario(client, "login", concurrency=1, seconds=0.1, users=1)}
+
+    assert results["login"]["error_rate"] == 1.0
+    assert results["login"]["error_statuses"] == {400: results["login"]["requests"]}
+    assert load_test.check_thresholds(results, max_error_rate=0.01) == ["login: error rate 1.000 > 0.01"]
@@ -0,0 +1,97 @@
+import pytest
+
+from fastapi.testclient import TestClient
+
+from auth_service.core.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, MetricsRegistry
+from auth_service.main import auth_app as app
+
+client = TestClient(app)
+
+# counter / gauge / histogram 기록 및 Prometheus text format 직렬화 테스트
+def test_render():
+    registry = MetricsRegistry()
+    requests = registry.counter("test_requests_total", "요청 수", ("route",))
+    in_use = registry.gauge("test_in_use", "사용 중")
+    latency = registry.histogram("test_latency_seconds", "처리 시간", ("route",), buckets=(0.1, 1.0))
+
+    requests.inc(route='/a"b')
+    requests.inc(2, route='/a"b')
+    in_use.inc()
+    in_use.dec()
+    in_use.inc(3)
+    latency.observe(0.05, route="/a")
+    latency.observe(0.5, route="/a")
+    latency.observe(5, route="/a")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE test_requests_total counter" in lines
+    assert 'test_requests_total{route="/a\\"b"} 3' in lines
+    assert "test_in_use 3" in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'test_latency_seconds_sum{route="/a"} 5.55' in lines
+    assert 'test_latency_seconds_count{route="/a"} 3' in lines
+
+# 라벨 이름이 다르면 오류
+def test_invalid_labels():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "테스트", ("route",))
+    with pytest.raises(ValueError):
+        counter.inc(path="/a")
+
+# 같은 이름 재등록 시 기존 메트릭 반환 / 다른 형식이면 오류
+def test_register_same_name():
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "테스트")
+    assert registry.counter("test_total", "테스트") is counter
+    with pytest.raises(ValueError):
+        registry.gauge("test_total", "테스트")
+
+# render 시점에 collector 실행 - 실패한 collector가 있어도 나머지 메트릭은 직렬화
+def test_collector():
+    registry = MetricsRegistry()
+    hits = registry.counter("test_hits_total", "조회 수")
+    source = {"hits": 0}
+
+    @registry.collector
+    def collect():
+        hits.set(source["hits"])
+
+    @registry.collector
+    def broken():
+        raise RuntimeError("collector error")
+
+    source["hits"] = 5
+    assert "test_hits_total 5" in registry.render().splitlines()
+    source["hits"] = 7
+    assert "test_hits_total 7" in registry.render().splitlines()
+
+    # 같은 collector는 한 번만 등록
+    registry.collector(collect)
+    assert len(registry.collectors) == 2
+
+# 라우트(경로 템플릿)별 요청 처리 시간 기록 및 /metrics 노출 테스트
+def test_metrics_endpoint():
+    before = HTTP_REQUEST_SECONDS.get(method="GET", route="/.well-known/jwks.json", status="200")[0]
+    client.get("/.well-known/jwks.json")
+    client.get("/not-found")
+
+    assert HTTP_REQUEST_SECONDS.get(method="GET", route="/.well-known/jwks.json", status="200")[0] == before + 1
+    assert HTTP_REQUEST_SECONDS.get(method="GET", route="unmatched", status="404")[0] >= 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert 'http_request_duration_seconds_count{method="GET",route="/.well-known/jwks.json",status="200"}' in response.text
+    assert "db_pool_checkout_wait_seconds" in response.text
+
+# router prefix / path parameter가 있는 route는 경로 템플릿으로 기록
+def test_route_template_with_prefix(monkeypatch):
+    monkeypatch.setattr("auth_service.routers.auth_router.refresh_token", lambda token: {"jwt_token": "a", "refresh_token": "b"})
+    before = HTTP_REQUEST_SECONDS.get(method="POST", route="/auth/token/refresh", status="200")[0]
+    client.post("/auth/token/refresh", json={"refresh_token": "token"})
+    assert HTTP_REQUEST_SECONDS.get(method="POST", route="/auth/token/refresh", status="200")[0] == before + 1
+
+    client.post("/auth/login/unknown")
+    assert HTTP_REQUEST_SECONDS.get(method="POST", route="/auth/login/{provider}", status="200")[0] >= 1
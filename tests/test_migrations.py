@@ -0,0 +1,109 @@
+import pytest
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from pathlib import Path
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from auth_service.handlers.social_handler import build_user_lookup
+from auth_service.models.auth_model import Base
+
+ALEMBIC_INI = Path(__file__).resolve().parents[1] / "alembic.ini"
+
+## 테스트 DB를 대상으로 하는 Alembic 설정
+def make_alembic_config(url):
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    return config
+
+@pytest.fixture
+def migrated_engine(tmp_path):
+    url = f"sqlite:///{tmp_path / 'auth.db'}"
+    command.upgrade(make_alembic_config(url), "head")
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+
+# 마이그레이션 결과가 모델 정의와 일치하는지 테스트
+def test_migrations_match_models(migrated_engine):
+    with migrated_engine.connect() as conn:
+        diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+
+    assert diff == []
+
+# (social_provider, social_id) 복합 고유 인덱스만 남고 단일 컬럼 인덱스는 제거되었는지 테스트
+def test_users_social_key_index(migrated_engine):
+    indexes = {index["name"]: index for index in inspect(migrated_engine).get_indexes("users")}
+
+    assert indexes["ux_users_social_provider_social_id"]["column_names"] == ["social_provider", "social_id"]
+    assert indexes["ux_users_social_provider_social_id"]["unique"]
+    assert "ix_users_social_id" not in indexes
+    assert "ix_users_social_provider" not in indexes
+
+# 소셜 계정은 provider별로 구분하지만 이메일은 전체에서 고유 (다른 provider의 같은 이메일은 거부)
+def test_users_email_unique_across_providers(migrated_engine):
+    indexes = {index["name"]: index for index in inspect(migrated_engine).get_indexes("users")}
+    assert indexes["ix_users_email"]["unique"]
+
+    insert = text("INSERT INTO users (email, social_provider, social_id) VALUES (:email, :provider, :social_id)")
+    with migrated_engine.begin() as conn:
+        conn.execute(insert, {"email": "a@example.com", "provider": "google", "social_id": "1"})
+        conn.execute(insert, {"email": "b@example.com", "provider": "github", "social_id": "1"})
+
+    with pytest.raises(IntegrityError):
+        with migrated_engine.begin() as conn:
+            conn.execute(insert, {"email": "a@example.com", "provider": "github", "social_id": "2"})
+
+# 로그인 조회가 복합 인덱스를 사용하는지 실행 계획으로 테스트
+def test_user_lookup_uses_index(migrated_engine):
+    stmt = build_user_lookup("google", "google_1").compile(migrated_engine, compile_kwargs={"literal_binds": True})
+    with migrated_engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {stmt}")))
+
+    assert "USING INDEX ux_users_social_provider_social_id" in plan
+
+# 다운그레이드 후 다시 업그레이드 가능한지 테스트
+def test_migrations_downgrade(tmp_path):
+    config = make_alembic_config(f"sqlite:///{tmp_path / 'auth.db'}")
+    command.upgrade(config, "head")
+    command.downgrade(config, "base")
+    command.upgrade(config, "head")
+
+# Postgres에서는 인덱스를 트랜잭션 밖에서 CONCURRENTLY로 생성/삭제하는지 SQL 생성 모드로 테스트
+def test_postgresql_indexes_created_concurrently(capsys):
+    command.upgrade(make_alembic_config("postgresql://auth@localhost/auth"), "0001:0002", sql=True)
+    sql = capsys.readouterr().out
+
+    create = sql.index("CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_users_social_provider_social_id")
+    assert sql.rindex("COMMIT", 0, create) > sql.rindex("BEGIN", 0, create)
+    assert "DROP INDEX CONCURRENTLY IF EXISTS ix_users_social_id" in sql
+
+# 기존 스키마(0001, create_all로 만들던 users만 있음)에서 업그레이드하면 token_revocations 생성
+def test_upgrade_existing_schema_creates_token_revocations(tmp_path):
+    url = f"sqlite:///{tmp_path / 'auth.db'}"
+    config = make_alembic_config(url)
+    engine = create_engine(url)
+
+    command.upgrade(config, "0001")
+    assert inspect(engine).get_table_names() == ["alembic_version", "users"]
+
+    command.upgrade(config, "head")
+    assert "token_revocations" in inspect(engine).get_table_names()
+    engine.dispose()
+
+# 0001에서 token_revocations까지 생성하던 이전 버전으로 만든 DB도 업그레이드 가능
+def test_upgrade_with_existing_token_revocations(tmp_path):
+    url = f"sqlite:///{tmp_path / 'auth.db'}"
+    config = make_alembic_config(url)
+    command.upgrade(config, "0002")
+    engine = create_engine(url)
+    Base.metadata.tables["token_revocations"].create(engine)
+
+    command.upgrade(config, "head")
+
+    assert "token_revocations" in inspect(engine).get_table_names()
+    engine.dispose()
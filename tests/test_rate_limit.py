@@ -0,0 +1,111 @@
+import base64
+import json
+import pytest
+
+from fastapi.testclient import TestClient
+
+from auth_service.core import rate_limit
+from auth_service.core.rate_limit import RATE_LIMIT_REJECTIONS, MemoryRateLimiter, RateLimit, RedisRateLimiter, create_rate_limiter
+from auth_service.main import auth_app as app
+
+client = TestClient(app)
+
+## 라우터 테스트용 요청 제한 저장소 (테스트마다 새로 생성)
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = MemoryRateLimiter(max_keys=100)
+    monkeypatch.setattr(rate_limit, "rate_limiter", limiter)
+    return limiter
+
+# burst만큼 허용 후 거부하고, 시간이 지나면 회복된 만큼 다시 허용
+@pytest.mark.asyncio
+async def test_memory_rate_limiter_token_bucket(clock):
+    limiter = MemoryRateLimiter(max_keys=100, clock=clock)
+    limit = RateLimit("login_ip", burst=3, rate=1.0)
+
+    assert [await limiter.take("1.2.3.4", limit) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert await limiter.take("1.2.3.4", limit) == pytest.approx(1.0)
+    # 다른 키는 별도 bucket
+    assert await limiter.take("5.6.7.8", limit) == 0.0
+
+    clock.now += 0.5
+    assert await limiter.take("1.2.3.4", limit) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert await limiter.take("1.2.3.4", limit) == 0.0
+
+# 다 회복된 bucket은 조회 시 삭제되고, 키 수는 max_keys로 제한
+@pytest.mark.asyncio
+async def test_memory_rate_limiter_expiry(clock):
+    limiter = MemoryRateLimiter(max_keys=2, clock=clock)
+    limit = RateLimit("login_ip", burst=2, rate=1.0)
+
+    await limiter.take("a", limit)
+    clock.now += 1
+    assert limiter.buckets.get(("login_ip", "a")) is None
+    assert len(limiter.buckets) == 0
+
+    for key in ("a", "b", "c"):
+        await limiter.take(key, limit)
+    assert len(limiter.buckets) == 2
+
+# Redis 저장소는 키 / 규칙 / 현재 시각을 스크립트에 전달
+@pytest.mark.asyncio
+async def test_redis_rate_limiter(fake_redis):
+    fake_redis.eval_result = b"2.5"
+    limiter = RedisRateLimiter(fake_redis, clock=lambda: 1000.0)
+
+    assert await limiter.take("1.2.3.4", RateLimit("refresh_ip", burst=10, rate=2.0)) == 2.5
+    assert fake_redis.calls == [(1, ("auth:ratelimit:refresh_ip:1.2.3.4", 10, 2.0, 1000.0))]
+
+# 설정에 따른 저장소 생성
+def test_create_rate_limiter():
+    config = {"backend": "memory", "max_keys": 10, "redis_url": "redis://localhost:6379/0", "rules": {}}
+
+    assert isinstance(create_rate_limiter(config), MemoryRateLimiter)
+    assert create_rate_limiter({**config, "backend": "none"}) is None
+    with pytest.raises(ValueError):
+        create_rate_limiter({**config, "backend": "unknown"})
+
+# 로그인 요청 제한 초과 시 provider 호출 없이 429 + Retry-After
+def test_login_rate_limited(monkeypatch, limiter):
+    monkeypatch.setitem(rate_limit.RATE_LIMITS, "login_ip", RateLimit("login_ip", burst=2, rate=0.1))
+    calls = []
+
+    async def fake_handle_social_login(provider, request, db):
+        calls.append(provider.name)
+        raise Exception("login failed")
+
+    monkeypatch.setattr("auth_service.routers.auth_router.handle_social_login", fake_handle_social_login)
+    rejected = RATE_LIMIT_REJECTIONS.get(rule="login_ip")
+
+    assert [client.post("/auth/login/google").status_code for _ in range(2)] == [400, 400]
+    response = client.post("/auth/login/google")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "10"
+    assert len(calls) == 2
+    assert RATE_LIMIT_REJECTIONS.get(rule="login_ip") == rejected + 1
+
+## 요청 제한 키 추출용 토큰 (서명 생략)
+def make_token(claims):
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    return f"{encode({'alg': 'HS256'})}.{encode(claims)}.signature"
+
+# 토큰 갱신은 로그인 세션(refresh token family)별로 제한
+def test_refresh_rate_limited_per_family(monkeypatch, limiter):
+    monkeypatch.setitem(rate_limit.RATE_LIMITS, "refresh_subject", RateLimit("refresh_subject", burst=1, rate=0.1))
+    monkeypatch.setattr(
+        "auth_service.routers.auth_router.refresh_token",
+        lambda token: {"jwt_token": "new_fake_token", "refresh_token": token}
+    )
+
+    first = make_token({"sub": "user@example.com", "fid": "family1"})
+    second = make_token({"sub": "user@example.com", "fid": "family2"})
+
+    assert client.post("/auth/token/refresh", json={"refresh_token": first}).status_code == 200
+    assert client.post("/auth/token/refresh", json={"refresh_token": first}).status_code == 429
+    # 같은 사용자의 다른 로그인 세션은 제한되지 않음
+    assert client.post("/auth/token/refresh", json={"refresh_token": second}).status_code == 200
+    # family를 알 수 없는 토큰은 IP별로만 제한
+    assert client.post("/auth/token/refresh", json={"refresh_token": "not_a_jwt"}).status_code == 200
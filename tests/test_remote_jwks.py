@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+from auth_service.core.remote_jwks import RemoteJWKS
+
+JWKS_URL = "https://issuer.example.com/certs"
+
+## JWKS 엔드포인트 mocking - 호출마다 keys 목록의 다음 응답 반환
+def make_http_client(responses):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        kids, cache_control = responses[min(len(calls), len(responses)) - 1]
+        headers = {"Cache-Control": cache_control} if cache_control else {}
+        return httpx.Response(200, json={"keys": [{"kid": kid, "kty": "RSA"} for kid in kids]}, headers=headers)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), calls
+
+# Cache-Control max-age 동안 캐시, 만료 후 재조회
+@pytest.mark.asyncio
+async def test_cache_control_max_age(clock):
+    http_client, calls = make_http_client([(["a"], "public, max-age=300")])
+    jwks = RemoteJWKS(JWKS_URL, clock=clock)
+
+    assert (await jwks.get("a", http_client))["kid"] == "a"
+    clock.now += 299
+    await jwks.get("a", http_client)
+    assert len(calls) == 1
+
+    clock.now += 1
+    await jwks.get("a", http_client)
+    assert len(calls) == 2
+
+# 모르는 kid(키 교체)는 재조회하되 min_refresh_interval 간격으로 제한
+@pytest.mark.asyncio
+async def test_unknown_kid_refresh(clock):
+    http_client, calls = make_http_client([(["a"], "max-age=3600"), (["a", "b"], "max-age=3600")])
+    jwks = RemoteJWKS(JWKS_URL, min_refresh_interval=60, clock=clock)
+
+    await jwks.get("a", http_client)
+    clock.now += 10
+    assert await jwks.get("b", http_client) is None
+    assert len(calls) == 1
+
+    clock.now += 60
+    assert (await jwks.get("b", http_client))["kid"] == "b"
+    assert await jwks.get("unknown", http_client) is None
+    assert len(calls) == 2
+
+    assert RemoteJWKS.max_age("public, max-age=19856, must-revalidate") == 19856
+    assert RemoteJWKS.max_age("no-cache") is None
+
+# 재조회 실패 시 만료된 키 사용 / 한 번도 조회하지 못했으면 오류
+@pytest.mark.asyncio
+async def test_refresh_failure(clock):
+    status_codes = [200, 503]
+
+    def handler(request):
+        return httpx.Response(status_codes.pop(0) if status_codes else 503, json={"keys": [{"kid": "a"}]},
+                              headers={"Cache-Control": "max-age=100"})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    jwks = RemoteJWKS(JWKS_URL, clock=clock)
+    await jwks.get("a", http_client)
+
+    clock.now += 200
+    assert (await jwks.get("a", http_client))["kid"] == "a"
+
+    with pytest.raises(httpx.HTTPError):
+        await RemoteJWKS(JWKS_URL, clock=clock).get("a", http_client)
+
+# 파일에서 적재한 JWKS는 네트워크 조회 없이 사용
+@pytest.mark.asyncio
+async def test_load_file(tmp_path):
+    path = tmp_path / "jwks.json"
+    path.write_text('{"keys": [{"kid": "file-kid", "kty": "RSA"}]}')
+    http_client, calls = make_http_client([(["a"], None)])
+
+    jwks = RemoteJWKS(JWKS_URL, path=str(path))
+    assert (await jwks.get("file-kid", http_client))["kid"] == "file-kid"
+    assert await jwks.get("a", http_client) is None
+    assert calls == []
@@ -0,0 +1,63 @@
+import pytest
+
+from auth_service import server
+from auth_service.core.config import SERVER_CONFIG
+from auth_service.handlers import token_handler
+
+# 컨테이너 CPU limit(cgroup v2 cpu.max) 확인
+def test_cgroup_cpu_limit(tmp_path):
+    cpu_max = tmp_path / "cpu.max"
+
+    cpu_max.write_text("150000 100000\n")
+    assert server._cgroup_cpu_limit(str(cpu_max)) == 1.5
+
+    cpu_max.write_text("max 100000\n")
+    assert server._cgroup_cpu_limit(str(cpu_max)) is None
+    assert server._cgroup_cpu_limit(str(tmp_path / "missing")) is None
+
+# 워커 수 - 설정값이 0이면 사용 가능한 CPU 수 (CPU limit 올림)
+def test_worker_count(monkeypatch):
+    monkeypatch.setattr(server.os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+    monkeypatch.setattr(server, "_cgroup_cpu_limit", lambda: 2.5)
+
+    assert server.available_cpus() == 3
+    assert server.worker_count({**SERVER_CONFIG, "workers": 0}) == 3
+    assert server.worker_count({**SERVER_CONFIG, "workers": 5}) == 5
+
+# uvloop / httptools가 없으면 asyncio / h11 사용, 설정값 전달
+def test_server_options(monkeypatch):
+    monkeypatch.setattr(server, "_installed", lambda module: False)
+    config = {**SERVER_CONFIG, "workers": 4, "port": 9000, "limit_concurrency": 0, "backlog": 128,
+              "forwarded_allow_ips": "10.0.0.1"}
+
+    assert server.uvicorn_options(config) == {
+        "loop": "asyncio", "http": "h11", "limit_concurrency": None, "access_log": config["access_log"],
+        "forwarded_allow_ips": "10.0.0.1",
+    }
+    options = server.gunicorn_options(config)
+    assert options["bind"].endswith(":9000")
+    assert (options["workers"], options["backlog"], options["preload_app"]) == (4, 128, True)
+    assert options["forwarded_allow_ips"] == "10.0.0.1"
+
+# 여러 워커에서 memory 토큰 저장소를 사용하면 실행 거부
+def test_memory_token_store_requires_single_worker():
+    with pytest.raises(SystemExit):
+        server.check_token_store({**SERVER_CONFIG, "workers": 2}, {"backend": "memory"})
+
+    server.check_token_store({**SERVER_CONFIG, "workers": 1}, {"backend": "memory"})
+    server.check_token_store({**SERVER_CONFIG, "workers": 2}, {"backend": "database"})
+
+# fork된 워커는 미리 적재한 키 링 대신 키 링을 다시 적재 (SIGHUP 키 교체 반영)
+def test_post_fork_reloads_key_registry(monkeypatch):
+    reloaded = []
+    monkeypatch.setattr(token_handler, "reload_key_registry", lambda: reloaded.append(True) or token_handler.key_registry)
+
+    server._post_fork(None, None)
+    assert reloaded == [True]
+
+    # 재적재에 실패해도 워커는 기존 키 링으로 시작
+    def fail_reload():
+        raise ValueError("invalid keyring")
+
+    monkeypatch.setattr(token_handler, "reload_key_registry", fail_reload)
+    server._post_fork(None, None)
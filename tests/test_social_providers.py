@@ -0,0 +1,210 @@
+import asyncio
+import httpx
+import pytest
+
+from types import SimpleNamespace
+
+from auth_service.handlers.github_social_handler import GitHubProvider
+from auth_service.handlers.google_social_handler import GoogleProvider
+from auth_service.handlers.kakao_social_handler import KakaoProvider
+from auth_service.handlers.naver_social_handler import NaverProvider
+from auth_service.handlers.oidc_social_handler import GenericOIDCProvider
+from auth_service.handlers.social_handler import SocialProfile
+from auth_service.handlers.social_providers import (
+    SOCIAL_PROVIDERS,
+    create_oauth,
+    get_social_provider,
+    load_oauth_snapshot,
+    prefetch_oauth_metadata,
+    save_oauth_snapshot
+)
+
+TOKEN = {"access_token": "provider_access_token"}
+
+## provider API mocking (경로 -> JSON 응답)
+def make_client(provider_class, responses, **config):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=responses[request.url.path])
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    provider = provider_class({
+        "client_id": "dummy_client_id",
+        "client_secret": "dummy_client_secret",
+        "redirect_uri": "https://example.com/callback",
+        "token_url": "https://provider.example.com/token",
+        "userinfo_url": "https://provider.example.com/userinfo",
+        **config
+    })
+    return provider, provider.create_client(http_client), requests
+
+# 등록소 조회 / provider별 OAuth 클라이언트 생성
+@pytest.mark.asyncio
+async def test_social_provider_registry():
+    assert set(SOCIAL_PROVIDERS) == {"google", "kakao", "naver", "github", "oidc"}
+    assert get_social_provider("kakao").name == "kakao"
+    assert get_social_provider("unknown") is None
+
+    async with httpx.AsyncClient() as http_client:
+        oauth = create_oauth(http_client)
+        for name in SOCIAL_PROVIDERS:
+            assert getattr(oauth, name).http_client is http_client
+
+# Kakao 사용자 정보
+@pytest.mark.asyncio
+async def test_kakao_profile():
+    provider, client, requests = make_client(KakaoProvider, {"/userinfo": {
+        "id": 1234,
+        "kakao_account": {
+            "email": "kakao@example.com", "is_email_verified": True, "is_email_valid": True,
+            "profile": {"nickname": "kakao_name"}
+        },
+    }})
+
+    profile = await provider.fetch_profile(client, TOKEN)
+
+    assert profile == SocialProfile(social_id="1234", email="kakao@example.com", name="kakao_name")
+    assert requests[0].headers["Authorization"] == "Bearer provider_access_token"
+
+# Naver 사용자 정보 - 이름이 없으면 닉네임 사용
+@pytest.mark.asyncio
+async def test_naver_profile():
+    provider, client, _ = make_client(NaverProvider, {"/userinfo": {
+        "resultcode": "00",
+        "response": {"id": "naver_id", "email": "naver@example.com", "nickname": "naver_nickname"},
+    }})
+
+    profile = await provider.fetch_profile(client, TOKEN)
+
+    assert profile == SocialProfile(social_id="naver_id", email="naver@example.com", name="naver_nickname")
+
+# GitHub 사용자 정보 - 공개 이메일이 없으면 인증된 대표 이메일 조회
+@pytest.mark.asyncio
+async def test_github_profile_primary_email():
+    provider, client, requests = make_client(GitHubProvider, {
+        "/userinfo": {"id": 42, "login": "octocat", "name": None, "email": None},
+        "/emails": [
+            {"email": "old@example.com", "primary": False, "verified": True},
+            {"email": "octocat@example.com", "primary": True, "verified": True},
+        ],
+    }, emails_url="https://provider.example.com/emails")
+
+    profile = await provider.fetch_profile(client, TOKEN)
+
+    assert profile == SocialProfile(social_id="42", email="octocat@example.com", name="octocat")
+    assert [request.url.path for request in requests] == ["/userinfo", "/emails"]
+
+# 범용 OIDC - discovery 문서의 엔드포인트를 한 번만 조회하여 사용
+@pytest.mark.asyncio
+async def test_oidc_discovery():
+    provider, client, requests = make_client(GenericOIDCProvider, {
+        "/.well-known/openid-configuration": {
+            "issuer": "https://idp.example.com",
+            "token_endpoint": "https://idp.example.com/token",
+            "userinfo_endpoint": "https://idp.example.com/me",
+            "jwks_uri": "https://idp.example.com/certs",
+        },
+        "/me": {"sub": "oidc_sub", "email": "oidc@example.com", "email_verified": True, "name": "oidc_name"},
+    }, issuer="https://idp.example.com", token_url=None, userinfo_url=None)
+
+    assert await client.endpoint("token") == "https://idp.example.com/token"
+    profile = await provider.fetch_profile(client, TOKEN)
+
+    assert profile == SocialProfile(social_id="oidc_sub", email="oidc@example.com", name="oidc_name")
+    assert [request.url.path for request in requests] == ["/.well-known/openid-configuration", "/me"]
+    assert await client.issuers() == ("https://idp.example.com",)
+
+# 확인되지 않은 이메일은 사용하지 않음 (email_verified / Google userinfo v2의 verified_email)
+@pytest.mark.parametrize("verified", [False, "false", None])
+def test_unverified_email_ignored(verified):
+    oidc = GenericOIDCProvider({"issuer": "https://idp.example.com"})
+    google = GoogleProvider({})
+
+    assert oidc.profile_from_userinfo({"sub": "oidc_sub", "email": "victim@example.com", "email_verified": verified}).email is None
+    assert google.profile_from_userinfo({"id": "google_id", "email": "victim@example.com", "verified_email": verified}).email is None
+    assert oidc.profile_from_userinfo({"sub": "oidc_sub", "email": "user@example.com", "email_verified": "true"}).email == "user@example.com"
+
+# Kakao - 인증되지 않았거나 유효하지 않은 이메일은 사용하지 않음
+@pytest.mark.parametrize("account", [
+    {"is_email_verified": False, "is_email_valid": True},
+    {"is_email_verified": True, "is_email_valid": False},
+    {"is_email_verified": "true", "is_email_valid": True},
+    {},
+])
+def test_kakao_unverified_email_ignored(account):
+    kakao = KakaoProvider({})
+    data = {"id": 1234, "kakao_account": {"email": "victim@example.com", **account}}
+
+    assert kakao.profile_from_userinfo(data).email is None
+
+# Naver - 확인 여부 필드가 없으며, 네이버가 확인한 이메일만 반환하므로 그대로 사용
+def test_naver_email_trusted():
+    naver = NaverProvider({})
+    assert naver.profile_from_userinfo({"response": {"id": "naver_id", "email": "naver@example.com"}}).email == "naver@example.com"
+
+# GitHub - 공개 이메일(인증된 이메일만 선택 가능)이 있으면 이메일 목록 API 조회 생략,
+## 없으면 인증된 대표 이메일만 사용
+@pytest.mark.asyncio
+async def test_github_unverified_email_ignored():
+    provider, client, requests = make_client(GitHubProvider, {
+        "/userinfo": {"id": 42, "login": "octocat", "name": None, "email": "public@example.com"},
+    }, emails_url="https://provider.example.com/emails")
+    assert (await provider.fetch_profile(client, TOKEN)).email == "public@example.com"
+    assert [request.url.path for request in requests] == ["/userinfo"]
+
+    provider, client, _ = make_client(GitHubProvider, {
+        "/userinfo": {"id": 42, "login": "octocat", "name": None, "email": None},
+        "/emails": [{"email": "victim@example.com", "primary": True, "verified": False}],
+    }, emails_url="https://provider.example.com/emails")
+    assert (await provider.fetch_profile(client, TOKEN)).email is None
+
+## 범용 OIDC provider의 discovery 문서 / JWKS 응답
+OIDC_RESPONSES = {
+    "/.well-known/openid-configuration": {
+        "issuer": "https://idp.example.com",
+        "token_endpoint": "https://idp.example.com/token",
+        "userinfo_endpoint": "https://idp.example.com/me",
+        "jwks_uri": "https://idp.example.com/certs",
+    },
+    "/certs": {"keys": [{"kid": "oidc-kid", "kty": "RSA"}]},
+}
+
+# 시작 시 discovery 문서 / JWKS 미리 조회 후 스냅샷 저장, 새 워커는 스냅샷으로 네트워크 조회 없이 시작
+@pytest.mark.asyncio
+async def test_prefetch_and_snapshot(tmp_path):
+    snapshot_path = str(tmp_path / "oauth_metadata.json")
+    _, client, requests = make_client(GenericOIDCProvider, OIDC_RESPONSES, issuer="https://idp.example.com", userinfo_url=None)
+    unconfigured = make_client(KakaoProvider, {}, client_id="")[1]
+    oauth = SimpleNamespace(oidc=client, kakao=unconfigured)
+
+    await prefetch_oauth_metadata(oauth, timeout=5)
+    save_oauth_snapshot(oauth, snapshot_path)
+
+    assert [request.url.path for request in requests] == ["/.well-known/openid-configuration", "/certs"]
+    assert set(client.jwks.keys) == {"oidc-kid"}
+
+    _, warm_client, warm_requests = make_client(GenericOIDCProvider, OIDC_RESPONSES, issuer="https://idp.example.com", userinfo_url=None)
+    load_oauth_snapshot(SimpleNamespace(oidc=warm_client), snapshot_path)
+
+    assert await warm_client.endpoint("userinfo") == "https://idp.example.com/me"
+    assert await warm_client.jwks.get("oidc-kid", warm_client.http_client) == {"kid": "oidc-kid", "kty": "RSA"}
+    assert warm_requests == []
+
+# provider 응답이 느리면 시작을 막지 않고 요청 시 조회 / 스냅샷 파일이 없으면 무시
+@pytest.mark.asyncio
+async def test_prefetch_timeout(tmp_path):
+    async def handler(request):
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    client = GenericOIDCProvider({"client_id": "dummy_client_id", "issuer": "https://idp.example.com"}).create_client(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    oauth = SimpleNamespace(oidc=client)
+
+    load_oauth_snapshot(oauth, str(tmp_path / "missing.json"))
+    await prefetch_oauth_metadata(oauth, timeout=0.05)
+
+    assert client.metadata is None
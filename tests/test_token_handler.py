@@ -7,12 +7,19 @@ from jose import jwt
 from datetime import datetime, timedelta
 
 from auth_service.main import auth_app as app
+from auth_service.core.config import JWT_CONFIG
+from auth_service.core.keys import KeyRegistry
+from auth_service.core.token_store import MemoryTokenStore, RevocationFilter
 from auth_service.handlers.token_handler import (
     create_access_token,
     create_refresh_token,
     refresh_token,
+    revoke_access_token,
+    revoke_refresh_token,
     verify_token,
-    verify_refresh_token
+    verify_refresh_token,
+    get_token_cache_stats,
+    introspect_tokens
 )
 
 client = TestClient(app)
@@ -26,18 +33,25 @@ def setup(monkeypatch):
     monkeypatch.setenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
     monkeypatch.setenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")
     monkeypatch.setenv("ACCESS_TOKEN_TYPE", "bearer")
-    monkeypatch.setenv("REFRESH_TOKEN_TYPE", "bearer")
+    monkeypatch.setenv("REFRESH_TOKEN_TYPE", "refresh")
 
     # token_hander의 JWT_CONFIG 값 재정의
-    dummy_jwt_config = {
+    dummy_jwt_config = JWT_CONFIG.model_copy(update={
         "secret_key": os.getenv("JWT_SECRET_KEY"),
         "algorithm": os.getenv("JWT_ALGORITHM"),
         "access_token_expire_minutes": int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")),
         "refresh_token_expire_days": int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS")),
         "access_token_type": os.getenv("ACCESS_TOKEN_TYPE"),
         "refresh_token_type": os.getenv("REFRESH_TOKEN_TYPE"),
-    }
+    })
     monkeypatch.setattr("auth_service.handlers.token_handler.JWT_CONFIG", dummy_jwt_config)
+    monkeypatch.setattr("auth_service.handlers.token_handler.key_registry", KeyRegistry.from_config(dummy_jwt_config))
+    token_store = MemoryTokenStore()
+    monkeypatch.setattr("auth_service.handlers.token_handler.token_store", token_store)
+    monkeypatch.setattr(
+        "auth_service.handlers.token_handler.revocation_filter",
+        RevocationFilter(token_store, capacity=100, error_rate=0.001, max_false_positive_rate=0.01)
+    )
 
 # 테스트용 데이터 설정
 @pytest.fixture(autouse=True)
@@ -185,7 +199,7 @@ def test_verify_expired_refresh_token(dummy_user_data):
     except HTTPException as e:
         # 토큰 만료로 인한 예외 발생 검증
         assert e.status_code == status.HTTP_401_UNAUTHORIZED
-        assert e.detail == "Invaild refresh token"
+        assert e.detail == "Invalid refresh token"
 
 ## 토큰 타입 불일치로 인한 검증 실패
 def test_verify_invalid_refresh_token_type(dummy_user_data):
@@ -231,8 +245,143 @@ def test_refresh_token(dummy_user_data):
     original_token = create_refresh_token({"sub": dummy_user_data["email"]})
 
     # 토큰 갱신 테스트 코드
-    new_token = refresh_token(original_token)
+    new_tokens = refresh_token(original_token)
+
+    # 토큰 갱신 결과 검증 - 새 access token과 같은 family의 새 refresh token 발급
+    assert new_tokens["refresh_token"] != original_token
+    assert verify_token(new_tokens["jwt_token"])["sub"] == dummy_user_data["email"]
+
+    new_payload = verify_refresh_token(new_tokens["refresh_token"])
+    original_payload = verify_refresh_token(original_token)
+    assert new_payload["sub"] == dummy_user_data["email"]
+    assert new_payload["fid"] == original_payload["fid"]
+    assert new_payload["jti"] != original_payload["jti"]
+
+## 이미 사용된 refresh token 재사용 시 family 전체 폐기
+def test_refresh_token_reuse_detection(dummy_user_data):
+    original_token = create_refresh_token({"sub": dummy_user_data["email"]})
+    rotated_token = refresh_token(original_token)["refresh_token"]
+
+    # 이미 교체된 토큰 재사용
+    with pytest.raises(HTTPException) as e:
+        refresh_token(original_token)
+    assert e.value.detail == "Refresh token reuse detected"
+
+    # 같은 family의 최신 토큰도 폐기됨
+    with pytest.raises(HTTPException) as e:
+        refresh_token(rotated_token)
+    assert e.value.detail == "Revoked refresh token"
+
+## refresh token 폐기 (로그아웃)
+def test_revoke_refresh_token(dummy_user_data):
+    token = create_refresh_token({"sub": dummy_user_data["email"]})
+    revoke_refresh_token(token)
+
+    with pytest.raises(HTTPException) as e:
+        verify_refresh_token(token)
+    assert e.value.detail == "Revoked refresh token"
+
+## access token으로는 갱신할 수 없음 - 로그아웃 후에도 새 family를 만들어 로그인이 유지되지 않음
+def test_access_token_cannot_refresh(dummy_user_data):
+    user = {"sub": dummy_user_data["email"]}
+    access_token = create_access_token(user)
+    revoke_refresh_token(create_refresh_token(user))
+
+    with pytest.raises(HTTPException) as e:
+        refresh_token(access_token)
+    assert e.value.detail == "Invalid token type"
+
+    response = client.post("/auth/token/refresh", json={"refresh_token": access_token})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+## 일괄 검증은 access token만 active로 판정 - 폐기된 refresh token의 claims(fid 등)를 노출하지 않음
+def test_introspect_refresh_token(dummy_user_data):
+    user = {"sub": dummy_user_data["email"]}
+    access_token, token = create_access_token(user), create_refresh_token(user)
+    revoke_refresh_token(token)
+
+    results = introspect_tokens([access_token, token])
+    assert results[0]["active"] is True
+    assert results[1] == {"active": False, "error": "Invalid token type"}
+
+## 같은 키로 서명했더라도 설정한 발급자 / 대상이 아닌 토큰은 거부
+def test_verify_token_issuer_audience(dummy_user_data, monkeypatch):
+    from auth_service.handlers import token_handler
+    config = token_handler.JWT_CONFIG.model_copy(update={"issuer": "auth-service", "audience": "api"})
+    monkeypatch.setattr("auth_service.handlers.token_handler.JWT_CONFIG", config)
+    assert verify_token(create_access_token({"sub": dummy_user_data["email"]}))["aud"] == "api"
+
+    other_token = create_access_token({"sub": dummy_user_data["email"]})
+    monkeypatch.setattr("auth_service.handlers.token_handler.JWT_CONFIG", config.model_copy(update={"audience": "other-api"}))
+    with pytest.raises(HTTPException) as e:
+        verify_token(other_token)
+    assert e.value.detail == "Invalid authentication credentials"
+
+## family ID(fid)가 없는 refresh token은 거부
+def test_refresh_token_without_family(dummy_user_data):
+    from auth_service.handlers.token_handler import get_token_issuers
+    _, refresh_issuer = get_token_issuers()
+    token = refresh_issuer.issue({"sub": dummy_user_data["email"]})
+
+    with pytest.raises(HTTPException) as e:
+        refresh_token(token)
+    assert e.value.detail == "Invalid refresh token"
+
+# 검증된 access token 캐시 테스트
+def test_verify_token_cache(dummy_user_data, monkeypatch):
+    from auth_service.core.cache import TTLCache
+    monkeypatch.setattr("auth_service.handlers.token_handler.token_cache", TTLCache(max_size=10, ttl_seconds=60))
+
+    # 테스트 토큰 발급
+    test_token = create_access_token({"sub": dummy_user_data["email"]})
+
+    # 첫 검증은 캐시 miss, 이후 검증은 jwt.decode 없이 캐시 hit
+    assert verify_token(test_token)["sub"] == dummy_user_data["email"]
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token should not be decoded on cache hit")
+    monkeypatch.setattr("auth_service.handlers.token_handler._decode_token", fail_decode)
+
+    assert verify_token(test_token)["sub"] == dummy_user_data["email"]
+    assert get_token_cache_stats()["hits"] == 1
+    assert get_token_cache_stats()["misses"] == 1
+
+# 토큰 캐시 / 폐기 filter 통계 /metrics 노출 테스트
+def test_token_metrics(dummy_user_data, monkeypatch):
+    from auth_service.core.cache import TTLCache
+    monkeypatch.setattr("auth_service.handlers.token_handler.token_cache", TTLCache(max_size=10, ttl_seconds=60))
+    monkeypatch.setattr(
+        "auth_service.handlers.token_handler.revocation_filter",
+        RevocationFilter(MemoryTokenStore(), capacity=100, error_rate=0.01, max_false_positive_rate=0.05)
+    )
+
+    test_token = create_access_token({"sub": dummy_user_data["email"]})
+    verify_token(test_token)
+    verify_token(test_token)
+    revoke_access_token(test_token)
+    with pytest.raises(HTTPException):
+        verify_token(test_token)
+
+    lines = client.get("/metrics").text.splitlines()
+    # 폐기 시 토큰 검증(hit) 후 캐시에서 제거하므로 마지막 검증은 miss
+    assert 'auth_token_cache_requests_total{result="hit"} 2' in lines
+    assert 'auth_token_cache_requests_total{result="miss"} 2' in lines
+    assert "auth_token_cache_entries 0" in lines
+    assert 'auth_revocation_filter_positives_total{result="revoked"} 1' in lines
+    assert "auth_revocation_filter_entries 1" in lines
+
+# access token 폐기 테스트 - 캐시된 토큰도 폐기 후에는 검증 실패
+def test_revoke_access_token(dummy_user_data, monkeypatch):
+    from auth_service.core.cache import TTLCache
+    monkeypatch.setattr("auth_service.handlers.token_handler.token_cache", TTLCache(max_size=10, ttl_seconds=60))
+
+    token = create_access_token({"sub": dummy_user_data["email"]})
+    other_token = create_access_token({"sub": dummy_user_data["email"]})
+    verify_token(token)
+
+    revoke_access_token(token)
 
-    # 토큰 갱신 결과 검증
-    assert new_token != original_token
-    assert verify_refresh_token(new_token)["sub"] == dummy_user_data["email"]
+    with pytest.raises(HTTPException) as e:
+        verify_token(token)
+    assert e.value.detail == "Revoked token"
+    assert verify_token(other_token)["sub"] == dummy_user_data["email"]
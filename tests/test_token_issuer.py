@@ -0,0 +1,49 @@
+import pytest
+
+from jose import jwt
+
+from auth_service.core.jwt_backends import BACKENDS
+from auth_service.core.keys import SigningKey
+from auth_service.core.token_issuer import TokenIssuer
+
+SECRET_KEY = "dummy_secret_key_for_token_issuer"
+
+## 시간 고정용 clock
+def fixed_clock():
+    return 1700000000.5
+
+# 고정 클레임 / epoch 초 기반 iat, exp 테스트
+@pytest.mark.parametrize("backend_name", ["jose", "fast-hmac"])
+def test_issue_claims(backend_name):
+    key = SigningKey.from_secret(SECRET_KEY, "HS256", "test-kid")
+    issuer = TokenIssuer(key, BACKENDS[backend_name](), "bearer", 900,
+                         issuer="auth-service", audience="api", clock=fixed_clock)
+
+    token = issuer.issue({"sub": "test@example.com"}, fid="family")
+    payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"], audience="api",
+                         options={"verify_exp": False})
+
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT", "kid": "test-kid"}
+    assert payload["sub"] == "test@example.com"
+    assert payload["token_type"] == "bearer"
+    assert payload["iss"] == "auth-service"
+    assert payload["aud"] == "api"
+    assert payload["iat"] == 1700000000
+    assert payload["exp"] == 1700000900
+    assert payload["fid"] == "family"
+    assert len(payload["jti"]) == 32
+
+# 만료 시간 지정 / iss, aud 미설정 시 생략 테스트
+def test_issue_lifetime_override():
+    key = SigningKey.from_secret(SECRET_KEY, "HS256")
+    issuer = TokenIssuer(key, BACKENDS["fast-hmac"](), "bearer", 900, clock=fixed_clock)
+
+    payload = jwt.get_unverified_claims(issuer.issue({"sub": "test@example.com"}, 60))
+    assert payload["exp"] == 1700000060
+    assert "iss" not in payload and "aud" not in payload
+
+# 발급마다 jti가 달라 같은 입력으로도 다른 토큰 발급
+def test_issue_unique_jti():
+    key = SigningKey.from_secret(SECRET_KEY, "HS256")
+    issuer = TokenIssuer(key, BACKENDS["fast-hmac"](), "bearer", 900, clock=fixed_clock)
+    assert issuer.issue({"sub": "a"}) != issuer.issue({"sub": "a"})
@@ -0,0 +1,108 @@
+import pytest
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from auth_service.core.bloom import BloomFilter
+from auth_service.core.token_store import DatabaseTokenStore, MemoryTokenStore, RevocationFilter
+from auth_service.models.auth_model import Base
+
+## 저장소 종류별 fixture (인메모리 / SQLite DB)
+@pytest.fixture(params=["memory", "database"])
+def store_and_clock(request, tmp_path, clock):
+    if request.param == "memory":
+        yield MemoryTokenStore(clock=clock), clock
+        return
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'tokens.db'}")
+    Base.metadata.create_all(engine)
+    yield DatabaseTokenStore(sessionmaker(bind=engine), clock=clock), clock
+    engine.dispose()
+
+# refresh token 최초 사용 / 재사용 감지 테스트
+def test_mark_used(store_and_clock):
+    store, clock = store_and_clock
+
+    assert store.mark_used("jti_1", clock.now + 60) is True
+    assert store.mark_used("jti_1", clock.now + 60) is False
+    assert store.mark_used("jti_2", clock.now + 60) is True
+
+# 토큰 / family 폐기 테스트
+def test_revoke(store_and_clock):
+    store, clock = store_and_clock
+    store.revoke("jti_1", clock.now + 60)
+    store.revoke_family("family_1", clock.now + 60)
+
+    assert store.is_revoked("jti_1")
+    assert not store.is_revoked("jti_2")
+    assert store.is_family_revoked("family_1")
+    assert not store.is_family_revoked("family_2")
+
+# 만료 항목 정리 테스트
+def test_compact(store_and_clock):
+    store, clock = store_and_clock
+    store.mark_used("short", clock.now + 10)
+    store.revoke("long", clock.now + 100)
+
+    clock.now += 50
+    assert store.compact() == 1
+    assert store.is_revoked("long")
+    assert store.mark_used("short", clock.now + 10) is True
+
+# Bloom filter 테스트 - 추가한 항목은 항상 포함, 거짓 양성 비율은 설정값 근처
+def test_bloom_filter():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom.add(f"revoked_{index}")
+
+    assert all(f"revoked_{index}" in bloom for index in range(1000))
+    false_positives = sum(f"other_{index}" in bloom for index in range(10000))
+    assert false_positives / 10000 < 0.03
+    assert bloom.estimated_false_positive_rate() == pytest.approx(0.01, rel=0.5)
+
+## 저장소 조회 횟수를 세는 인메모리 저장소
+class CountingStore(MemoryTokenStore):
+    def __init__(self, clock):
+        super().__init__(clock=clock)
+        self.lookups = 0
+
+    def is_revoked(self, jti):
+        self.lookups += 1
+        return super().is_revoked(jti)
+
+# 폐기 filter 테스트 - filter 음성이면 저장소 조회 없음, 폐기된 jti만 저장소로 확인
+def test_revocation_filter_lookup(clock):
+    store = CountingStore(clock)
+    revocation_filter = RevocationFilter(store, capacity=100, error_rate=0.001, max_false_positive_rate=0.01)
+
+    revocation_filter.revoke("revoked_jti", clock.now + 60)
+
+    assert revocation_filter.is_revoked("revoked_jti")
+    assert not revocation_filter.is_revoked("active_jti")
+    assert store.lookups == 0
+
+# 다른 워커에서 폐기한 항목의 동기화 테스트
+def test_revocation_filter_sync(clock):
+    store = MemoryTokenStore(clock=clock)
+    worker_a = RevocationFilter(store, capacity=100, error_rate=0.001, max_false_positive_rate=0.01)
+    worker_b = RevocationFilter(store, capacity=100, error_rate=0.001, max_false_positive_rate=0.01)
+    worker_b.rebuild()
+
+    clock.now += 1
+    worker_a.revoke("revoked_jti", clock.now + 60)
+    assert not worker_b.is_revoked("revoked_jti")
+
+    assert worker_b.sync() == 1
+    assert worker_b.is_revoked("revoked_jti")
+
+# 예상 거짓 양성 비율이 임계값을 넘으면 filter 재생성 테스트
+def test_revocation_filter_rebuild(clock):
+    store = MemoryTokenStore(clock=clock)
+    revocation_filter = RevocationFilter(store, capacity=10, error_rate=0.01, max_false_positive_rate=0.05)
+
+    for index in range(30):
+        revocation_filter.revoke(f"revoked_{index}", clock.now + 60)
+
+    assert revocation_filter.rebuilds >= 1
+    assert revocation_filter.bloom.estimated_false_positive_rate() <= 0.05
+    assert all(revocation_filter.is_revoked(f"revoked_{index}") for index in range(30))
@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+
+from auth_service.core.user_cache import CachedUser, MemoryUserCache, RedisUserCache, SingleFlight, create_user_cache
+from auth_service.handlers import social_handler
+
+## DB 사용자 조회/생성 mocking - 호출 횟수 기록
+@pytest.fixture
+def db_lookups(monkeypatch):
+    calls = []
+
+    async def fake_get_or_create_user(db, provider, social_id, email, name):
+        calls.append((provider, social_id, email, name))
+        await asyncio.sleep(0.01)
+        return CachedUser(1, email, name)
+
+    monkeypatch.setattr(social_handler, "get_or_create_user", fake_get_or_create_user)
+    monkeypatch.setattr(social_handler, "user_cache", MemoryUserCache(max_size=100, ttl_seconds=60))
+    return calls
+
+# 캐시된 사용자는 DB를 거치지 않고, 계정 정보가 바뀌면 DB 갱신 후 캐시 갱신
+@pytest.mark.asyncio
+async def test_cached_user_lookup(db_lookups):
+    first = await social_handler.get_or_create_user_cached(None, "google", "g1", "a@example.com", "A")
+    second = await social_handler.get_or_create_user_cached(None, "google", "g1", "a@example.com", "A")
+    changed = await social_handler.get_or_create_user_cached(None, "google", "g1", "b@example.com", "B")
+
+    assert first == second == CachedUser(1, "a@example.com", "A")
+    assert changed.email == "b@example.com"
+    assert db_lookups == [("google", "g1", "a@example.com", "A"), ("google", "g1", "b@example.com", "B")]
+    assert await social_handler.user_cache.get(("google", "g1")) == changed
+
+    # 다른 경로로 사용자 정보가 바뀌면 캐시에서 제거
+    await social_handler.invalidate_user("google", "g1")
+    await social_handler.get_or_create_user_cached(None, "google", "g1", "b@example.com", "B")
+    assert len(db_lookups) == 3
+
+# 계정 정보가 바뀐 로그인의 DB 갱신이 실패해도 이전 정보는 캐시에서 제거
+@pytest.mark.asyncio
+async def test_changed_user_invalidated_on_failed_update(db_lookups, monkeypatch):
+    await social_handler.get_or_create_user_cached(None, "google", "g1", "a@example.com", "A")
+
+    async def failing_get_or_create_user(db, provider, social_id, email, name):
+        raise RuntimeError("db unavailable")
+
+    monkeypatch.setattr(social_handler, "get_or_create_user", failing_get_or_create_user)
+    with pytest.raises(RuntimeError):
+        await social_handler.get_or_create_user_cached(None, "google", "g1", "b@example.com", "B")
+
+    assert await social_handler.user_cache.get(("google", "g1")) is None
+
+    # 여러 사용자 일괄 제거 (사용자 가져오기 CLI)
+    await social_handler.user_cache.set(("google", "g2"), CachedUser(2, "c@example.com", "C"))
+    await social_handler.invalidate_users([("google", "g2"), ("google", "missing")])
+    assert await social_handler.user_cache.get(("google", "g2")) is None
+
+# 같은 사용자의 동시 로그인은 DB 쿼리 한 번으로 처리
+@pytest.mark.asyncio
+async def test_concurrent_lookups_coalesce(db_lookups):
+    users = await asyncio.gather(*(
+        social_handler.get_or_create_user_cached(None, "google", "g1", "a@example.com", "A") for _ in range(20)
+    ))
+
+    assert len(db_lookups) == 1
+    assert set(users) == {CachedUser(1, "a@example.com", "A")}
+
+# 실패한 호출의 예외는 기다리던 호출에도 전달되고, 이후 호출은 다시 실행
+@pytest.mark.asyncio
+async def test_single_flight_exception():
+    flight = SingleFlight()
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db error")
+
+    results = await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert len(calls) == 1
+
+    with pytest.raises(RuntimeError):
+        await flight.do("key", fail)
+    assert len(calls) == 2
+
+# 인메모리 캐시 TTL 만료
+@pytest.mark.asyncio
+async def test_memory_user_cache_ttl(clock):
+    cache = MemoryUserCache(max_size=10, ttl_seconds=60, clock=clock)
+    await cache.set(("kakao", "k1"), CachedUser(1, "a@example.com", "A"))
+
+    assert await cache.get(("kakao", "k1")) == CachedUser(1, "a@example.com", "A")
+    clock.now += 61
+    assert await cache.get(("kakao", "k1")) is None
+
+# Redis 캐시 직렬화 / TTL / 삭제
+@pytest.mark.asyncio
+async def test_redis_user_cache(fake_redis):
+    cache = RedisUserCache(fake_redis, ttl_seconds=300)
+    await cache.set(("github", "42"), CachedUser(7, "octocat@example.com", "octocat"))
+
+    assert fake_redis.values["auth:user:github:42"][1] == 300
+    assert await cache.get(("github", "42")) == CachedUser(7, "octocat@example.com", "octocat")
+
+    await cache.delete(("github", "42"))
+    assert await cache.get(("github", "42")) is None
+
+# 설정에 따른 캐시 생성
+def test_create_user_cache():
+    config = {"backend": "memory", "max_size": 10, "ttl_seconds": 60, "redis_url": "redis://localhost:6379/0"}
+
+    assert isinstance(create_user_cache(config), MemoryUserCache)
+    assert create_user_cache({**config, "backend": "none"}) is None
+    with pytest.raises(ValueError):
+        create_user_cache({**config, "backend": "unknown"})